@@ -5,8 +5,10 @@ from app.schemas.auth import (
     ForgotPasswordRequest,
     LoginRequest,
     RegisterRequest,
+    RegisterResponse,
     ResetPasswordRequest,
 )
+from app.schemas.common import MessageResponse
 from app.security import clear_auth_cookies, set_auth_cookies
 from app.services.auth_service import AuthService
 from app.utils.logger import get_logger
@@ -20,7 +22,11 @@ auth_service = AuthService()
 # -------------------------------------------------
 # Register
 # -------------------------------------------------
-@router.post("/register", status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/register",
+    status_code=status.HTTP_201_CREATED,
+    response_model=RegisterResponse,
+)
 async def register(payload: RegisterRequest, request: Request):
     user = await auth_service.register(
         email=payload.email,
@@ -48,7 +54,7 @@ async def register(payload: RegisterRequest, request: Request):
 # -------------------------------------------------
 # Login
 # -------------------------------------------------
-@router.post("/login")
+@router.post("/login", response_model=MessageResponse)
 async def login(payload: LoginRequest, response: Response, request: Request):
     access_token, refresh_token = await auth_service.login(
         email=payload.email,
@@ -75,7 +81,7 @@ async def login(payload: LoginRequest, response: Response, request: Request):
 # -------------------------------------------------
 # Silent refresh (cookie based)
 # -------------------------------------------------
-@router.post("/refresh")
+@router.post("/refresh", response_model=MessageResponse)
 async def refresh(response: Response, request: Request):
     access_token, refresh_token = await auth_service.refresh_tokens(request.cookies)
 
@@ -97,7 +103,7 @@ async def refresh(response: Response, request: Request):
 # -------------------------------------------------
 # Logout
 # -------------------------------------------------
-@router.post("/logout")
+@router.post("/logout", response_model=MessageResponse)
 async def logout(
     response: Response,
     request: Request,
@@ -123,7 +129,7 @@ async def logout(
 # -------------------------------------------------
 # Forgot password
 # -------------------------------------------------
-@router.post("/forgot-password")
+@router.post("/forgot-password", response_model=MessageResponse)
 async def forgot_password(payload: ForgotPasswordRequest, request: Request):
     await auth_service.request_password_reset(payload.email)
 
@@ -145,7 +151,7 @@ async def forgot_password(payload: ForgotPasswordRequest, request: Request):
 # -------------------------------------------------
 # Reset password
 # -------------------------------------------------
-@router.post("/reset-password")
+@router.post("/reset-password", response_model=MessageResponse)
 async def reset_password(payload: ResetPasswordRequest, request: Request):
     await auth_service.reset_password(
         token=payload.token,
@@ -1,14 +1,29 @@
-from typing import Optional
+from typing import List, Literal, Optional
 
-from fastapi import APIRouter, Depends, Path, Query, Request, status
+from fastapi import APIRouter, Depends, Path, Query, Request, Response, status
 
 from app.dependencies.auth import get_current_user
+from app.dependencies.conditional import ConditionalRead, conditional_read
+from app.models.recurring import RecurringSuggestionInDB, RecurringTransactionInDB
+from app.responses.json import FastJSONResponse
+from app.schemas.common import (
+    DataResponse,
+    MessageResponse,
+    PageResponse,
+    SuccessResponse,
+)
 from app.schemas.recurring import (
+    RecurringForecast,
+    RecurringGeneratedPage,
+    RecurringSuggestionAccept,
     RecurringTransactionCreate,
     RecurringTransactionFilter,
     RecurringTransactionUpdate,
+    UpcomingResponse,
 )
 from app.services.recurring_service import RecurringService
+from app.settings import settings
+from app.utils.fieldsets import parse_fields
 
 router = APIRouter(tags=["Recurring Transactions"])
 service = RecurringService()
@@ -17,7 +32,11 @@ service = RecurringService()
 # -------------------------------------------------
 # Create recurring transaction
 # -------------------------------------------------
-@router.post("/", status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/",
+    status_code=status.HTTP_201_CREATED,
+    response_model=DataResponse[RecurringTransactionInDB],
+)
 async def create_recurring(
     payload: RecurringTransactionCreate,
     request: Request,
@@ -38,7 +57,11 @@ async def create_recurring(
 # -------------------------------------------------
 # Execute recurring transaction NOW (Real-time Testing)
 # -------------------------------------------------
-@router.post("/{recurring_id}/execute-now", status_code=status.HTTP_200_OK)
+@router.post(
+    "/{recurring_id}/execute-now",
+    status_code=status.HTTP_200_OK,
+    response_model=MessageResponse,
+)
 async def execute_recurring_now(
     recurring_id: str = Path(..., description="Recurring Transaction ID (24-char hex)"),
     request: Request = None,
@@ -60,63 +83,205 @@ async def execute_recurring_now(
 # -------------------------------------------------
 # Get generated transactions from a recurring rule
 # -------------------------------------------------
-@router.get("/{recurring_id}/transactions")
+@router.get("/{recurring_id}/transactions", response_model=RecurringGeneratedPage)
 async def get_recurring_transactions(
     recurring_id: str = Path(..., description="Recurring Transaction ID (24-char hex)"),
     request: Request = None,
-    page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor of previous page"),
     current_user=Depends(get_current_user),
 ):
     """
-    Fetch all transactions generated from a specific recurring rule.
+    Fetch transactions generated from a specific recurring rule.
     Useful for tracking and verifying recurring transaction execution.
     """
     result = await service.get_generated_transactions(
         user_id=current_user.id,
         recurring_id=recurring_id,
-        page=page,
         limit=limit,
+        cursor=cursor,
         request=request,
     )
 
     return {
         "success": True,
         "recurring_id": recurring_id,
-        "page": page,
         "limit": limit,
         "total": result["total"],
         "count": len(result["items"]),
-        "pages": (result["total"] + limit - 1) // limit,
+        "next_cursor": result["next_cursor"],
         "data": result["items"],
     }
 
 
+# -------------------------------------------------
+# Cash-flow forecast (must precede /{recurring_id})
+# -------------------------------------------------
+@router.get("/forecast", response_model=DataResponse[RecurringForecast])
+async def forecast_recurring(
+    request: Request,
+    months: int = Query(3, ge=1, le=24),
+    granularity: Literal["daily", "monthly"] = Query("monthly"),
+    include_history: bool = Query(
+        True, description="Add the average of non-recurring transactions"
+    ),
+    history_months: int = Query(3, ge=1, le=12),
+    current_user=Depends(get_current_user),
+):
+    forecast = await service.forecast(
+        user_id=current_user.id,
+        months=months,
+        granularity=granularity,
+        include_history=include_history,
+        history_months=history_months,
+        request=request,
+    )
+
+    return {
+        "success": True,
+        "data": forecast,
+    }
+
+
+# -------------------------------------------------
+# Upcoming occurrences (must precede /{recurring_id})
+# -------------------------------------------------
+@router.get("/upcoming", response_model=UpcomingResponse)
+async def upcoming_recurring(
+    request: Request,
+    days: int = Query(7, ge=1, le=settings.RECURRING_UPCOMING_MAX_DAYS),
+    current_user=Depends(get_current_user),
+):
+    items = await service.upcoming(
+        user_id=current_user.id,
+        days=days,
+        request=request,
+    )
+
+    income = sum(item["amount"] for item in items if item["type"] == "income")
+    expense = sum(item["amount"] for item in items if item["type"] == "expense")
+
+    return {
+        "success": True,
+        "days": days,
+        "count": len(items),
+        "totals": {
+            "income": round(income, 2),
+            "expense": round(expense, 2),
+            "net": round(income - expense, 2),
+        },
+        "data": items,
+    }
+
+
+# -------------------------------------------------
+# Suggestions detected from history (must precede /{recurring_id})
+# -------------------------------------------------
+@router.get(
+    "/suggestions",
+    response_model=DataResponse[List[RecurringSuggestionInDB]],
+)
+async def list_recurring_suggestions(
+    request: Request,
+    limit: int = Query(50, ge=1, le=100),
+    current_user=Depends(get_current_user),
+):
+    suggestions = await service.list_suggestions(
+        user_id=current_user.id,
+        limit=limit,
+        request=request,
+    )
+
+    return {
+        "success": True,
+        "data": suggestions,
+    }
+
+
+@router.post(
+    "/suggestions/{suggestion_id}/accept",
+    status_code=status.HTTP_201_CREATED,
+    response_model=DataResponse[RecurringTransactionInDB],
+)
+async def accept_recurring_suggestion(
+    suggestion_id: str = Path(..., description="Suggestion ID (24-char hex)"),
+    payload: Optional[RecurringSuggestionAccept] = None,
+    request: Request = None,
+    current_user=Depends(get_current_user),
+):
+    recurring = await service.accept_suggestion(
+        user_id=current_user.id,
+        suggestion_id=suggestion_id,
+        overrides=payload.dict(exclude_none=True) if payload else None,
+        request=request,
+    )
+
+    return {
+        "success": True,
+        "data": recurring,
+    }
+
+
+@router.post(
+    "/suggestions/{suggestion_id}/dismiss",
+    response_model=SuccessResponse,
+)
+async def dismiss_recurring_suggestion(
+    suggestion_id: str = Path(..., description="Suggestion ID (24-char hex)"),
+    request: Request = None,
+    current_user=Depends(get_current_user),
+):
+    await service.dismiss_suggestion(
+        user_id=current_user.id,
+        suggestion_id=suggestion_id,
+        request=request,
+    )
+
+    return {"success": True}
+
+
 # -------------------------------------------------
 # Get recurring transaction by ID
 # -------------------------------------------------
-@router.get("/{recurring_id}")
+@router.get(
+    "/{recurring_id}",
+    response_model=DataResponse[RecurringTransactionInDB],
+)
 async def get_recurring(
     recurring_id: str = Path(..., description="Recurring Transaction ID (24-char hex)"),
     request: Request = None,
+    fields: Optional[str] = Query(
+        None, description='Comma-separated fieldset, e.g. "amount,category,next_run_at"'
+    ),
     current_user=Depends(get_current_user),
 ):
+    fieldset = parse_fields(fields, RecurringTransactionInDB)
+
     recurring = await service.get_by_id(
         user_id=current_user.id,
         recurring_id=recurring_id,
+        fields=fieldset,
         request=request,
     )
 
-    return {
+    payload = {
         "success": True,
         "data": recurring,
     }
 
+    if fieldset:
+        return FastJSONResponse(content=payload)
+
+    return payload
+
 
 # -------------------------------------------------
 # Update recurring transaction
 # -------------------------------------------------
-@router.put("/{recurring_id}")
+@router.put(
+    "/{recurring_id}",
+    response_model=DataResponse[RecurringTransactionInDB],
+)
 async def update_recurring(
     recurring_id: str = Path(..., description="Recurring Transaction ID (24-char hex)"),
     payload: RecurringTransactionUpdate = None,
@@ -139,7 +304,11 @@ async def update_recurring(
 # -------------------------------------------------
 # Delete (deactivate) recurring transaction
 # -------------------------------------------------
-@router.delete("/{recurring_id}", status_code=status.HTTP_200_OK)
+@router.delete(
+    "/{recurring_id}",
+    status_code=status.HTTP_200_OK,
+    response_model=SuccessResponse,
+)
 async def delete_recurring(
     recurring_id: str = Path(..., description="Recurring Transaction ID (24-char hex)"),
     request: Request = None,
@@ -157,17 +326,28 @@ async def delete_recurring(
 # -------------------------------------------------
 # List recurring transactions with pagination and filters
 # -------------------------------------------------
-@router.get("/")
+@router.get("/", response_model=PageResponse[RecurringTransactionInDB])
 async def list_recurring(
     request: Request,
+    response: Response,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     frequency: Optional[str] = Query(None, pattern="^(daily|weekly|monthly|yearly)$"),
     category: Optional[str] = None,
     type: Optional[str] = Query(None, pattern="^(income|expense)$"),
     active_only: bool = Query(True),
+    fields: Optional[str] = Query(
+        None, description='Comma-separated fieldset, e.g. "amount,category,next_run_at"'
+    ),
     current_user=Depends(get_current_user),
+    conditional: ConditionalRead = Depends(conditional_read("recurring")),
 ):
+    if conditional.not_modified:
+        return conditional.not_modified_response()
+
+    conditional.apply(response)
+    fieldset = parse_fields(fields, RecurringTransactionInDB)
+
     filters = RecurringTransactionFilter(
         frequency=frequency,
         category=category,
@@ -180,10 +360,11 @@ async def list_recurring(
         filters=filters,
         page=page,
         limit=limit,
+        fields=fieldset,
         request=request,
     )
 
-    return {
+    payload = {
         "success": True,
         "page": page,
         "limit": limit,
@@ -192,3 +373,9 @@ async def list_recurring(
         "pages": (result["total"] + limit - 1) // limit,
         "data": result["items"],
     }
+
+    # Trimmed documents skip the response model entirely
+    if fieldset:
+        return FastJSONResponse(content=payload, headers=conditional.headers())
+
+    return payload
@@ -1,26 +1,177 @@
-from fastapi import APIRouter, BackgroundTasks, Depends
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, Path, Query, Request, status
+from fastapi.responses import StreamingResponse
 
 from app.dependencies.auth import get_current_user
-from app.tasks.report_tasks import ReportTasks
+from app.domain.reports import report_filename
+from app.responses.file import file_download_response
+from app.schemas.common import DataResponse
+from app.schemas.report import ReportJobResponse
+from app.services.report_job_service import ReportJobService
 
 router = APIRouter()
-tasks = ReportTasks()
+service = ReportJobService()
+
+Engine = Optional[Literal["auto", "chromium", "native"]]
 
 
-@router.post("/monthly")
+# -------------------------------------------------
+# Queue monthly statement
+# -------------------------------------------------
+@router.post(
+    "/monthly",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=DataResponse[ReportJobResponse],
+)
 async def generate_monthly_report(
     month: str,
-    background_tasks: BackgroundTasks,
+    request: Request,
+    engine: Engine = Query(
+        None,
+        description=(
+            "PDF renderer; defaults to the server setting. native shows "
+            "cp1252 text only; auto falls back to chromium for other text"
+        ),
+    ),
     current_user=Depends(get_current_user),
 ):
-    background_tasks.add_task(
-        tasks.generate_monthly_report,
+    """
+    Queue a statement for the report worker. Poll GET /jobs/{id} until
+    the status is "succeeded", then fetch /{id}/download.
+    """
+    job = await service.enqueue_monthly(
         user_id=current_user.id,
         month=month,
-        output_dir="/tmp/reports",
+        engine=engine,
+        request=request,
+    )
+
+    return {
+        "success": True,
+        "data": ReportJobResponse.from_job(job),
+    }
+
+
+# -------------------------------------------------
+# Queue annual / custom-range statement
+# -------------------------------------------------
+@router.post(
+    "/annual",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=DataResponse[ReportJobResponse],
+)
+async def generate_annual_report(
+    request: Request,
+    year: str = Query(..., description="YYYY"),
+    engine: Engine = Query(None),
+    current_user=Depends(get_current_user),
+):
+    """
+    Queue a yearly statement with per-month and per-category breakdowns.
+    """
+    job = await service.enqueue(
+        user_id=current_user.id,
+        kind="annual",
+        params={"year": year},
+        engine=engine,
+        request=request,
+    )
+
+    return {
+        "success": True,
+        "data": ReportJobResponse.from_job(job),
+    }
+
+
+@router.post(
+    "/range",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=DataResponse[ReportJobResponse],
+)
+async def generate_range_report(
+    request: Request,
+    start: str = Query(..., description="First day, YYYY-MM-DD"),
+    end: str = Query(..., description="Last day (inclusive), YYYY-MM-DD"),
+    engine: Engine = Query(None),
+    current_user=Depends(get_current_user),
+):
+    """
+    Queue a statement for a custom date range, with breakdowns.
+    """
+    job = await service.enqueue(
+        user_id=current_user.id,
+        kind="range",
+        params={"start": start, "end": end},
+        engine=engine,
+        request=request,
     )
 
     return {
         "success": True,
-        "message": "Report generation started",
+        "data": ReportJobResponse.from_job(job),
     }
+
+
+# -------------------------------------------------
+# Jobs
+# -------------------------------------------------
+@router.get("/jobs", response_model=DataResponse[List[ReportJobResponse]])
+async def list_report_jobs(
+    limit: int = Query(20, ge=1, le=100),
+    current_user=Depends(get_current_user),
+):
+    jobs = await service.list_jobs(user_id=current_user.id, limit=limit)
+
+    return {
+        "success": True,
+        "data": [ReportJobResponse.from_job(job) for job in jobs],
+    }
+
+
+@router.get("/jobs/{job_id}", response_model=DataResponse[ReportJobResponse])
+async def get_report_job(
+    job_id: str = Path(...),
+    current_user=Depends(get_current_user),
+):
+    job = await service.get_job(user_id=current_user.id, job_id=job_id)
+
+    return {
+        "success": True,
+        "data": ReportJobResponse.from_job(job),
+    }
+
+
+# -------------------------------------------------
+# Download (resumable)
+# -------------------------------------------------
+@router.get(
+    "/{report_id}/download",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"application/pdf": {}}},
+        206: {"description": "Partial content (Range)"},
+        304: {"description": "Not modified (If-None-Match)"},
+        416: {"description": "Range not satisfiable"},
+    },
+)
+async def download_report(
+    request: Request,
+    report_id: str = Path(..., description="Report job id"),
+    current_user=Depends(get_current_user),
+):
+    """
+    Download a finished report. Supports Range / If-Range for resuming
+    and If-None-Match for revalidation; the ETag is the PDF's content hash.
+    """
+    # Scoped to the caller: another user's report is a 404
+    job, path = await service.get_result(user_id=current_user.id, job_id=report_id)
+    digest = job.result["digest"]
+
+    return file_download_response(
+        request,
+        path,
+        etag=f'"{digest}"',
+        filename=report_filename(job.kind, job.params),
+        media_type="application/pdf",
+    )
@@ -1,16 +1,24 @@
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Path, Query, Request, status
+from fastapi import APIRouter, Depends, Path, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from app.dependencies.auth import get_current_user
+from app.dependencies.conditional import ConditionalRead, conditional_read
+from app.models.transaction import TransactionInDB
+from app.responses.json import FastJSONResponse, dumps
+from app.schemas.common import DataResponse, PageResponse, SuccessResponse
 from app.schemas.transaction import (
+    BulkConfirmResponse,
     BulkTransactionConfirm,
     TransactionCreate,
     TransactionFilter,
+    TransactionSummary,
     TransactionUpdate,
 )
 from app.services.transaction_service import TransactionService
+from app.utils.fieldsets import parse_fields
 
 router = APIRouter(tags=["Transactions"])
 service = TransactionService()
@@ -19,7 +27,11 @@ service = TransactionService()
 # -------------------------------------------------
 # Create single transaction
 # -------------------------------------------------
-@router.post("/", status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/",
+    status_code=status.HTTP_201_CREATED,
+    response_model=DataResponse[TransactionInDB],
+)
 async def create_transaction(
     payload: TransactionCreate,
     request: Request,
@@ -40,17 +52,22 @@ async def create_transaction(
 # -------------------------------------------------
 # Bulk confirm transactions
 # -------------------------------------------------
-@router.post("/bulk/confirm", status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/bulk/confirm",
+    status_code=status.HTTP_201_CREATED,
+    response_model=BulkConfirmResponse,
+)
 async def confirm_bulk_import(
     payload: BulkTransactionConfirm,
     request: Request,
     current_user=Depends(get_current_user),
 ):
-    created = await service.confirm_bulk_import(
+    created, duplicates = await service.confirm_bulk_import(
         user_id=current_user.id,
         transactions=[t.dict() for t in payload.transactions],
         import_id=payload.import_id,
         source="bulk_confirmed",
+        skip_duplicates=payload.skip_duplicates,
         request=request,
     )
 
@@ -58,19 +75,28 @@ async def confirm_bulk_import(
         "success": True,
         "count": len(created),
         "import_id": payload.import_id,
+        "duplicates": len(duplicates),
+        "duplicate_indexes": duplicates,
     }
 
 
 # -------------------------------------------------
 # Transaction summary (must be before {transaction_id})
 # -------------------------------------------------
-@router.get("/summary")
+@router.get("/summary", response_model=DataResponse[TransactionSummary])
 async def transaction_summary(
     from_date: datetime,
     to_date: datetime,
     request: Request,
+    response: Response,
     current_user=Depends(get_current_user),
+    conditional: ConditionalRead = Depends(conditional_read("transactions")),
 ):
+    if conditional.not_modified:
+        return conditional.not_modified_response()
+
+    conditional.apply(response)
+
     summary = await service.summary(
         user_id=current_user.id,
         from_date=from_date,
@@ -84,12 +110,47 @@ async def transaction_summary(
     }
 
 
+# -------------------------------------------------
+# Stream a date range as NDJSON (must be before {transaction_id})
+# -------------------------------------------------
+@router.get("/export", response_class=StreamingResponse)
+async def export_transactions(
+    from_date: datetime,
+    to_date: datetime,
+    request: Request,
+    current_user=Depends(get_current_user),
+):
+    """
+    Stream every transaction in [from_date, to_date) as newline-delimited
+    JSON, one document per line, without building the full list.
+    """
+    transactions = await service.iter_range(
+        user_id=current_user.id,
+        start=from_date,
+        end=to_date,
+        request=request,
+    )
+
+    async def lines():
+        async for tx in transactions:
+            yield dumps(tx) + b"\n"
+
+    filename = f"transactions-{from_date:%Y%m%d}-{to_date:%Y%m%d}.ndjson"
+
+    return StreamingResponse(
+        lines(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 # -------------------------------------------------
 # List transactions with pagination
 # -------------------------------------------------
-@router.get("/")
+@router.get("/", response_model=PageResponse[TransactionInDB])
 async def list_transactions(
     request: Request,
+    response: Response,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     from_date: Optional[datetime] = None,
@@ -98,8 +159,18 @@ async def list_transactions(
     type: Optional[str] = Query(None, pattern="^(income|expense)$"),
     min_amount: Optional[float] = None,
     max_amount: Optional[float] = None,
+    fields: Optional[str] = Query(
+        None, description='Comma-separated fieldset, e.g. "date,amount,category"'
+    ),
     current_user=Depends(get_current_user),
+    conditional: ConditionalRead = Depends(conditional_read("transactions")),
 ):
+    if conditional.not_modified:
+        return conditional.not_modified_response()
+
+    conditional.apply(response)
+    fieldset = parse_fields(fields, TransactionInDB)
+
     filters = TransactionFilter(
         from_date=from_date,
         to_date=to_date,
@@ -114,10 +185,11 @@ async def list_transactions(
         filters=filters,
         page=page,
         limit=limit,
+        fields=fieldset,
         request=request,
     )
 
-    return {
+    payload = {
         "success": True,
         "page": page,
         "limit": limit,
@@ -127,32 +199,49 @@ async def list_transactions(
         "data": result["items"],
     }
 
+    # Trimmed documents skip the response model entirely
+    if fieldset:
+        return FastJSONResponse(content=payload, headers=conditional.headers())
+
+    return payload
+
 
 # -------------------------------------------------
 # Get transaction by ID
 # -------------------------------------------------
-@router.get("/{transaction_id}")
+@router.get("/{transaction_id}", response_model=DataResponse[TransactionInDB])
 async def get_transaction(
     transaction_id: str = Path(..., description="Transaction ID (24-char hex)"),
     request: Request = None,
+    fields: Optional[str] = Query(
+        None, description='Comma-separated fieldset, e.g. "date,amount,category"'
+    ),
     current_user=Depends(get_current_user),
 ):
+    fieldset = parse_fields(fields, TransactionInDB)
+
     tx = await service.get_by_id(
         user_id=current_user.id,
         transaction_id=transaction_id,
+        fields=fieldset,
         request=request,
     )
 
-    return {
+    payload = {
         "success": True,
         "data": tx,
     }
 
+    if fieldset:
+        return FastJSONResponse(content=payload)
+
+    return payload
+
 
 # -------------------------------------------------
 # Update transaction
 # -------------------------------------------------
-@router.put("/{transaction_id}")
+@router.put("/{transaction_id}", response_model=SuccessResponse)
 async def update_transaction(
     transaction_id: str = Path(..., description="Transaction ID (24-char hex)"),
     payload: TransactionUpdate = None,
@@ -172,7 +261,11 @@ async def update_transaction(
 # -------------------------------------------------
 # Delete transaction
 # -------------------------------------------------
-@router.delete("/{transaction_id}", status_code=status.HTTP_200_OK)
+@router.delete(
+    "/{transaction_id}",
+    status_code=status.HTTP_200_OK,
+    response_model=SuccessResponse,
+)
 async def delete_transaction(
     transaction_id: str = Path(..., description="Transaction ID (24-char hex)"),
     request: Request = None,
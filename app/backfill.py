@@ -0,0 +1,45 @@
+"""
+One-off data backfills for documents written before a feature existed.
+
+The standalone worker (python -m app.worker) runs them on startup; without
+one (scheduler inside the API), run them once by hand after deploying:
+
+    python -m app.backfill
+
+Each runs once across all processes and is a no-op once it completed.
+"""
+
+import asyncio
+
+from app.database import close_database_connection, connect_to_database
+from app.tasks.fingerprint_backfill import backfill_fingerprints
+from app.tasks.recurring_backfill import backfill_recurring_links
+from app.utils.logger import get_logger
+
+logger = get_logger("pennywise.backfill")
+
+BACKFILLS = [backfill_fingerprints, backfill_recurring_links]
+
+
+async def run_backfills() -> None:
+    for backfill in BACKFILLS:
+        try:
+            await backfill()
+        except Exception as exc:
+            # The next start retries it; the others still run
+            logger.error(
+                "Backfill failed", extra={"backfill": backfill.__name__}, exc_info=exc
+            )
+
+
+async def main() -> None:
+    await connect_to_database()
+
+    try:
+        await run_backfills()
+    finally:
+        await close_database_connection()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -79,23 +79,38 @@ async def create_indexes() -> None:
         keys: list[tuple[str, int]],
         name: str,
         unique: bool = False,
+        partial_filter: Optional[dict] = None,
     ) -> None:
         existing_indexes = await collection.index_information()
         if name in existing_indexes:
-            # Check if the existing index matches the keys
-            existing_keys = existing_indexes[name]["key"]
-            if existing_keys != keys:
+            # Check if the existing index matches the definition
+            existing = existing_indexes[name]
+            if (
+                existing["key"] != keys
+                or existing.get("unique", False) != unique
+                or existing.get("partialFilterExpression") != partial_filter
+            ):
                 logger.warning(
-                    f"Index '{name}' exists but keys differ. Dropping "
-                    "and recreating."
+                    f"Index '{name}' exists but its definition differs. "
+                    "Dropping and recreating."
                 )
                 await collection.drop_index(name)
             else:
                 logger.info(f"Index '{name}' already exists. Skipping creation.")
                 return
-        await collection.create_index(keys, unique=unique, name=name)
+
+        options = {"partialFilterExpression": partial_filter} if partial_filter else {}
+        await collection.create_index(keys, unique=unique, name=name, **options)
         logger.info(f"Index '{name}' created successfully.")
 
+    async def drop_stale_index(
+        collection: "AsyncIOMotorCollection[dict]",
+        name: str,
+    ) -> None:
+        if name in await collection.index_information():
+            await collection.drop_index(name)
+            logger.info(f"Stale index '{name}' dropped.")
+
     # ---------------- USERS ----------------
     await safe_create_index(db.users, [("email", 1)], "uniq_users_email", unique=True)
     await safe_create_index(
@@ -113,6 +128,86 @@ async def create_indexes() -> None:
         db.transactions, [("user_id", 1), ("category", 1)], "idx_tx_user_category"
     )
     await safe_create_index(db.transactions, [("date", -1)], "idx_tx_date")
+    await safe_create_index(
+        db.transactions,
+        [("user_id", 1), ("fingerprint", 1)],
+        "idx_tx_user_fingerprint",
+    )
+    await safe_create_index(
+        db.transactions,
+        [("user_id", 1), ("recurring_id", 1), ("date", -1)],
+        "idx_tx_user_recurring_date",
+    )
+
+    # ---------------- RECURRING ----------------
+    await safe_create_index(
+        db.recurring,
+        [("active", 1), ("next_run_at", 1)],
+        "idx_recurring_active_next_run",
+    )
+    await safe_create_index(
+        db.recurring,
+        [("user_id", 1), ("created_at", -1)],
+        "idx_recurring_user_created_at",
+    )
+
+    # ---------------- RECURRING OCCURRENCES ----------------
+    await safe_create_index(
+        db.recurring_occurrences,
+        [("recurring_id", 1), ("occurrence_date", 1)],
+        "uniq_occurrence_recurring_date",
+        unique=True,
+    )
+
+    # ---------------- RECURRING SUGGESTIONS ----------------
+    await safe_create_index(
+        db.recurring_suggestions,
+        [("user_id", 1), ("key", 1)],
+        "uniq_suggestion_user_key",
+        unique=True,
+    )
+    await safe_create_index(
+        db.recurring_suggestions,
+        [("user_id", 1), ("status", 1), ("confidence", -1)],
+        "idx_suggestion_user_status_confidence",
+    )
+
+    # ---------------- REPORT JOBS ----------------
+    await safe_create_index(
+        db.report_jobs,
+        [("status", 1), ("run_after", 1)],
+        "idx_report_jobs_status_run_after",
+    )
+    await safe_create_index(
+        db.report_jobs,
+        [("status", 1), ("lease_until", 1)],
+        "idx_report_jobs_status_lease",
+    )
+    await safe_create_index(
+        db.report_jobs,
+        [("user_id", 1), ("created_at", -1)],
+        "idx_report_jobs_user_created_at",
+    )
+    # One job per user and campaign; interactive jobs have no campaign_id
+    await drop_stale_index(db.report_jobs, "idx_report_jobs_campaign_user")
+    await safe_create_index(
+        db.report_jobs,
+        [("campaign_id", 1), ("user_id", 1)],
+        "uniq_report_jobs_campaign_user",
+        unique=True,
+        partial_filter={"campaign_id": {"$type": "string"}},
+    )
+
+    # ---------------- REPORT CAMPAIGNS ----------------
+    await safe_create_index(
+        db.report_campaigns, [("key", 1)], "uniq_report_campaigns_key", unique=True
+    )
+
+    # ---------------- REPORT CACHE ----------------
+    await safe_create_index(
+        db.report_cache, [("last_used_at", 1)], "idx_report_cache_last_used"
+    )
+    await safe_create_index(db.report_cache, [("digest", 1)], "idx_report_cache_digest")
 
     # ---------------- AUDIT LOGS ----------------
     await safe_create_index(db.audit_logs, [("user_id", 1)], "idx_audit_user")
@@ -0,0 +1,61 @@
+from fastapi import Depends, Request, Response, status
+
+from app.dependencies.auth import get_current_user
+from app.repositories.version_repo import DataVersionRepository
+from app.utils.etag import build_etag, etag_matches, query_signature
+
+version_repo = DataVersionRepository()
+
+CACHE_CONTROL = "private, no-cache"
+
+
+class ConditionalRead:
+    """
+    Validator for a conditional GET.
+
+    The ETag is derived from the user's data version for a scope plus the
+    request path and query parameters, so it can be checked before any
+    collection query runs.
+    """
+
+    def __init__(self, request: Request, etag: str):
+        self.request = request
+        self.etag = etag
+
+    @property
+    def not_modified(self) -> bool:
+        return etag_matches(self.request, self.etag)
+
+    def not_modified_response(self) -> Response:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=self.headers(),
+        )
+
+    def headers(self) -> dict[str, str]:
+        return {"ETag": self.etag, "Cache-Control": CACHE_CONTROL}
+
+    def apply(self, response: Response) -> None:
+        response.headers.update(self.headers())
+
+
+def conditional_read(scope: str):
+    """
+    Dependency factory: `Depends(conditional_read("transactions"))`.
+    """
+
+    async def dependency(
+        request: Request,
+        current_user=Depends(get_current_user),
+    ) -> ConditionalRead:
+        version = await version_repo.get(current_user.id, scope)
+        etag = build_etag(
+            current_user.id,
+            scope,
+            version,
+            request.url.path,
+            query_signature(request),
+        )
+        return ConditionalRead(request, etag)
+
+    return dependency
@@ -0,0 +1,124 @@
+# app/domain/charts.py
+
+from html import escape
+from typing import List
+
+from app.domain.money import format_currency
+
+INCOME_COLOR = "#2e7d32"
+EXPENSE_COLOR = "#c62828"
+AXIS_COLOR = "#999"
+
+MONTH_LABELS = "Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split()
+
+
+def month_label(month: str, *, with_year: bool = False) -> str:
+    """ "2026-03" -> "Mar" (or "Mar 26")"""
+    year, number = month.split("-")
+    label = MONTH_LABELS[int(number) - 1]
+    return f"{label} {year[2:]}" if with_year else label
+
+
+def monthly_chart_svg(
+    months: List[dict],
+    *,
+    width: int = 720,
+    height: int = 220,
+) -> str:
+    """
+    Grouped bar chart of income vs expense per month.
+
+    Args:
+        months: [{month: "YYYY-MM", income, expense}] oldest first
+
+    Returns:
+        Standalone <svg> markup
+    """
+    left, right, top, bottom = 64, 8, 12, 28
+    plot_width = width - left - right
+    plot_height = height - top - bottom
+
+    peak = (
+        max(
+            [max(m["income"], m["expense"]) for m in months] + [0.0],
+        )
+        or 1.0
+    )
+    with_year = len({m["month"][:4] for m in months}) > 1
+
+    slot = plot_width / max(len(months), 1)
+    bar = max(min(slot * 0.35, 24), 1)
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" '
+        f'height="{height}" viewBox="0 0 {width} {height}" '
+        'font-family="Arial" font-size="10">',
+        f'<line x1="{left}" y1="{top + plot_height}" x2="{width - right}" '
+        f'y2="{top + plot_height}" stroke="{AXIS_COLOR}"/>',
+        f'<text x="{left - 6}" y="{top + 4}" text-anchor="end" '
+        f'fill="{AXIS_COLOR}">{escape(format_currency(peak))}</text>',
+    ]
+
+    for index, month in enumerate(months):
+        center = left + slot * (index + 0.5)
+        for offset, value, color in (
+            (-bar, month["income"], INCOME_COLOR),
+            (0, month["expense"], EXPENSE_COLOR),
+        ):
+            bar_height = plot_height * value / peak
+            parts.append(
+                f'<rect x="{center + offset:.1f}" '
+                f'y="{top + plot_height - bar_height:.1f}" width="{bar:.1f}" '
+                f'height="{bar_height:.1f}" fill="{color}"/>'
+            )
+        parts.append(
+            f'<text x="{center:.1f}" y="{height - 10}" text-anchor="middle">'
+            f"{escape(month_label(month['month'], with_year=with_year))}</text>"
+        )
+
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def category_chart_svg(
+    categories: List[dict],
+    *,
+    width: int = 720,
+    bar_height: int = 16,
+    limit: int = 8,
+) -> str:
+    """
+    Horizontal bar chart of the largest categories.
+
+    Args:
+        categories: [{category, type, total}] largest first
+
+    Returns:
+        Standalone <svg> markup
+    """
+    rows = categories[:limit]
+    label_width, value_width, gap = 140, 90, 6
+    plot_width = width - label_width - value_width
+    height = max(len(rows), 1) * (bar_height + gap)
+
+    peak = max([row["total"] for row in rows] + [0.0]) or 1.0
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" '
+        f'height="{height}" viewBox="0 0 {width} {height}" '
+        'font-family="Arial" font-size="10">'
+    ]
+    for index, row in enumerate(rows):
+        y = index * (bar_height + gap)
+        color = INCOME_COLOR if row["type"] == "income" else EXPENSE_COLOR
+        parts.append(
+            f'<text x="{label_width - 8}" y="{y + bar_height - 4}" '
+            f'text-anchor="end">{escape(row["category"])}</text>'
+            f'<rect x="{label_width}" y="{y}" '
+            f'width="{max(plot_width * row["total"] / peak, 1):.1f}" '
+            f'height="{bar_height}" fill="{color}"/>'
+            f'<text x="{width - 4}" y="{y + bar_height - 4}" text-anchor="end">'
+            f'{escape(format_currency(row["total"]))}</text>'
+        )
+
+    parts.append("</svg>")
+    return "".join(parts)
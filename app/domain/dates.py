@@ -0,0 +1,58 @@
+# app/domain/dates.py
+
+import calendar
+from datetime import datetime
+
+
+def add_months(value: datetime, months: int, *, day: int | None = None) -> datetime:
+    """
+    Shift a datetime by whole calendar months, clamping to the month end.
+
+    Args:
+        value: The datetime to shift
+        months: Number of months (may be negative)
+        day: Preferred day of month (defaults to value.day)
+
+    Returns:
+        Shifted datetime, e.g. 31 Jan + 1 month -> 28/29 Feb
+    """
+    index = value.year * 12 + (value.month - 1) + months
+    year, month = divmod(index, 12)
+    month += 1
+
+    last_day = calendar.monthrange(year, month)[1]
+    return value.replace(year=year, month=month, day=min(day or value.day, last_day))
+
+
+def month_bounds(month: str) -> tuple[datetime, datetime]:
+    """
+    Half-open range [start, end) for a "YYYY-MM" month.
+
+    Raises:
+        ValueError: if the month is not in YYYY-MM format
+    """
+    start = datetime.strptime(month, "%Y-%m")
+    return start, add_months(start, 1)
+
+
+def year_bounds(year: str) -> tuple[datetime, datetime]:
+    """
+    Half-open range [start, end) for a "YYYY" year.
+
+    Raises:
+        ValueError: if the year is not in YYYY format
+    """
+    start = datetime.strptime(year, "%Y")
+    return start, add_months(start, 12)
+
+
+def months_between(start: datetime, end: datetime) -> list[str]:
+    """
+    "YYYY-MM" keys of every month overlapping [start, end), oldest first.
+    """
+    months = []
+    current = start.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    while current < end:
+        months.append(current.strftime("%Y-%m"))
+        current = add_months(current, 1)
+    return months
@@ -0,0 +1,52 @@
+# app/domain/fingerprint.py
+
+import hashlib
+import re
+from datetime import datetime
+from typing import Optional
+
+_SEPARATORS = re.compile(r"[\W_]+")
+
+
+def normalize_description(description: Optional[str]) -> str:
+    """
+    Case-fold and collapse punctuation/whitespace so cosmetic differences
+    between statement exports do not change the fingerprint.
+    """
+    if not description:
+        return ""
+    return _SEPARATORS.sub(" ", description.casefold()).strip()
+
+
+def transaction_fingerprint(
+    *,
+    date: datetime,
+    amount: float,
+    tx_type: str,
+    description: Optional[str],
+) -> str:
+    """
+    Stable identity of a transaction for duplicate detection.
+
+    Built from the calendar day, the amount (2dp), the type and the
+    normalized description.
+    """
+    day = date.strftime("%Y-%m-%d") if hasattr(date, "strftime") else str(date)[:10]
+    raw = "|".join(
+        [
+            day,
+            f"{float(amount):.2f}",
+            tx_type,
+            normalize_description(description),
+        ]
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+def fingerprint_for(payload: dict) -> str:
+    return transaction_fingerprint(
+        date=payload["date"],
+        amount=payload["amount"],
+        tx_type=payload["type"],
+        description=payload.get("description"),
+    )
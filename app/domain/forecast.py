@@ -0,0 +1,157 @@
+# app/domain/forecast.py
+
+from datetime import date
+from typing import Iterable
+
+import numpy as np
+
+# Step of each frequency: (unit, count)
+FREQUENCY_STEPS = {
+    "daily": ("D", 1),
+    "weekly": ("D", 7),
+    "monthly": ("M", 1),
+    "yearly": ("M", 12),
+}
+
+
+def expand_occurrences(
+    first: date,
+    frequency: str,
+    *,
+    end: date,
+    anchor_day: int | None = None,
+) -> np.ndarray:
+    """
+    All occurrence dates of a rule in [first, end) as datetime64[D].
+
+    Month-based rules use the same calendar rules as app.domain.schedule:
+    the anchor day is clamped to each month's length (31 -> 28/29 Feb).
+
+    Raises:
+        ValueError: for an unknown frequency
+    """
+    if frequency not in FREQUENCY_STEPS:
+        raise ValueError(f"Unknown frequency: {frequency}")
+
+    start = np.datetime64(first, "D")
+    stop = np.datetime64(end, "D")
+    if start >= stop:
+        return np.empty(0, dtype="datetime64[D]")
+
+    unit, step = FREQUENCY_STEPS[frequency]
+    if unit == "D":
+        return np.arange(start, stop, np.timedelta64(step, "D"))
+
+    first_month = start.astype("datetime64[M]")
+    count = (stop.astype("datetime64[M]") - first_month).astype(int) // step + 1
+    months = first_month + np.arange(count) * step
+
+    month_starts = months.astype("datetime64[D]")
+    month_lengths = ((months + 1).astype("datetime64[D]") - month_starts).astype(int)
+    days = np.minimum(anchor_day or first.day, month_lengths)
+
+    dates = month_starts + (days - 1)
+    return dates[dates < stop]
+
+
+def build_forecast(
+    rules: Iterable,
+    *,
+    start: date,
+    end: date,
+    granularity: str,
+    opening_balance: float = 0.0,
+    daily_income: float = 0.0,
+    daily_expense: float = 0.0,
+) -> dict:
+    """
+    Project income, expense and balance over [start, end).
+
+    Every rule is expanded into date/amount arrays; the arrays of all rules
+    are bucketed with one bincount, so cost grows with the number of
+    occurrences rather than with Python-level loops over days.
+
+    Args:
+        rules: Active recurring rules (next_run_at, frequency, amount,
+            type, schedule_anchor)
+        start: First day of the forecast
+        end: Day after the last forecast day
+        granularity: "daily" or "monthly"
+        opening_balance: Balance before `start`
+        daily_income: Baseline income per day (e.g. historical average of
+            non-recurring transactions)
+        daily_expense: Baseline expense per day
+
+    Returns:
+        dict with period starts and income/expense/net/balance arrays
+    """
+    first_day = np.datetime64(start, "D")
+    days = np.arange(first_day, np.datetime64(end, "D"))
+
+    if granularity == "monthly":
+        day_bucket = (
+            days.astype("datetime64[M]") - first_day.astype("datetime64[M]")
+        ).astype(int)
+    else:
+        day_bucket = np.arange(len(days))
+
+    buckets = int(day_bucket[-1]) + 1 if len(days) else 0
+
+    dates: list[np.ndarray] = []
+    amounts: list[np.ndarray] = []
+    for rule in rules:
+        occurrences = expand_occurrences(
+            rule.next_run_at.date(),
+            rule.frequency,
+            end=end,
+            anchor_day=rule.schedule_anchor,
+        )
+        if not len(occurrences):
+            continue
+
+        signed = rule.amount if rule.type == "income" else -rule.amount
+        dates.append(occurrences)
+        amounts.append(np.full(len(occurrences), signed, dtype=float))
+
+    income = np.zeros(buckets)
+    expense = np.zeros(buckets)
+
+    if dates:
+        all_dates = np.concatenate(dates)
+        all_amounts = np.concatenate(amounts)
+
+        # Overdue occurrences are about to be posted: count them on day one
+        day_index = np.maximum((all_dates - first_day).astype(int), 0)
+        bucket_index = day_bucket[day_index]
+
+        income += np.bincount(
+            bucket_index,
+            weights=np.where(all_amounts > 0, all_amounts, 0.0),
+            minlength=buckets,
+        )
+        expense += np.bincount(
+            bucket_index,
+            weights=np.where(all_amounts < 0, -all_amounts, 0.0),
+            minlength=buckets,
+        )
+
+    # Baseline spreads evenly over the days in each bucket
+    days_per_bucket = np.bincount(day_bucket, minlength=buckets)
+    income += daily_income * days_per_bucket
+    expense += daily_expense * days_per_bucket
+
+    net = income - expense
+    balance = opening_balance + np.cumsum(net)
+
+    bucket_starts = np.full(buckets, np.datetime64("NaT"), dtype="datetime64[D]")
+    # First day of each bucket (day_bucket is non-decreasing)
+    firsts = np.flatnonzero(np.diff(day_bucket, prepend=-1))
+    bucket_starts[day_bucket[firsts]] = days[firsts]
+
+    return {
+        "period_starts": bucket_starts.astype(date).tolist(),
+        "income": income,
+        "expense": expense,
+        "net": net,
+        "balance": balance,
+    }
@@ -0,0 +1,169 @@
+# app/domain/patterns.py
+
+import hashlib
+import math
+import re
+from collections import Counter
+from datetime import datetime
+from typing import List
+
+import numpy as np
+
+from app.domain.fingerprint import normalize_description
+from app.domain.schedule import next_occurrence
+
+# Candidate periods: frequency -> (days, tolerance in days)
+PERIODS = {
+    "weekly": (7, 1),
+    "monthly": (30.44, 3),
+    "yearly": (365.25, 6),
+}
+
+# Amounts within ~10% of each other share a band
+AMOUNT_BAND_RATIO = 1.1
+
+MIN_OCCURRENCES = 3
+MIN_REGULARITY = 0.75
+
+_DIGITS = re.compile(r"\d+")
+
+
+def pattern_description(description: str | None) -> str:
+    """
+    Normalized description with reference numbers removed, so
+    "NETFLIX.COM 8231" and "Netflix.com 9912" group together.
+    """
+    return " ".join(_DIGITS.sub(" ", normalize_description(description)).split())
+
+
+def amount_band(amount: float) -> int:
+    return round(math.log(max(abs(amount), 0.01)) / math.log(AMOUNT_BAND_RATIO))
+
+
+def pattern_key(tx_type: str, description: str | None, amount: float) -> str:
+    raw = f"{tx_type}|{pattern_description(description)}|{amount_band(amount)}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:20]
+
+
+def detect_patterns(
+    transactions: List[dict],
+    *,
+    now: datetime,
+) -> List[dict]:
+    """
+    Find series of transactions that repeat weekly, monthly or yearly.
+
+    Transactions are grouped by (type, pattern description, amount band).
+    The interval statistics of every group are computed together: one sort
+    of all transactions, one diff, and bincounts per group, instead of a
+    Python loop over each group's intervals.
+
+    Args:
+        transactions: dicts with date, amount, type, description, category
+        now: Reference time; series that stopped are not suggested
+
+    Returns:
+        Suggestions ranked by confidence (highest first)
+    """
+    if len(transactions) < MIN_OCCURRENCES:
+        return []
+
+    keys = [
+        pattern_key(tx["type"], tx.get("description"), tx["amount"])
+        for tx in transactions
+    ]
+    unique_keys, codes = np.unique(np.array(keys), return_inverse=True)
+
+    days = np.array(
+        [tx["date"].toordinal() for tx in transactions],
+        dtype=np.int64,
+    )
+    amounts = np.array([abs(tx["amount"]) for tx in transactions], dtype=float)
+
+    order = np.lexsort((days, codes))
+    codes, days, amounts = codes[order], days[order], amounts[order]
+    groups = len(unique_keys)
+
+    counts = np.bincount(codes, minlength=groups)
+
+    # Intervals between consecutive transactions of the same group
+    same_group = codes[1:] == codes[:-1]
+    interval_codes = codes[1:][same_group]
+    intervals = np.diff(days)[same_group]
+    interval_counts = np.bincount(interval_codes, minlength=groups)
+
+    # Share of intervals matching each candidate period
+    regularity = np.zeros((len(PERIODS), groups))
+    for row, (period, tolerance) in enumerate(PERIODS.values()):
+        hits = (np.abs(intervals - period) <= tolerance).astype(float)
+        regularity[row] = np.bincount(
+            interval_codes, weights=hits, minlength=groups
+        ) / np.maximum(interval_counts, 1)
+
+    best = regularity.argmax(axis=0)
+    best_regularity = regularity.max(axis=0)
+
+    # Amount stability: coefficient of variation per group
+    amount_sum = np.bincount(codes, weights=amounts, minlength=groups)
+    amount_sq = np.bincount(codes, weights=amounts**2, minlength=groups)
+    mean_amount = amount_sum / np.maximum(counts, 1)
+    variance = np.maximum(amount_sq / np.maximum(counts, 1) - mean_amount**2, 0.0)
+    amount_cv = np.sqrt(variance) / np.maximum(mean_amount, 0.01)
+
+    last_day = np.zeros(groups, dtype=np.int64)
+    np.maximum.at(last_day, codes, days)
+
+    confidence = (
+        best_regularity
+        * np.minimum(counts / 6.0, 1.0)
+        * np.clip(1.0 - amount_cv, 0.0, 1.0)
+    )
+
+    frequencies = list(PERIODS)
+    periods = np.array([period for period, _ in PERIODS.values()])
+    today = now.toordinal()
+
+    candidates = np.flatnonzero(
+        (counts >= MIN_OCCURRENCES)
+        & (best_regularity >= MIN_REGULARITY)
+        # Still running: last seen within 1.5 periods
+        & (today - last_day <= periods[best] * 1.5)
+    )
+
+    # Per-group details only for the few groups that qualified
+    members: dict[int, list[dict]] = {int(code): [] for code in candidates}
+    for code, index in zip(codes, order):
+        if int(code) in members:
+            members[int(code)].append(transactions[index])
+
+    suggestions = []
+    for code in candidates:
+        series = members[int(code)]
+        last = series[-1]
+        frequency = frequencies[best[code]]
+
+        anchor_day = Counter(tx["date"].day for tx in series).most_common(1)[0][0]
+        next_run_at = next_occurrence(last["date"], frequency, anchor_day=anchor_day)
+        while next_run_at < now:
+            next_run_at = next_occurrence(next_run_at, frequency, anchor_day=anchor_day)
+
+        suggestions.append(
+            {
+                "key": str(unique_keys[code]),
+                "type": last["type"],
+                "description": last.get("description") or "",
+                "category": Counter(
+                    tx.get("category") or "Uncategorized" for tx in series
+                ).most_common(1)[0][0],
+                "amount": round(float(np.median([tx["amount"] for tx in series])), 2),
+                "frequency": frequency,
+                "next_run_at": next_run_at,
+                "occurrences": int(counts[code]),
+                "first_seen_at": series[0]["date"],
+                "last_seen_at": last["date"],
+                "confidence": round(float(confidence[code]), 3),
+            }
+        )
+
+    suggestions.sort(key=lambda item: item["confidence"], reverse=True)
+    return suggestions
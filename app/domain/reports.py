@@ -0,0 +1,74 @@
+# app/domain/reports.py
+
+from datetime import datetime, timedelta
+
+from app.domain.dates import month_bounds, year_bounds
+
+REPORT_TITLES = {
+    "monthly": "Monthly Statement",
+    "annual": "Annual Statement",
+    "range": "Statement",
+}
+
+# Reports spanning more than one month get charts and breakdown tables
+BREAKDOWN_KINDS = {"annual", "range"}
+
+
+def report_period(
+    kind: str,
+    params: dict,
+    *,
+    max_days: int,
+) -> tuple[datetime, datetime, str]:
+    """
+    Date range and label of a report.
+
+    Params per kind:
+        monthly: month ("YYYY-MM")
+        annual: year ("YYYY")
+        range: start, end ("YYYY-MM-DD", both inclusive)
+
+    Returns:
+        (start, end, period label) with [start, end) half-open
+
+    Raises:
+        ValueError: on malformed params, or a range that is empty or longer
+            than `max_days`
+    """
+    if kind == "monthly":
+        try:
+            start, end = month_bounds(params["month"])
+        except (KeyError, ValueError):
+            raise ValueError("Month must be in YYYY-MM format")
+        return start, end, params["month"]
+
+    if kind == "annual":
+        try:
+            start, end = year_bounds(params["year"])
+        except (KeyError, ValueError):
+            raise ValueError("Year must be in YYYY format")
+        return start, end, params["year"]
+
+    if kind == "range":
+        try:
+            start = datetime.strptime(params["start"], "%Y-%m-%d")
+            end = datetime.strptime(params["end"], "%Y-%m-%d") + timedelta(days=1)
+        except (KeyError, ValueError):
+            raise ValueError("Range start and end must be in YYYY-MM-DD format")
+        if start >= end:
+            raise ValueError("Range start must not be after range end")
+        if (end - start).days > max_days:
+            raise ValueError(f"Range must not exceed {max_days} days")
+
+        label = f"{start:%d %b %Y} – {end - timedelta(days=1):%d %b %Y}"
+        return start, end, label
+
+    raise ValueError(f"Unknown report kind: {kind}")
+
+
+def report_filename(kind: str, params: dict) -> str:
+    if kind == "monthly":
+        return f"pennywise-{params['month']}.pdf"
+    if kind == "annual":
+        return f"pennywise-{params['year']}.pdf"
+    return f"pennywise-{params['start']}_{params['end']}.pdf"
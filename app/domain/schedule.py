@@ -0,0 +1,74 @@
+# app/domain/schedule.py
+
+from datetime import datetime, timedelta
+
+from app.domain.dates import add_months
+
+# Calendar step for each frequency: (days, months)
+FREQUENCY_STEPS = {
+    "daily": (1, 0),
+    "weekly": (7, 0),
+    "monthly": (0, 1),
+    "yearly": (0, 12),
+}
+
+
+def next_occurrence(
+    current: datetime,
+    frequency: str,
+    *,
+    anchor_day: int | None = None,
+) -> datetime:
+    """
+    The occurrence that follows `current` for a rule.
+
+    Args:
+        current: An occurrence of the rule
+        frequency: daily, weekly, monthly or yearly
+        anchor_day: Day of month the rule was scheduled on; month-based
+            rules return to it after a clamped month (31 Jan -> 28 Feb
+            -> 31 Mar, 29 Feb -> 28 Feb -> ... -> 29 Feb)
+
+    Raises:
+        ValueError: for an unknown frequency
+    """
+    if frequency not in FREQUENCY_STEPS:
+        raise ValueError(f"Unknown frequency: {frequency}")
+
+    days, months = FREQUENCY_STEPS[frequency]
+    if months:
+        return add_months(current, months, day=anchor_day or current.day)
+
+    return current + timedelta(days=days)
+
+
+def occurrences(
+    start: datetime,
+    frequency: str,
+    *,
+    until: datetime,
+    anchor_day: int | None = None,
+    limit: int | None = None,
+) -> tuple[list[datetime], datetime]:
+    """
+    Occurrences of a rule in the window [start, until].
+
+    Args:
+        start: First occurrence (the rule's next_run_at)
+        frequency: daily, weekly, monthly or yearly
+        until: Inclusive end of the window
+        anchor_day: See next_occurrence
+        limit: Maximum number of occurrences to return
+
+    Returns:
+        (occurrences, following) where `following` is the first occurrence
+        not returned, i.e. the rule's new next_run_at
+    """
+    found: list[datetime] = []
+    current = start
+
+    while current <= until and (limit is None or len(found) < limit):
+        found.append(current)
+        current = next_occurrence(current, frequency, anchor_day=anchor_day)
+
+    return found, current
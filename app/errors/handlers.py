@@ -1,11 +1,11 @@
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.errors.base import AppError
 from app.errors.codes import ErrorCode
 from app.responses.error import error_response
+from app.responses.json import FastJSONResponse
 
 
 # Custom handler to show missing fields and other validation errors
@@ -37,12 +37,9 @@ async def validation_error_handler(request: Request, exc: RequestValidationError
         message = "Invalid request data"
 
     # Return the response with the appropriate error message
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=422,
-        content={
-            "success": False,
-            "error": {"code": ErrorCode.VALIDATION_ERROR, "message": message},
-        },
+        content=error_response(ErrorCode.VALIDATION_ERROR, message),
     )
 
 
@@ -52,7 +49,7 @@ def register_exception_handlers(app: FastAPI) -> None:
     # -----------------------------
     @app.exception_handler(AppError)
     async def app_error_handler(request: Request, exc: AppError):
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=exc.status_code,
             content=error_response(exc.code, exc.message),
         )
@@ -80,7 +77,7 @@ def register_exception_handlers(app: FastAPI) -> None:
             code = ErrorCode.INTERNAL_ERROR
             message = "Request failed"
 
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=exc.status_code,
             content=error_response(code, message),
         )
@@ -90,7 +87,7 @@ def register_exception_handlers(app: FastAPI) -> None:
     # -----------------------------
     @app.exception_handler(Exception)
     async def unhandled_exception_handler(request: Request, exc: Exception):
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=500,
             content=error_response(
                 ErrorCode.INTERNAL_ERROR,
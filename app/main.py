@@ -6,11 +6,17 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api.router import api_router
 from app.database import close_database_connection, connect_to_database
 from app.errors.handlers import register_exception_handlers
+from app.middleware.compression import CompressionMiddleware
 from app.middleware.logging import logging_middleware
 from app.middleware.request_id import request_id_middleware
 from app.middleware.timing import timing_middleware
+from app.responses.json import FastJSONResponse
 from app.responses.success import success_response
+from app.services.browser_pool import browser_pool
+from app.services.report_store import REPORT_STORE_NOT_SHARED, ReportStore
 from app.settings import settings
+from app.tasks.report_worker import start_report_worker, stop_report_worker
+from app.tasks.scheduler import shutdown_scheduler, start_scheduler
 
 logger = logging.getLogger("pennywise")
 
@@ -28,6 +34,7 @@ def create_app() -> FastAPI:
         docs_url="/docs" if settings.ENV != "production" else None,
         redoc_url="/redoc" if settings.ENV != "production" else None,
         openapi_url=("/openapi.json" if settings.ENV != "production" else None),
+        default_response_class=FastJSONResponse,
     )
 
     # -------------------------------------------------
@@ -48,6 +55,18 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # -------------------------------------------------
+    # Compression (outermost, so every layer's output is covered)
+    # -------------------------------------------------
+    if settings.COMPRESSION_ENABLED:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+            gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+            brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+            zstd_level=settings.COMPRESSION_ZSTD_LEVEL,
+        )
+
     # -------------------------------------------------
     # API Routers
     # -------------------------------------------------
@@ -71,8 +90,27 @@ def create_app() -> FastAPI:
             logger.critical("Database connection failed", exc_info=exc)
             raise
 
+        # Reports are written by workers and served from here
+        if not await ReportStore().check_shared():
+            logger.critical(
+                REPORT_STORE_NOT_SHARED, extra={"root": settings.REPORT_STORE_DIR}
+            )
+            raise RuntimeError(REPORT_STORE_NOT_SHARED)
+
+        if settings.SCHEDULER_ENABLED:
+            start_scheduler()
+            logger.info(
+                "Scheduler running in the API process "
+                "(set SCHEDULER_ENABLED=false when running app.worker)"
+            )
+        if settings.REPORT_WORKER_EMBEDDED:
+            start_report_worker()
+
     @app.on_event("shutdown")
     async def on_shutdown():
+        shutdown_scheduler()
+        await stop_report_worker()
+        await browser_pool.shutdown()
         await close_database_connection()
         logger.info("Database connection closed")
 
@@ -0,0 +1,283 @@
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Optional encoders: used only when the package is installed
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/xml",
+    "application/javascript",
+    "image/svg+xml",
+    "text/",
+)
+
+
+# -------------------------------------------------
+# Encoders (one instance per response)
+# -------------------------------------------------
+class _GzipEncoder:
+    def __init__(self, level: int):
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zlib.Z_FINISH)
+
+
+class _BrotliEncoder:
+    def __init__(self, quality: int):
+        self._obj = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.process(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class _ZstdEncoder:
+    def __init__(self, level: int):
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+# -------------------------------------------------
+# Middleware
+# -------------------------------------------------
+class CompressionMiddleware:
+    """
+    Negotiated response compression (zstd > br > gzip).
+
+    - Small bodies (below `minimum_size`) are sent as-is
+    - Streaming bodies are compressed chunk by chunk and flushed, so
+      clients receive data as it is produced
+    - Already-encoded, partial (206) and non-text responses pass through
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        zstd_level: int = 3,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = {
+            "gzip": gzip_level,
+            "br": brotli_quality,
+            "zstd": zstd_level,
+        }
+
+        self.available = ["gzip"]
+        if brotli is not None:
+            self.available.insert(0, "br")
+        if zstandard is not None:
+            self.available.insert(0, "zstd")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept = Headers(scope=scope).get("accept-encoding", "")
+        encoding = self._negotiate(accept)
+
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(
+            self.app,
+            encoding=encoding,
+            level=self.levels[encoding],
+            minimum_size=self.minimum_size,
+        )
+        await responder(scope, receive, send)
+
+    def _negotiate(self, header: str) -> Optional[str]:
+        accepted: dict[str, float] = {}
+
+        for part in header.split(","):
+            token, _, params = part.strip().partition(";")
+            token = token.strip().lower()
+            if not token:
+                continue
+
+            quality = 1.0
+            params = params.strip()
+            if params.startswith("q="):
+                try:
+                    quality = float(params[2:])
+                except ValueError:
+                    quality = 0.0
+
+            accepted[token] = quality
+
+        wildcard = accepted.get("*", 0.0)
+        for encoding in self.available:
+            if accepted.get(encoding, wildcard) > 0:
+                return encoding
+
+        return None
+
+
+class _CompressionResponder:
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        encoding: str,
+        level: int,
+        minimum_size: int,
+    ):
+        self.app = app
+        self.encoding = encoding
+        self.level = level
+        self.minimum_size = minimum_size
+
+        self.send: Send = _unattached_send
+        self.start_message: Optional[Message] = None
+        self.started = False
+        self.passthrough = False
+        self.buffer = bytearray()
+        self.encoder = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_with_compression)
+
+    def _make_encoder(self):
+        if self.encoding == "zstd":
+            return _ZstdEncoder(self.level)
+        if self.encoding == "br":
+            return _BrotliEncoder(self.level)
+        return _GzipEncoder(self.level)
+
+    def _is_compressible(self, headers: Headers) -> bool:
+        if self.start_message["status"] in (204, 206, 304):
+            return False
+        if "content-encoding" in headers:
+            return False
+
+        content_type = headers.get("content-type", "")
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    async def send_with_compression(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            # Delay until enough of the body is known to decide
+            self.start_message = message
+            headers = MutableHeaders(raw=message["headers"])
+            if not self._is_compressible(headers):
+                self.passthrough = True
+            return
+
+        if message_type != "http.response.body":
+            await self.send(message)
+            return
+
+        if self.passthrough:
+            if not self.started:
+                self.started = True
+                await self.send(self.start_message)
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.started:
+            # Wrapped middlewares may split even small bodies into several
+            # chunks, so buffer up to the threshold before choosing a path.
+            self.buffer.extend(body)
+            if more_body and len(self.buffer) < self.minimum_size:
+                return
+
+            self.started = True
+            body = bytes(self.buffer)
+            self.buffer.clear()
+
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            headers.add_vary_header("Accept-Encoding")
+
+            if not more_body and len(body) < self.minimum_size:
+                await self.send(self.start_message)
+                await self.send({"type": "http.response.body", "body": body})
+                return
+
+            self.encoder = self._make_encoder()
+            headers["Content-Encoding"] = self.encoding
+            _weaken_etag(headers)
+
+            if not more_body:
+                # Whole body available: compress in one go
+                body = self.encoder.compress(body) + self.encoder.finish()
+                headers["Content-Length"] = str(len(body))
+                await self.send(self.start_message)
+                await self.send({"type": "http.response.body", "body": body})
+                return
+
+            # Streaming: length is unknown up front
+            del headers["Content-Length"]
+            await self.send(self.start_message)
+
+        if more_body:
+            chunk = self.encoder.compress(body) + self.encoder.flush()
+        else:
+            chunk = self.encoder.compress(body) + self.encoder.finish()
+
+        await self.send(
+            {
+                "type": "http.response.body",
+                "body": chunk,
+                "more_body": more_body,
+            }
+        )
+
+
+def _weaken_etag(headers: MutableHeaders) -> None:
+    """
+    A compressed body is a different representation, so a strong validator
+    must not be reused for it.
+    """
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+
+
+async def _unattached_send(message: Message) -> None:
+    raise RuntimeError("send awaitable not set")
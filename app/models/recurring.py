@@ -13,9 +13,44 @@ class RecurringTransactionInDB(BaseModel):
     description: str
     frequency: Literal["daily", "weekly", "monthly", "yearly"]
     next_run_at: datetime
+    schedule_anchor: Optional[int] = None  # Day of month the rule was set up on
     active: bool = True
     parent_recurring_id: Optional[str] = None  # For recursive recurring transactions
     last_executed_at: Optional[datetime] = None
+
+    # Lease held by the worker currently executing the rule
+    claimed_by: Optional[str] = None
+    claim_token: Optional[str] = None
+    lease_until: Optional[datetime] = None
+
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        populate_by_name = True
+        from_attributes = True
+
+
+class RecurringSuggestionInDB(BaseModel):
+    """
+    A recurring series detected in a user's history (see app/domain/patterns.py).
+    """
+
+    id: str = Field(alias="_id")
+    user_id: str
+    key: str  # Stable identity of the series: type + description + amount band
+    type: Literal["income", "expense"]
+    category: str
+    description: str
+    amount: float
+    frequency: Literal["daily", "weekly", "monthly", "yearly"]
+    next_run_at: datetime
+    occurrences: int
+    first_seen_at: datetime
+    last_seen_at: datetime
+    confidence: float
+    status: Literal["pending", "accepted", "dismissed"] = "pending"
+    recurring_id: Optional[str] = None  # Rule created on accept
     created_at: datetime
     updated_at: datetime
 
@@ -0,0 +1,75 @@
+from datetime import datetime
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ReportJobInDB(BaseModel):
+    """
+    A queued report render, executed by the report worker (app.report_worker).
+    """
+
+    id: str = Field(alias="_id")
+    user_id: str
+    kind: Literal["monthly", "annual", "range"] = "monthly"
+    # e.g. {"month": "2026-01"}, {"year": "2026"} or {"start": .., "end": ..},
+    # plus the requested "engine"
+    params: dict
+    status: Literal["queued", "running", "succeeded", "failed"] = "queued"
+
+    attempts: int = 0
+    max_attempts: int
+    run_after: datetime  # Not claimed before this (retry backoff)
+
+    # Lease held by the worker currently rendering the job
+    claimed_by: Optional[str] = None
+    lease_until: Optional[datetime] = None
+
+    result: Optional[dict] = None  # path, digest, transaction_count, cached
+    error: Optional[str] = None
+
+    campaign_id: Optional[str] = None  # Set on jobs queued by a report campaign
+
+    created_at: datetime
+    updated_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        populate_by_name = True
+        from_attributes = True
+
+
+class ReportCampaignInDB(BaseModel):
+    """
+    A fan-out of one statement to every active user (e.g. last month's
+    statements), run by app.tasks.report_campaign.
+    """
+
+    id: str = Field(alias="_id")
+    key: str  # e.g. "monthly:2026-01"; one campaign per statement
+    kind: Literal["monthly"] = "monthly"
+    params: dict
+    # enqueueing: users are still being scanned and queued
+    # enqueued: every job is queued; the workers are draining them
+    # completed: every job finished (succeeded or failed)
+    status: Literal["enqueueing", "enqueued", "completed"] = "enqueueing"
+
+    # Keyset position in the users collection; enqueueing resumes after it
+    cursor: Optional[str] = None
+    users_scanned: int = 0
+    users_skipped: int = 0  # No activity in the period
+    jobs_enqueued: int = 0
+
+    # Lease held by the process currently enqueueing
+    claimed_by: Optional[str] = None
+    lease_until: Optional[datetime] = None
+
+    created_at: datetime
+    updated_at: datetime
+    enqueued_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        populate_by_name = True
+        from_attributes = True
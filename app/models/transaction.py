@@ -23,6 +23,13 @@ class TransactionInDB(BaseModel):
     import_id: Optional[str] = None
     is_recurring: bool = False
 
+    # Recurring provenance (set on generated transactions)
+    recurring_id: Optional[str] = None
+    occurrence_date: Optional[datetime] = None
+
+    # Duplicate detection (see app/domain/fingerprint.py)
+    fingerprint: Optional[str] = None
+
     # ✅ SOFT DELETE
     is_deleted: bool = False
     deleted_at: Optional[datetime] = None
@@ -0,0 +1,55 @@
+"""
+Month-end statements for every active user.
+
+Queues (or resumes queueing) one statement job per user with activity in
+the month, then prints the campaign's progress; run report workers to
+render them. Defaults to last month:
+
+    python -m app.report_campaign [YYYY-MM]
+    python -m app.report_campaign --status [YYYY-MM]
+
+The scheduler does the same on the 1st when REPORT_CAMPAIGN_ENABLED is set.
+"""
+
+import argparse
+import asyncio
+import json
+from datetime import datetime
+
+from app.database import close_database_connection, connect_to_database
+from app.domain.dates import month_bounds
+from app.tasks.report_campaign import ReportCampaignRunner, previous_month
+
+
+async def main(month: str, *, status_only: bool) -> None:
+    await connect_to_database()
+
+    try:
+        runner = ReportCampaignRunner()
+
+        if status_only:
+            campaign = await runner.campaigns.get_by_key(f"monthly:{month}")
+            if campaign is None:
+                print(f"No campaign for {month}")
+                return
+        else:
+            campaign = await runner.run_monthly(month)
+
+        print(json.dumps(await runner.progress(campaign), indent=2))
+    finally:
+        await close_database_connection()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m app.report_campaign")
+    parser.add_argument("month", nargs="?", help="YYYY-MM (default: last month)")
+    parser.add_argument("--status", action="store_true", help="only show progress")
+    args = parser.parse_args()
+
+    month = args.month or previous_month(datetime.utcnow())
+    try:
+        month_bounds(month)
+    except ValueError:
+        parser.error("month must be in YYYY-MM format")
+
+    asyncio.run(main(month, status_only=args.status))
@@ -0,0 +1,46 @@
+"""
+Standalone report worker.
+
+Renders queued report jobs outside the API processes, so PDF rendering
+never competes with request latency:
+
+    python -m app.report_worker
+
+Run as many as needed; REPORT_MAX_RUNNING caps the total load.
+"""
+
+import asyncio
+import signal
+
+from app.database import close_database_connection, connect_to_database
+from app.services.browser_pool import browser_pool
+from app.services.report_store import REPORT_STORE_NOT_SHARED, ReportStore
+from app.tasks.report_worker import ReportWorker
+from app.utils.logger import get_logger
+
+logger = get_logger("pennywise.report_worker")
+
+
+async def main() -> None:
+    stop = asyncio.Event()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await connect_to_database()
+    if not await ReportStore().check_shared():
+        await close_database_connection()
+        # Its reports would be missing on the API side: refuse to start
+        raise RuntimeError(REPORT_STORE_NOT_SHARED)
+
+    try:
+        # Finishes the jobs in flight, then returns
+        await ReportWorker().run(stop)
+    finally:
+        await browser_pool.shutdown()
+        await close_database_connection()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
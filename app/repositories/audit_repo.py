@@ -38,3 +38,30 @@ class AuditRepository:
             doc["user_id"] = str(doc["user_id"])
 
         return AuditLogInDB(**doc)
+
+    async def create_many(self, entries: list[dict]) -> int:
+        """
+        Insert several audit records in one round trip.
+
+        Each entry takes the same keyword arguments as create().
+        """
+        if not entries:
+            return 0
+
+        now = datetime.utcnow()
+        docs = [
+            {
+                "action": entry["action"],
+                "user_id": ObjectId(entry["user_id"]) if entry.get("user_id") else None,
+                "entity": entry.get("entity"),
+                "entity_id": entry.get("entity_id"),
+                "metadata": entry.get("metadata") or {},
+                "ip_address": entry.get("ip_address"),
+                "user_agent": entry.get("user_agent"),
+                "created_at": now,
+            }
+            for entry in entries
+        ]
+
+        res = await self.col.insert_many(docs, ordered=False)
+        return len(res.inserted_ids)
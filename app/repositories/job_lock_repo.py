@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta
+
+from pymongo.errors import DuplicateKeyError
+
+from app.database import get_database
+
+
+class JobLockRepository:
+    """
+    Leases for scheduled jobs that must run once across all processes
+    (every process with SCHEDULER_ENABLED fires the same cron).
+
+    One document per job: {_id: name, claimed_by, lease_until, last_run_key}.
+    """
+
+    def __init__(self):
+        self.collection = get_database()["job_locks"]
+
+    async def acquire(
+        self,
+        name: str,
+        *,
+        run_key: str,
+        worker_id: str,
+        now: datetime,
+        lease_seconds: int,
+    ) -> bool:
+        """
+        Take the lease for run `run_key` (e.g. the day of a daily job).
+
+        Fails while another process holds a live lease, and once `run_key`
+        has completed, so replicas whose cron fires later skip the run. A
+        holder that crashed loses the lease when it expires.
+        """
+        try:
+            await self.collection.update_one(
+                {
+                    "_id": name,
+                    "last_run_key": {"$ne": run_key},
+                    "$or": [
+                        {"lease_until": None},
+                        {"lease_until": {"$lte": now}},
+                    ],
+                },
+                {
+                    "$set": {
+                        "claimed_by": worker_id,
+                        "lease_until": now + timedelta(seconds=lease_seconds),
+                    }
+                },
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            # The document exists but did not match: held, or already run
+            return False
+
+        doc = await self.collection.find_one({"_id": name}, {"claimed_by": 1})
+        return doc is not None and doc.get("claimed_by") == worker_id
+
+    async def renew(
+        self,
+        name: str,
+        *,
+        worker_id: str,
+        lease_seconds: int,
+    ) -> bool:
+        """
+        Returns:
+            False if the lease was lost, in which case the caller must stop
+        """
+        result = await self.collection.update_one(
+            {"_id": name, "claimed_by": worker_id},
+            {
+                "$set": {
+                    "lease_until": datetime.utcnow() + timedelta(seconds=lease_seconds)
+                }
+            },
+        )
+        return result.matched_count == 1
+
+    async def release(
+        self,
+        name: str,
+        *,
+        worker_id: str,
+        run_key: str | None = None,
+    ) -> None:
+        """Release the lease; with `run_key`, record that run as done."""
+        update: dict = {"$unset": {"claimed_by": "", "lease_until": ""}}
+        if run_key is not None:
+            update["$set"] = {"last_run_key": run_key}
+
+        await self.collection.update_one({"_id": name, "claimed_by": worker_id}, update)
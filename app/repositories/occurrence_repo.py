@@ -0,0 +1,88 @@
+from datetime import datetime
+from typing import List
+
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from app.database import get_database
+
+DUPLICATE_KEY = 11000
+
+OccurrenceKey = tuple[str, datetime]
+
+
+class RecurringOccurrenceRepository:
+    """
+    Ledger of materialized recurring occurrences.
+
+    One document per (recurring_id, occurrence_date), unique, holding the id
+    the occurrence's transaction is (or will be) inserted with. Reserving an
+    occurrence twice returns the original id, so re-running a rule can only
+    ever re-insert the same transaction, which the _id index rejects.
+    """
+
+    def __init__(self):
+        self.collection = get_database()["recurring_occurrences"]
+
+    # -------------------------------------------------
+    # Reserve transaction ids for occurrences (idempotent)
+    # -------------------------------------------------
+    async def reserve(
+        self,
+        occurrences: List[dict],
+    ) -> dict[OccurrenceKey, ObjectId]:
+        """
+        Args:
+            occurrences: dicts with recurring_id, occurrence_date, user_id
+
+        Returns:
+            (recurring_id, occurrence_date) -> transaction id
+        """
+        if not occurrences:
+            return {}
+
+        now = datetime.utcnow()
+        docs = [
+            {
+                "recurring_id": item["recurring_id"],
+                "occurrence_date": item["occurrence_date"],
+                "user_id": item["user_id"],
+                "transaction_id": ObjectId(),
+                "created_at": now,
+            }
+            for item in occurrences
+        ]
+
+        conflicts: list[dict] = []
+        try:
+            await self.collection.insert_many(docs, ordered=False)
+        except BulkWriteError as exc:
+            for error in exc.details.get("writeErrors", []):
+                if error.get("code") != DUPLICATE_KEY:
+                    raise
+                conflicts.append(docs[error["index"]])
+
+        reserved = {
+            (doc["recurring_id"], doc["occurrence_date"]): doc["transaction_id"]
+            for doc in docs
+        }
+
+        if conflicts:
+            # Already materialized earlier: reuse the original ids
+            cursor = self.collection.find(
+                {
+                    "$or": [
+                        {
+                            "recurring_id": doc["recurring_id"],
+                            "occurrence_date": doc["occurrence_date"],
+                        }
+                        for doc in conflicts
+                    ]
+                },
+                {"recurring_id": 1, "occurrence_date": 1, "transaction_id": 1},
+            )
+            async for doc in cursor:
+                key = (doc["recurring_id"], doc["occurrence_date"])
+                reserved[key] = doc["transaction_id"]
+
+        return reserved
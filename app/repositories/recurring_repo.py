@@ -1,15 +1,23 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Optional
+from uuid import uuid4
 
 from bson import ObjectId
+from pymongo import UpdateOne
 
 from app.database import get_database
 from app.models.recurring import RecurringTransactionInDB
+from app.repositories.version_repo import DataVersionRepository
+from app.utils.fieldsets import project_doc, to_projection
+
+VERSION_SCOPE = "recurring"
+RELEASE_LEASE = {"claimed_by": "", "claim_token": "", "lease_until": ""}
 
 
 class RecurringRepository:
     def __init__(self):
         self.collection = get_database()["recurring"]
+        self.versions = DataVersionRepository()
 
     # -------------------------------------------------
     # Create recurring transaction
@@ -26,9 +34,11 @@ class RecurringRepository:
             "created_at": datetime.utcnow(),
             "updated_at": datetime.utcnow(),
         }
+        doc.setdefault("schedule_anchor", doc["next_run_at"].day)
 
         result = await self.collection.insert_one(doc)
         doc["_id"] = str(result.inserted_id)
+        await self.versions.bump(user_id, VERSION_SCOPE)
 
         return RecurringTransactionInDB(**doc)
 
@@ -40,17 +50,22 @@ class RecurringRepository:
         *,
         user_id: str,
         recurring_id: str,
-    ) -> RecurringTransactionInDB | None:
+        fields: Optional[List[str]] = None,
+    ) -> RecurringTransactionInDB | dict | None:
         doc = await self.collection.find_one(
             {
                 "_id": ObjectId(recurring_id),
                 "user_id": user_id,
-            }
+            },
+            to_projection(fields) if fields else None,
         )
 
         if not doc:
             return None
 
+        if fields:
+            return project_doc(doc)
+
         doc["_id"] = str(doc["_id"])
         return RecurringTransactionInDB(**doc)
 
@@ -64,6 +79,8 @@ class RecurringRepository:
         payload: dict,
     ) -> RecurringTransactionInDB | None:
         payload["updated_at"] = datetime.utcnow()
+        if payload.get("next_run_at"):
+            payload["schedule_anchor"] = payload["next_run_at"].day
 
         doc = await self.collection.find_one_and_update(
             {
@@ -77,6 +94,8 @@ class RecurringRepository:
         if not doc:
             return None
 
+        await self.versions.bump(user_id, VERSION_SCOPE)
+
         doc["_id"] = str(doc["_id"])
         return RecurringTransactionInDB(**doc)
 
@@ -101,7 +120,11 @@ class RecurringRepository:
             },
         )
 
-        return result.modified_count == 1
+        if result.modified_count != 1:
+            return False
+
+        await self.versions.bump(user_id, VERSION_SCOPE)
+        return True
 
     # -------------------------------------------------
     # List with pagination and filters
@@ -116,7 +139,8 @@ class RecurringRepository:
         transaction_type: Optional[str] = None,
         page: int,
         limit: int,
-    ) -> tuple[list[RecurringTransactionInDB], int]:
+        fields: Optional[List[str]] = None,
+    ) -> tuple[list[RecurringTransactionInDB] | list[dict], int]:
         skip = (page - 1) * limit
 
         base_filter = {
@@ -137,13 +161,18 @@ class RecurringRepository:
 
         total = await self.collection.count_documents(base_filter)
 
+        projection = to_projection(fields) if fields else None
+
         cursor = (
-            self.collection.find(base_filter)
+            self.collection.find(base_filter, projection)
             .sort("created_at", -1)
             .skip(skip)
             .limit(limit)
         )
 
+        if fields:
+            return [project_doc(doc) async for doc in cursor], total
+
         results: list[RecurringTransactionInDB] = []
 
         async for doc in cursor:
@@ -153,43 +182,156 @@ class RecurringRepository:
         return results, total
 
     # -------------------------------------------------
-    # Get due recurring transactions for execution
+    # Due-queue depth and oldest due time (metrics)
     # -------------------------------------------------
-    async def get_due_rules(
+    async def due_queue_stats(
         self,
-    ) -> List[RecurringTransactionInDB]:
-        cursor = self.collection.find(
-            {
-                "active": True,
-                "next_run_at": {"$lte": datetime.utcnow()},
-            }
+        *,
+        now: datetime,
+    ) -> tuple[int, Optional[datetime]]:
+        query = {
+            "active": True,
+            "next_run_at": {"$lte": now},
+        }
+
+        due = await self.collection.count_documents(query)
+        oldest = await self.collection.find_one(
+            query,
+            {"next_run_at": 1},
+            sort=[("next_run_at", 1)],
         )
 
-        results = []
-        async for doc in cursor:
-            doc["_id"] = str(doc["_id"])
-            results.append(RecurringTransactionInDB(**doc))
+        return due, oldest["next_run_at"] if oldest else None
 
-        return results
+    # -------------------------------------------------
+    # Claim a batch of due rules (lease)
+    # -------------------------------------------------
+    async def claim_due_batch(
+        self,
+        *,
+        worker_id: str,
+        now: datetime,
+        lease_seconds: int,
+        limit: int,
+    ) -> List[RecurringTransactionInDB]:
+        """
+        Claim up to `limit` due rules in three round trips.
+
+        Candidates are leased with one update_many that re-checks the lease
+        filter, so a rule taken by another worker in between is skipped. A
+        per-batch claim token identifies exactly the rules this call won.
+        Returns an empty list only when nothing is left to claim.
+        """
+        claimable = {
+            "active": True,
+            "next_run_at": {"$lte": now},
+            "$or": [
+                {"lease_until": None},
+                {"lease_until": {"$lte": now}},
+            ],
+        }
+
+        while True:
+            candidates = (
+                await self.collection.find(claimable, {"_id": 1})
+                .sort("next_run_at", 1)
+                .limit(limit)
+                .to_list(limit)
+            )
+            if not candidates:
+                return []
+
+            ids = [doc["_id"] for doc in candidates]
+            token = uuid4().hex
+
+            await self.collection.update_many(
+                {**claimable, "_id": {"$in": ids}},
+                {
+                    "$set": {
+                        "claimed_by": worker_id,
+                        "claim_token": token,
+                        "lease_until": now + timedelta(seconds=lease_seconds),
+                    }
+                },
+            )
+
+            claimed = []
+            async for doc in self.collection.find(
+                {"_id": {"$in": ids}, "claim_token": token}
+            ).sort("next_run_at", 1):
+                doc["_id"] = str(doc["_id"])
+                claimed.append(RecurringTransactionInDB(**doc))
+
+            # Lost every candidate to other workers: look again
+            if claimed:
+                return claimed
 
     # -------------------------------------------------
-    # Mark recurring transaction as executed
+    # Advance many executed rules in one bulk write
     # -------------------------------------------------
-    async def mark_executed(
+    async def advance_many(
         self,
-        recurring_id: str,
-    ) -> bool:
-        result = await self.collection.update_one(
-            {"_id": ObjectId(recurring_id)},
-            {
-                "$set": {
-                    "last_executed_at": datetime.utcnow(),
-                    "updated_at": datetime.utcnow(),
-                }
-            },
+        advances: List[tuple[RecurringTransactionInDB, datetime]],
+        *,
+        executed_at: datetime,
+    ) -> set[str]:
+        """
+        Set next_run_at/last_executed_at and release the lease of each rule.
+
+        Rules claimed in a batch are fenced by their claim token, so a
+        batch whose lease expired and was re-claimed cannot advance them.
+
+        Returns:
+            Ids of the rules that were advanced
+        """
+        if not advances:
+            return set()
+
+        # Mongo keeps milliseconds; match what is stored when reading back
+        executed_at = executed_at.replace(
+            microsecond=executed_at.microsecond // 1000 * 1000
+        )
+
+        ops = []
+        for rule, next_run_at in advances:
+            query: dict = {"_id": ObjectId(rule.id)}
+            if rule.claim_token:
+                query["claim_token"] = rule.claim_token
+
+            ops.append(
+                UpdateOne(
+                    query,
+                    {
+                        "$set": {
+                            "next_run_at": next_run_at,
+                            "last_executed_at": executed_at,
+                            "updated_at": executed_at,
+                        },
+                        "$unset": RELEASE_LEASE,
+                    },
+                )
+            )
+
+        result = await self.collection.bulk_write(ops, ordered=False)
+
+        advanced = {rule.id for rule, _ in advances}
+        if result.matched_count != len(ops):
+            # Some leases were lost: only rules stamped by this batch count
+            cursor = self.collection.find(
+                {
+                    "_id": {"$in": [ObjectId(rule_id) for rule_id in advanced]},
+                    "last_executed_at": executed_at,
+                },
+                {"_id": 1},
+            )
+            advanced = {str(doc["_id"]) async for doc in cursor}
+
+        await self.versions.bump_many(
+            (rule.user_id for rule, _ in advances if rule.id in advanced),
+            VERSION_SCOPE,
         )
 
-        return result.modified_count == 1
+        return advanced
 
     # -------------------------------------------------
     # Get all recurring transactions for a user
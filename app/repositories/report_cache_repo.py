@@ -0,0 +1,109 @@
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+from pymongo import ReturnDocument
+
+from app.database import get_database
+
+
+class ReportCacheRepository:
+    """
+    Index of rendered reports: cache key -> content digest of the PDF blob
+    (see ReportStore).
+    """
+
+    def __init__(self):
+        self.collection = get_database()["report_cache"]
+        self.meta = get_database()["report_store_meta"]
+
+    # -------------------------------------------------
+    # Lookup (marks the entry as used)
+    # -------------------------------------------------
+    async def get(self, key: str) -> Optional[dict]:
+        return await self.collection.find_one_and_update(
+            {"_id": key},
+            {"$set": {"last_used_at": datetime.utcnow()}},
+            return_document=ReturnDocument.AFTER,
+        )
+
+    # -------------------------------------------------
+    # Store
+    # -------------------------------------------------
+    async def put(
+        self,
+        key: str,
+        *,
+        digest: str,
+        size: int,
+        metadata: dict,
+    ) -> Optional[str]:
+        """
+        Returns:
+            Digest the key pointed to before, if it changed
+        """
+        now = datetime.utcnow()
+        previous = await self.collection.find_one_and_update(
+            {"_id": key},
+            {
+                "$set": {
+                    "digest": digest,
+                    "size": size,
+                    "metadata": metadata,
+                    "created_at": now,
+                    "last_used_at": now,
+                }
+            },
+            upsert=True,
+            projection={"digest": 1},
+        )
+
+        if previous and previous["digest"] != digest:
+            return previous["digest"]
+        return None
+
+    # -------------------------------------------------
+    # Eviction helpers
+    # -------------------------------------------------
+    async def total_size(self) -> int:
+        rows = await self.collection.aggregate(
+            [{"$group": {"_id": None, "size": {"$sum": "$size"}}}]
+        ).to_list(1)
+        return rows[0]["size"] if rows else 0
+
+    async def least_recently_used(
+        self,
+        *,
+        used_before: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> List[dict]:
+        query = {"last_used_at": {"$lt": used_before}} if used_before else {}
+        cursor = (
+            self.collection.find(query, {"digest": 1, "size": 1})
+            .sort("last_used_at", 1)
+            .limit(limit)
+        )
+        return await cursor.to_list(limit)
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        await self.collection.delete_many({"_id": {"$in": list(keys)}})
+
+    async def referenced_digests(self, digests: Iterable[str]) -> set[str]:
+        cursor = self.collection.find(
+            {"digest": {"$in": list(digests)}},
+            {"digest": 1, "_id": 0},
+        )
+        return {doc["digest"] async for doc in cursor}
+
+    # -------------------------------------------------
+    # Store identity (see ReportStore.check_shared)
+    # -------------------------------------------------
+    async def get_store_token(self) -> Optional[str]:
+        doc = await self.meta.find_one({"_id": "store"})
+        return doc["token"] if doc else None
+
+    async def set_store_token(self, token: str) -> None:
+        await self.meta.update_one(
+            {"_id": "store"},
+            {"$set": {"token": token, "updated_at": datetime.utcnow()}},
+            upsert=True,
+        )
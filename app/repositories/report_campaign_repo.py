@@ -0,0 +1,171 @@
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+
+from app.database import get_database
+from app.models.report import ReportCampaignInDB
+
+
+class ReportCampaignRepository:
+    def __init__(self):
+        self.collection = get_database()["report_campaigns"]
+
+    # -------------------------------------------------
+    # Get or create (one campaign per key)
+    # -------------------------------------------------
+    async def get_or_create(
+        self,
+        *,
+        key: str,
+        kind: str,
+        params: dict,
+    ) -> ReportCampaignInDB:
+        now = datetime.utcnow()
+        doc = await self.collection.find_one_and_update(
+            {"key": key},
+            {
+                "$setOnInsert": {
+                    "key": key,
+                    "kind": kind,
+                    "params": params,
+                    "status": "enqueueing",
+                    "cursor": None,
+                    "users_scanned": 0,
+                    "users_skipped": 0,
+                    "jobs_enqueued": 0,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+
+        doc["_id"] = str(doc["_id"])
+        return ReportCampaignInDB(**doc)
+
+    async def get_by_key(self, key: str) -> Optional[ReportCampaignInDB]:
+        doc = await self.collection.find_one({"key": key})
+
+        if not doc:
+            return None
+
+        doc["_id"] = str(doc["_id"])
+        return ReportCampaignInDB(**doc)
+
+    async def list_recent(self, *, limit: int = 12) -> List[ReportCampaignInDB]:
+        cursor = self.collection.find().sort("created_at", -1).limit(limit)
+
+        results = []
+        async for doc in cursor:
+            doc["_id"] = str(doc["_id"])
+            results.append(ReportCampaignInDB(**doc))
+
+        return results
+
+    # -------------------------------------------------
+    # Enqueueing lease
+    # -------------------------------------------------
+    async def claim(
+        self,
+        campaign_id: str,
+        *,
+        worker_id: str,
+        now: datetime,
+        lease_seconds: int,
+    ) -> Optional[ReportCampaignInDB]:
+        """
+        Take (or renew) the right to enqueue this campaign. Free when no
+        one holds it or the holder's lease expired, so a crashed run is
+        resumed from its cursor by the next scheduler tick.
+        """
+        doc = await self.collection.find_one_and_update(
+            {
+                "_id": ObjectId(campaign_id),
+                "status": "enqueueing",
+                "$or": [
+                    {"claimed_by": None},
+                    {"claimed_by": worker_id},
+                    {"lease_until": {"$lte": now}},
+                ],
+            },
+            {
+                "$set": {
+                    "claimed_by": worker_id,
+                    "lease_until": now + timedelta(seconds=lease_seconds),
+                    "updated_at": now,
+                }
+            },
+            return_document=ReturnDocument.AFTER,
+        )
+
+        if not doc:
+            return None
+
+        doc["_id"] = str(doc["_id"])
+        return ReportCampaignInDB(**doc)
+
+    async def advance(
+        self,
+        campaign_id: str,
+        *,
+        worker_id: str,
+        cursor: str,
+        scanned: int,
+        skipped: int,
+        enqueued: int,
+        lease_seconds: int,
+    ) -> bool:
+        """
+        Record a processed chunk and extend the lease.
+
+        Returns:
+            False if the lease was lost (another process took over), in
+            which case the caller must stop
+        """
+        now = datetime.utcnow()
+        result = await self.collection.update_one(
+            {
+                "_id": ObjectId(campaign_id),
+                "status": "enqueueing",
+                "claimed_by": worker_id,
+            },
+            {
+                "$set": {
+                    "cursor": cursor,
+                    "lease_until": now + timedelta(seconds=lease_seconds),
+                    "updated_at": now,
+                },
+                "$inc": {
+                    "users_scanned": scanned,
+                    "users_skipped": skipped,
+                    "jobs_enqueued": enqueued,
+                },
+            },
+        )
+        return result.modified_count == 1
+
+    async def mark_enqueued(self, campaign_id: str, *, worker_id: str) -> bool:
+        now = datetime.utcnow()
+        result = await self.collection.update_one(
+            {
+                "_id": ObjectId(campaign_id),
+                "status": "enqueueing",
+                "claimed_by": worker_id,
+            },
+            {
+                "$set": {"status": "enqueued", "enqueued_at": now, "updated_at": now},
+                "$unset": {"claimed_by": "", "lease_until": ""},
+            },
+        )
+        return result.modified_count == 1
+
+    async def mark_completed(self, campaign_id: str) -> bool:
+        now = datetime.utcnow()
+        result = await self.collection.update_one(
+            {"_id": ObjectId(campaign_id), "status": "enqueued"},
+            {"$set": {"status": "completed", "finished_at": now, "updated_at": now}},
+        )
+        return result.modified_count == 1
@@ -0,0 +1,343 @@
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError
+
+from app.database import get_database
+from app.models.report import ReportJobInDB
+
+ACTIVE_STATUSES = ["queued", "running"]
+DUPLICATE_KEY = 11000
+
+
+class ReportJobRepository:
+    def __init__(self):
+        self.collection = get_database()["report_jobs"]
+
+    # -------------------------------------------------
+    # Enqueue (deduplicated)
+    # -------------------------------------------------
+    async def enqueue(
+        self,
+        *,
+        user_id: str,
+        kind: str,
+        params: dict,
+        max_attempts: int,
+    ) -> ReportJobInDB:
+        """
+        Queue a job, or return the identical job that is still queued or
+        running, so repeated clicks don't render the same report twice.
+        """
+        existing = await self.collection.find_one(
+            {
+                "user_id": user_id,
+                "kind": kind,
+                "params": params,
+                "status": {"$in": ACTIVE_STATUSES},
+            }
+        )
+        if existing:
+            existing["_id"] = str(existing["_id"])
+            return ReportJobInDB(**existing)
+
+        now = datetime.utcnow()
+        doc = {
+            "user_id": user_id,
+            "kind": kind,
+            "params": params,
+            "status": "queued",
+            "attempts": 0,
+            "max_attempts": max_attempts,
+            "run_after": now,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+        result = await self.collection.insert_one(doc)
+        doc["_id"] = str(result.inserted_id)
+
+        return ReportJobInDB(**doc)
+
+    async def enqueue_many(
+        self,
+        *,
+        user_ids: List[str],
+        kind: str,
+        params: dict,
+        max_attempts: int,
+        campaign_id: str,
+    ) -> int:
+        """
+        Queue one job per user for a campaign, in one insert.
+
+        Users that already have a job in this campaign are skipped by the
+        unique (campaign_id, user_id) index, so a chunk replayed after a
+        crash, or by a second runner, is not queued twice.
+
+        Returns:
+            number of jobs queued
+        """
+        if not user_ids:
+            return 0
+
+        now = datetime.utcnow()
+        docs = [
+            {
+                "user_id": user_id,
+                "kind": kind,
+                "params": params,
+                "status": "queued",
+                "attempts": 0,
+                "max_attempts": max_attempts,
+                "run_after": now,
+                "campaign_id": campaign_id,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for user_id in user_ids
+        ]
+
+        try:
+            result = await self.collection.insert_many(docs, ordered=False)
+        except BulkWriteError as exc:
+            for error in exc.details.get("writeErrors", []):
+                if error.get("code") != DUPLICATE_KEY:
+                    raise
+            return exc.details.get("nInserted", 0)
+
+        return len(result.inserted_ids)
+
+    # -------------------------------------------------
+    # Get by ID
+    # -------------------------------------------------
+    async def get_by_id(
+        self,
+        *,
+        user_id: str,
+        job_id: str,
+    ) -> Optional[ReportJobInDB]:
+        doc = await self.collection.find_one(
+            {"_id": ObjectId(job_id), "user_id": user_id}
+        )
+
+        if not doc:
+            return None
+
+        doc["_id"] = str(doc["_id"])
+        return ReportJobInDB(**doc)
+
+    # -------------------------------------------------
+    # Claim next job (worker)
+    # -------------------------------------------------
+    async def claim_next(
+        self,
+        *,
+        worker_id: str,
+        now: datetime,
+        lease_seconds: int,
+        max_running: int,
+        max_running_per_user: int,
+    ) -> Optional[ReportJobInDB]:
+        """
+        Claim the oldest runnable job, respecting the concurrency caps.
+
+        - Global: no claim while `max_running` jobs hold a live lease,
+          across all workers
+        - Per user: users with `max_running_per_user` live jobs are skipped,
+          so one user's backlog cannot starve everyone else
+
+        The caps are checked just before the atomic claim; two workers
+        racing can overshoot by one job, which is fine for load shedding.
+        Jobs whose lease expired (crashed worker) are claimable again.
+        """
+        running = await self.collection.aggregate(
+            [
+                {"$match": {"status": "running", "lease_until": {"$gt": now}}},
+                {"$group": {"_id": "$user_id", "count": {"$sum": 1}}},
+            ]
+        ).to_list(None)
+
+        if sum(row["count"] for row in running) >= max_running:
+            return None
+
+        busy_users = [
+            row["_id"] for row in running if row["count"] >= max_running_per_user
+        ]
+
+        doc = await self.collection.find_one_and_update(
+            {
+                "user_id": {"$nin": busy_users},
+                # Expired jobs out of attempts are left to fail_abandoned
+                "$expr": {"$lt": ["$attempts", "$max_attempts"]},
+                "$or": [
+                    {"status": "queued", "run_after": {"$lte": now}},
+                    {"status": "running", "lease_until": {"$lte": now}},
+                ],
+            },
+            {
+                "$set": {
+                    "status": "running",
+                    "claimed_by": worker_id,
+                    "lease_until": now + timedelta(seconds=lease_seconds),
+                    "started_at": now,
+                    "updated_at": now,
+                },
+                "$inc": {"attempts": 1},
+            },
+            sort=[("run_after", 1)],
+            return_document=ReturnDocument.AFTER,
+        )
+
+        if not doc:
+            return None
+
+        doc["_id"] = str(doc["_id"])
+        return ReportJobInDB(**doc)
+
+    # -------------------------------------------------
+    # Keep a claimed job's lease alive
+    # -------------------------------------------------
+    async def renew(
+        self,
+        job_id: str,
+        *,
+        worker_id: str,
+        lease_seconds: int,
+    ) -> bool:
+        """
+        Returns:
+            False if the lease was lost, in which case the caller must stop
+        """
+        now = datetime.utcnow()
+        result = await self.collection.update_one(
+            {"_id": ObjectId(job_id), "status": "running", "claimed_by": worker_id},
+            {
+                "$set": {
+                    "lease_until": now + timedelta(seconds=lease_seconds),
+                    "updated_at": now,
+                }
+            },
+        )
+        return result.matched_count == 1
+
+    # -------------------------------------------------
+    # Finish a claimed job
+    # -------------------------------------------------
+    async def complete(
+        self,
+        job_id: str,
+        *,
+        worker_id: str,
+        result: dict,
+    ) -> bool:
+        return await self._finish(
+            job_id,
+            worker_id=worker_id,
+            update={"status": "succeeded", "result": result, "error": None},
+        )
+
+    async def fail(
+        self,
+        job_id: str,
+        *,
+        worker_id: str,
+        error: str,
+        retry_at: Optional[datetime] = None,
+    ) -> bool:
+        """
+        Requeue the job for `retry_at`, or fail it for good when no retry
+        time is given.
+        """
+        if retry_at is None:
+            update = {"status": "failed", "error": error}
+        else:
+            update = {"status": "queued", "error": error, "run_after": retry_at}
+
+        return await self._finish(job_id, worker_id=worker_id, update=update)
+
+    async def _finish(self, job_id: str, *, worker_id: str, update: dict) -> bool:
+        """
+        Fenced by the lease holder: a worker whose lease expired and was
+        taken over cannot overwrite the new owner's outcome.
+        """
+        now = datetime.utcnow()
+        if update["status"] != "queued":
+            update["finished_at"] = now
+
+        result = await self.collection.update_one(
+            {"_id": ObjectId(job_id), "status": "running", "claimed_by": worker_id},
+            {
+                "$set": {**update, "updated_at": now},
+                "$unset": {"claimed_by": "", "lease_until": ""},
+            },
+        )
+        return result.modified_count == 1
+
+    # -------------------------------------------------
+    # Give up on jobs that keep crashing their worker
+    # -------------------------------------------------
+    async def fail_abandoned(self, *, now: datetime) -> int:
+        """
+        Jobs whose lease expired after their last attempt would otherwise
+        stay "running" forever.
+        """
+        result = await self.collection.update_many(
+            {
+                "status": "running",
+                "lease_until": {"$lte": now},
+                "$expr": {"$gte": ["$attempts", "$max_attempts"]},
+            },
+            {
+                "$set": {
+                    "status": "failed",
+                    "error": "Worker lost the job too many times",
+                    "finished_at": now,
+                    "updated_at": now,
+                },
+                "$unset": {"claimed_by": "", "lease_until": ""},
+            },
+        )
+        return result.modified_count
+
+    # -------------------------------------------------
+    # Queue depth (monitoring)
+    # -------------------------------------------------
+    async def status_counts(self) -> dict[str, int]:
+        rows = await self.collection.aggregate(
+            [
+                {"$match": {"status": {"$in": ACTIVE_STATUSES}}},
+                {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+            ]
+        ).to_list(None)
+        return {row["_id"]: row["count"] for row in rows}
+
+    async def campaign_status_counts(self, campaign_id: str) -> dict[str, int]:
+        rows = await self.collection.aggregate(
+            [
+                {"$match": {"campaign_id": campaign_id}},
+                {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+            ]
+        ).to_list(None)
+        return {row["_id"]: row["count"] for row in rows}
+
+    async def list_for_user(
+        self,
+        *,
+        user_id: str,
+        limit: int = 20,
+    ) -> List[ReportJobInDB]:
+        cursor = (
+            self.collection.find({"user_id": user_id})
+            .sort("created_at", -1)
+            .limit(limit)
+        )
+
+        results = []
+        async for doc in cursor:
+            doc["_id"] = str(doc["_id"])
+            results.append(ReportJobInDB(**doc))
+
+        return results
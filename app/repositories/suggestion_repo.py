@@ -0,0 +1,145 @@
+from datetime import datetime
+from typing import List, Optional
+
+from bson import ObjectId
+from pymongo import ReturnDocument, UpdateOne
+
+from app.database import get_database
+from app.models.recurring import RecurringSuggestionInDB
+
+
+class RecurringSuggestionRepository:
+    def __init__(self):
+        self.collection = get_database()["recurring_suggestions"]
+
+    # -------------------------------------------------
+    # Replace pending suggestions of many users (batch job)
+    # -------------------------------------------------
+    async def replace_pending(
+        self,
+        suggestions_by_user: dict[str, List[dict]],
+    ) -> int:
+        """
+        Upsert the latest suggestions of each user and drop pending ones that
+        were not detected again. Accepted/dismissed suggestions keep their
+        status, so a dismissed series is not suggested twice.
+
+        Returns:
+            Number of suggestions written
+        """
+        if not suggestions_by_user:
+            return 0
+
+        # Millisecond precision, as stored, so the cleanup below can tell
+        # this run's writes apart
+        now = datetime.utcnow()
+        now = now.replace(microsecond=now.microsecond // 1000 * 1000)
+        ops = []
+
+        for user_id, suggestions in suggestions_by_user.items():
+            for suggestion in suggestions:
+                ops.append(
+                    UpdateOne(
+                        {"user_id": user_id, "key": suggestion["key"]},
+                        {
+                            "$set": {**suggestion, "updated_at": now},
+                            "$setOnInsert": {
+                                "status": "pending",
+                                "created_at": now,
+                            },
+                        },
+                        upsert=True,
+                    )
+                )
+
+        if ops:
+            await self.collection.bulk_write(ops, ordered=False)
+
+        await self.collection.delete_many(
+            {
+                "user_id": {"$in": list(suggestions_by_user)},
+                "status": "pending",
+                "updated_at": {"$lt": now},
+            }
+        )
+
+        return len(ops)
+
+    # -------------------------------------------------
+    # List suggestions (ranked)
+    # -------------------------------------------------
+    async def list_for_user(
+        self,
+        *,
+        user_id: str,
+        status: str = "pending",
+        limit: int = 50,
+    ) -> List[RecurringSuggestionInDB]:
+        cursor = (
+            self.collection.find({"user_id": user_id, "status": status})
+            .sort("confidence", -1)
+            .limit(limit)
+        )
+
+        results = []
+        async for doc in cursor:
+            doc["_id"] = str(doc["_id"])
+            results.append(RecurringSuggestionInDB(**doc))
+
+        return results
+
+    # -------------------------------------------------
+    # Get by ID
+    # -------------------------------------------------
+    async def get_by_id(
+        self,
+        *,
+        user_id: str,
+        suggestion_id: str,
+    ) -> Optional[RecurringSuggestionInDB]:
+        doc = await self.collection.find_one(
+            {"_id": ObjectId(suggestion_id), "user_id": user_id}
+        )
+
+        if not doc:
+            return None
+
+        doc["_id"] = str(doc["_id"])
+        return RecurringSuggestionInDB(**doc)
+
+    # -------------------------------------------------
+    # Resolve a pending suggestion (accept / dismiss)
+    # -------------------------------------------------
+    async def resolve(
+        self,
+        *,
+        user_id: str,
+        suggestion_id: str,
+        status: str,
+        recurring_id: Optional[str] = None,
+    ) -> Optional[RecurringSuggestionInDB]:
+        """
+        Only pending suggestions can be resolved; returns None otherwise, so
+        a double submit cannot create two rules.
+        """
+        doc = await self.collection.find_one_and_update(
+            {
+                "_id": ObjectId(suggestion_id),
+                "user_id": user_id,
+                "status": "pending",
+            },
+            {
+                "$set": {
+                    "status": status,
+                    "recurring_id": recurring_id,
+                    "updated_at": datetime.utcnow(),
+                }
+            },
+            return_document=ReturnDocument.AFTER,
+        )
+
+        if not doc:
+            return None
+
+        doc["_id"] = str(doc["_id"])
+        return RecurringSuggestionInDB(**doc)
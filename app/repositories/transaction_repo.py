@@ -1,17 +1,38 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError
 
 from app.database import get_database
+from app.domain.dates import month_bounds
+from app.domain.fingerprint import fingerprint_for
 from app.errors.base import AppError
 from app.errors.codes import ErrorCode
 from app.models.transaction import TransactionInDB
+from app.repositories.version_repo import DataVersionRepository
+from app.utils.cursors import decode_cursor, encode_cursor
+from app.utils.fieldsets import project_doc, to_projection
+
+VERSION_SCOPE = "transactions"
+FINGERPRINT_FIELDS = {"date", "amount", "type", "description"}
+DUPLICATE_KEY = 11000
+
+
+def month_scope(month: str) -> str:
+    """Data version scope of one month ("YYYY-MM") of transactions."""
+    return f"tx_months.{month}"
+
+
+def month_scopes(*dates: datetime) -> set[str]:
+    return {month_scope(value.strftime("%Y-%m")) for value in dates}
 
 
 class TransactionRepository:
     def __init__(self):
         self.collection = get_database()["transactions"]
+        self.versions = DataVersionRepository()
 
     # -------------------------------------------------
     # Create single transaction
@@ -29,9 +50,13 @@ class TransactionRepository:
             "created_at": datetime.utcnow(),
             "updated_at": datetime.utcnow(),
         }
+        doc.setdefault("fingerprint", fingerprint_for(doc))
 
         result = await self.collection.insert_one(doc)
         doc["_id"] = str(result.inserted_id)
+        await self.versions.bump(
+            user_id, VERSION_SCOPE, extra_scopes=month_scopes(doc["date"])
+        )
 
         return TransactionInDB(**doc)
 
@@ -52,25 +77,117 @@ class TransactionRepository:
 
         docs = []
         for payload in transactions:
-            docs.append(
-                {
-                    **payload,
-                    "user_id": user_id,
-                    "import_id": import_id,
-                    "is_deleted": False,
-                    "deleted_at": None,
-                    "created_at": now,
-                    "updated_at": now,
-                }
-            )
+            doc = {
+                **payload,
+                "user_id": user_id,
+                "import_id": import_id,
+                "is_deleted": False,
+                "deleted_at": None,
+                "created_at": now,
+                "updated_at": now,
+            }
+            doc.setdefault("fingerprint", fingerprint_for(doc))
+            docs.append(doc)
 
         result = await self.collection.insert_many(docs)
 
         for doc, oid in zip(docs, result.inserted_ids):
             doc["_id"] = str(oid)
 
+        await self.versions.bump(
+            user_id,
+            VERSION_SCOPE,
+            extra_scopes=month_scopes(*(doc["date"] for doc in docs)),
+        )
+
         return [TransactionInDB(**doc) for doc in docs]
 
+    # -------------------------------------------------
+    # Insert transactions of many users in one batch (background jobs)
+    # -------------------------------------------------
+    async def bulk_insert(
+        self,
+        *,
+        transactions: List[dict],
+        ignore_duplicates: bool = False,
+    ) -> tuple[List[TransactionInDB], set[int]]:
+        """
+        Insert generated transactions; each payload carries its user_id.
+
+        The insert is unordered, so one bad document does not stop the rest.
+        With `ignore_duplicates`, payloads whose preset _id already exists
+        count as done: they are neither created nor failed.
+
+        Returns:
+            (created transactions, indexes of payloads that failed)
+        """
+        if not transactions:
+            return [], set()
+
+        now = datetime.utcnow()
+
+        docs = []
+        for payload in transactions:
+            doc = {
+                "is_deleted": False,
+                "deleted_at": None,
+                "created_at": now,
+                "updated_at": now,
+                **payload,
+            }
+            doc.setdefault("fingerprint", fingerprint_for(doc))
+            docs.append(doc)
+
+        failed: set[int] = set()
+        existing: set[int] = set()
+        try:
+            await self.collection.insert_many(docs, ordered=False)
+        except BulkWriteError as exc:
+            for error in exc.details.get("writeErrors", []):
+                if ignore_duplicates and error.get("code") == DUPLICATE_KEY:
+                    existing.add(error["index"])
+                else:
+                    failed.add(error["index"])
+
+        # insert_many assigns _id client-side, so every doc has one here
+        created = []
+        for index, doc in enumerate(docs):
+            if index in failed or index in existing:
+                continue
+            doc["_id"] = str(doc["_id"])
+            created.append(TransactionInDB(**doc))
+
+        months: dict[str, set[str]] = {}
+        for tx in created:
+            months.setdefault(tx.user_id, set()).update(month_scopes(tx.date))
+
+        await self.versions.bump_many(months, VERSION_SCOPE, extra_scopes=months)
+
+        return created, failed
+
+    # -------------------------------------------------
+    # Fingerprints already present for a user (one $in query)
+    # -------------------------------------------------
+    async def find_existing_fingerprints(
+        self,
+        *,
+        user_id: str,
+        fingerprints: List[str],
+    ) -> set[str]:
+        if not fingerprints:
+            return set()
+
+        cursor = self.collection.find(
+            {
+                "user_id": user_id,
+                "is_deleted": False,
+                "fingerprint": {"$in": fingerprints},
+            },
+            {"fingerprint": 1, "_id": 0},
+        )
+
+        return {doc["fingerprint"] async for doc in cursor}
+
     # -------------------------------------------------
     # Update
     # -------------------------------------------------
@@ -82,18 +199,53 @@ class TransactionRepository:
     ) -> TransactionInDB | None:
         payload["updated_at"] = datetime.utcnow()
 
-        doc = await self.collection.find_one_and_update(
-            {
-                "_id": ObjectId(transaction_id),
-                "user_id": user_id,
-                "is_deleted": False,
-            },
-            {"$set": payload},
-            return_document=True,
-        )
+        query = {
+            "_id": ObjectId(transaction_id),
+            "user_id": user_id,
+            "is_deleted": False,
+        }
 
-        if not doc:
-            return None
+        while True:
+            update = payload
+            pinned: dict = {}
+
+            # Keep the fingerprint in step with the identifying fields, in
+            # the same write. It also depends on the identifying fields the
+            # payload leaves alone: pin them to the values it was computed
+            # from, and start over if a concurrent update changed them.
+            if FINGERPRINT_FIELDS.intersection(payload):
+                current = await self.collection.find_one(
+                    query, {field: 1 for field in FINGERPRINT_FIELDS}
+                )
+                if not current:
+                    return None
+
+                pinned = {
+                    field: current.get(field)
+                    for field in FINGERPRINT_FIELDS - payload.keys()
+                }
+                update = {
+                    **payload,
+                    "fingerprint": fingerprint_for({**pinned, **payload}),
+                }
+
+            # Previous state: a date change touches two months
+            doc = await self.collection.find_one_and_update(
+                {**query, **pinned},
+                {"$set": update},
+                return_document=ReturnDocument.BEFORE,
+            )
+
+            if doc:
+                break
+            if not pinned:
+                return None
+
+        touched = month_scopes(doc["date"])
+        doc.update(update)
+        touched |= month_scopes(doc["date"])
+
+        await self.versions.bump(user_id, VERSION_SCOPE, extra_scopes=touched)
 
         doc["_id"] = str(doc["_id"])
         return TransactionInDB(**doc)
@@ -106,7 +258,7 @@ class TransactionRepository:
         user_id: str,
         transaction_id: str,
     ) -> bool:
-        result = await self.collection.update_one(
+        doc = await self.collection.find_one_and_update(
             {
                 "_id": ObjectId(transaction_id),
                 "user_id": user_id,
@@ -119,9 +271,16 @@ class TransactionRepository:
                     "updated_at": datetime.utcnow(),
                 }
             },
+            projection={"date": 1},
         )
 
-        return result.modified_count == 1
+        if not doc:
+            return False
+
+        await self.versions.bump(
+            user_id, VERSION_SCOPE, extra_scopes=month_scopes(doc["date"])
+        )
+        return True
 
     # -------------------------------------------------
     # Get by ID
@@ -131,17 +290,22 @@ class TransactionRepository:
         *,
         user_id: str,
         transaction_id: str,
-    ) -> TransactionInDB | None:
+        fields: Optional[List[str]] = None,
+    ) -> TransactionInDB | dict | None:
         doc = await self.collection.find_one(
             {
                 "_id": ObjectId(transaction_id),
                 "user_id": user_id,
-            }
+            },
+            to_projection(fields) if fields else None,
         )
 
         if not doc:
             return None
 
+        if fields:
+            return project_doc(doc)
+
         doc["_id"] = str(doc["_id"])
         return TransactionInDB(**doc)
 
@@ -155,7 +319,8 @@ class TransactionRepository:
         query: dict,
         page: int,
         limit: int,
-    ) -> tuple[list[TransactionInDB], int]:
+        fields: Optional[List[str]] = None,
+    ) -> tuple[list[TransactionInDB] | list[dict], int]:
         skip = (page - 1) * limit
 
         base_filter = {
@@ -166,10 +331,18 @@ class TransactionRepository:
 
         total = await self.collection.count_documents(base_filter)
 
+        projection = to_projection(fields) if fields else None
+
         cursor = (
-            self.collection.find(base_filter).sort("date", -1).skip(skip).limit(limit)
+            self.collection.find(base_filter, projection)
+            .sort("date", -1)
+            .skip(skip)
+            .limit(limit)
         )
 
+        if fields:
+            return [project_doc(doc) async for doc in cursor], total
+
         results: list[TransactionInDB] = []
 
         async for doc in cursor:
@@ -178,6 +351,89 @@ class TransactionRepository:
 
         return results, total
 
+    # -------------------------------------------------
+    # Transactions generated by a recurring rule (keyset)
+    # -------------------------------------------------
+    async def list_by_recurring(
+        self,
+        *,
+        user_id: str,
+        recurring_id: str,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> tuple[List[TransactionInDB], int, Optional[str]]:
+        """
+        Newest first, served by idx_tx_user_recurring_date.
+
+        Returns:
+            (items, total, next_cursor) - next_cursor is None on the last page
+        """
+        base_filter = {
+            "user_id": user_id,
+            "recurring_id": recurring_id,
+            "is_deleted": False,
+        }
+
+        query = dict(base_filter)
+        if cursor:
+            before_date, before_id = decode_cursor(cursor)
+            query["$or"] = [
+                {"date": {"$lt": before_date}},
+                {"date": before_date, "_id": {"$lt": before_id}},
+            ]
+
+        total = await self.collection.count_documents(base_filter)
+
+        docs = (
+            self.collection.find(query)
+            .sort([("date", -1), ("_id", -1)])
+            .limit(limit + 1)
+        )
+
+        results: list[TransactionInDB] = []
+        async for doc in docs:
+            doc["_id"] = str(doc["_id"])
+            results.append(TransactionInDB(**doc))
+
+        next_cursor = None
+        if len(results) > limit:
+            results = results[:limit]
+            last = results[-1]
+            next_cursor = encode_cursor(last.date, last.id)
+
+        return results, total, next_cursor
+
+    # -------------------------------------------------
+    # Stream transactions in a date range [start, end)
+    # -------------------------------------------------
+    async def iter_range(
+        self,
+        *,
+        user_id: str,
+        start: datetime,
+        end: datetime,
+        batch_size: int = 500,
+    ) -> AsyncIterator[TransactionInDB]:
+        """
+        Yield transactions oldest first, fetching `batch_size` documents per
+        round trip. Only one batch is held in memory at a time.
+        """
+        cursor = (
+            self.collection.find(
+                {
+                    "user_id": user_id,
+                    "is_deleted": False,
+                    "date": {"$gte": start, "$lt": end},
+                }
+            )
+            .sort("date", 1)
+            .batch_size(batch_size)
+        )
+
+        async for doc in cursor:
+            doc["_id"] = str(doc["_id"])
+            yield TransactionInDB(**doc)
+
     # -------------------------------------------------
     # List transactions for a given month (YYYY-MM)
     # -------------------------------------------------
@@ -188,7 +444,7 @@ class TransactionRepository:
         month: str,
     ) -> List[TransactionInDB]:
         try:
-            start = datetime.strptime(month, "%Y-%m")
+            start, end = month_bounds(month)
         except ValueError as e:
             raise AppError(
                 code=ErrorCode.VALIDATION_ERROR,
@@ -196,25 +452,222 @@ class TransactionRepository:
                 status_code=400,
             ) from e
 
-        if start.month == 12:
-            end = start.replace(year=start.year + 1, month=1)
-        else:
-            end = start.replace(month=start.month + 1)
+        return [
+            tx async for tx in self.iter_range(user_id=user_id, start=start, end=end)
+        ]
 
-        cursor = self.collection.find(
+    # -------------------------------------------------
+    # Balance and non-recurring history (forecast baseline)
+    # -------------------------------------------------
+    async def forecast_baseline(
+        self,
+        *,
+        user_id: str,
+        as_of: datetime,
+        history_start: datetime,
+    ) -> dict:
+        """
+        One aggregation returning:
+            balance: income - expense of everything before `as_of`
+            history_income / history_expense: non-recurring totals in
+                [history_start, as_of)
+        """
+        by_type = {"$group": {"_id": "$type", "total": {"$sum": "$amount"}}}
+        pipeline = [
+            {
+                "$match": {
+                    "user_id": user_id,
+                    "is_deleted": False,
+                    "date": {"$lt": as_of},
+                }
+            },
+            {
+                "$facet": {
+                    "balance": [by_type],
+                    "history": [
+                        {
+                            "$match": {
+                                "date": {"$gte": history_start},
+                                "is_recurring": {"$ne": True},
+                            }
+                        },
+                        by_type,
+                    ],
+                }
+            },
+        ]
+
+        result = {
+            "balance": 0.0,
+            "history_income": 0.0,
+            "history_expense": 0.0,
+        }
+
+        async for row in self.collection.aggregate(pipeline):
+            totals = {item["_id"]: item["total"] for item in row["balance"]}
+            result["balance"] = totals.get("income", 0.0) - totals.get("expense", 0.0)
+
+            history = {item["_id"]: item["total"] for item in row["history"]}
+            result["history_income"] = history.get("income", 0.0)
+            result["history_expense"] = history.get("expense", 0.0)
+
+        return result
+
+    # -------------------------------------------------
+    # Report breakdowns (per month, per category)
+    # -------------------------------------------------
+    async def report_breakdown(
+        self,
+        *,
+        user_id: str,
+        start: datetime,
+        end: datetime,
+    ) -> dict:
+        """
+        One aggregation over [start, end) returning:
+            totals: income / expense / count
+            months: [{month: "YYYY-MM", income, expense}] oldest first
+            categories: [{category, type, total, count}] largest first
+
+        Nothing is loaded row by row; the database does the grouping.
+        """
+        pipeline = [
+            {
+                "$match": {
+                    "user_id": user_id,
+                    "is_deleted": False,
+                    "date": {"$gte": start, "$lt": end},
+                }
+            },
+            {
+                "$facet": {
+                    "totals": [
+                        {
+                            "$group": {
+                                "_id": "$type",
+                                "total": {"$sum": "$amount"},
+                                "count": {"$sum": 1},
+                            }
+                        }
+                    ],
+                    "months": [
+                        {
+                            "$group": {
+                                "_id": {
+                                    "month": {
+                                        "$dateToString": {
+                                            "format": "%Y-%m",
+                                            "date": "$date",
+                                        }
+                                    },
+                                    "type": "$type",
+                                },
+                                "total": {"$sum": "$amount"},
+                            }
+                        }
+                    ],
+                    "categories": [
+                        {
+                            "$group": {
+                                "_id": {"category": "$category", "type": "$type"},
+                                "total": {"$sum": "$amount"},
+                                "count": {"$sum": 1},
+                            }
+                        },
+                        {"$sort": {"total": -1}},
+                    ],
+                }
+            },
+        ]
+
+        result = {
+            "totals": {"income": 0.0, "expense": 0.0, "count": 0},
+            "months": [],
+            "categories": [],
+        }
+
+        async for row in self.collection.aggregate(pipeline):
+            for item in row["totals"]:
+                result["totals"][item["_id"]] = item["total"]
+                result["totals"]["count"] += item["count"]
+
+            months: dict[str, dict] = {}
+            for item in row["months"]:
+                month = item["_id"]["month"]
+                entry = months.setdefault(
+                    month, {"month": month, "income": 0.0, "expense": 0.0}
+                )
+                entry[item["_id"]["type"]] = item["total"]
+            result["months"] = [months[month] for month in sorted(months)]
+
+            result["categories"] = [
+                {
+                    "category": item["_id"]["category"] or "Uncategorized",
+                    "type": item["_id"]["type"],
+                    "total": item["total"],
+                    "count": item["count"],
+                }
+                for item in row["categories"]
+            ]
+
+        return result
+
+    # -------------------------------------------------
+    # Text check (report engine choice)
+    # -------------------------------------------------
+    async def has_text_matching(
+        self,
+        *,
+        user_id: str,
+        start: datetime,
+        end: datetime,
+        pattern: str,
+    ) -> bool:
+        """
+        Whether any transaction in [start, end) has a description or
+        category matching the regex `pattern`. One indexed query that
+        stops at the first match.
+        """
+        doc = await self.collection.find_one(
             {
                 "user_id": user_id,
                 "is_deleted": False,
                 "date": {"$gte": start, "$lt": end},
-            }
-        ).sort("date", 1)
+                "$or": [
+                    {"description": {"$regex": pattern}},
+                    {"category": {"$regex": pattern}},
+                ],
+            },
+            {"_id": 1},
+        )
+        return doc is not None
 
-        results = []
-        async for doc in cursor:
-            doc["_id"] = str(doc["_id"])
-            results.append(TransactionInDB(**doc))
+    # -------------------------------------------------
+    # Users with activity (report campaigns)
+    # -------------------------------------------------
+    async def users_with_activity(
+        self,
+        *,
+        user_ids: List[str],
+        start: datetime,
+        end: datetime,
+    ) -> set[str]:
+        """
+        Which of `user_ids` have at least one transaction in [start, end):
+        one grouped aggregation for the whole chunk.
+        """
+        pipeline = [
+            {
+                "$match": {
+                    "user_id": {"$in": user_ids},
+                    "is_deleted": False,
+                    "date": {"$gte": start, "$lt": end},
+                }
+            },
+            {"$group": {"_id": "$user_id"}},
+        ]
 
-        return results
+        return {row["_id"] async for row in self.collection.aggregate(pipeline)}
 
     # -------------------------------------------------
     # Aggregation summary
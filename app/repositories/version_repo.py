@@ -0,0 +1,106 @@
+from datetime import datetime
+from typing import Iterable, List, Optional
+from uuid import uuid4
+
+from pymongo import UpdateOne
+
+from app.database import get_database
+
+
+class DataVersionRepository:
+    """
+    Per-user data version counters.
+
+    Repositories bump a scope ("transactions", "recurring") on every write so
+    read endpoints can derive cache validators without re-running queries.
+    Scopes may be dotted paths for finer-grained counters, e.g.
+    "tx_months.2026-01" for one month of transactions.
+    """
+
+    def __init__(self):
+        self.collection = get_database()["data_versions"]
+
+    # -------------------------------------------------
+    # Bump version after a write
+    # -------------------------------------------------
+    async def bump(
+        self,
+        user_id: str,
+        scope: str,
+        *,
+        extra_scopes: Iterable[str] = (),
+    ) -> None:
+        await self.collection.update_one(
+            {"_id": user_id},
+            {
+                "$inc": {name: 1 for name in (scope, *extra_scopes)},
+                "$set": {"updated_at": datetime.utcnow()},
+                "$setOnInsert": {"epoch": uuid4().hex},
+            },
+            upsert=True,
+        )
+
+    # -------------------------------------------------
+    # Bump many users at once (batch writers)
+    # -------------------------------------------------
+    async def bump_many(
+        self,
+        user_ids: Iterable[str],
+        scope: str,
+        *,
+        extra_scopes: Optional[dict[str, set[str]]] = None,
+    ) -> None:
+        """
+        Args:
+            extra_scopes: per-user scopes bumped along with `scope`
+        """
+        extra_scopes = extra_scopes or {}
+        now = datetime.utcnow()
+        ops = [
+            UpdateOne(
+                {"_id": user_id},
+                {
+                    "$inc": {
+                        name: 1 for name in (scope, *extra_scopes.get(user_id, ()))
+                    },
+                    "$set": {"updated_at": now},
+                    "$setOnInsert": {"epoch": uuid4().hex},
+                },
+                upsert=True,
+            )
+            for user_id in set(user_ids)
+        ]
+
+        if ops:
+            await self.collection.bulk_write(ops, ordered=False)
+
+    # -------------------------------------------------
+    # Current version token for a scope
+    # -------------------------------------------------
+    async def get(self, user_id: str, scope: str) -> str:
+        return (await self.get_many(user_id, [scope]))[0]
+
+    async def get_many(self, user_id: str, scopes: List[str]) -> List[str]:
+        """
+        Version tokens of several scopes in one read (e.g. every month of
+        an annual report).
+        """
+        doc = await self.collection.find_one(
+            {"_id": user_id},
+            {"epoch": 1, **{scope: 1 for scope in scopes}},
+        )
+
+        if not doc:
+            return ["0"] * len(scopes)
+
+        tokens = []
+        for scope in scopes:
+            value = doc
+            for part in scope.split("."):
+                value = value.get(part, {}) if isinstance(value, dict) else 0
+
+            # The epoch guards against counters restarting from zero if the
+            # document is ever removed.
+            tokens.append(f"{doc.get('epoch', '')}:{value or 0}")
+
+        return tokens
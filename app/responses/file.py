@@ -0,0 +1,139 @@
+import os
+import re
+from typing import AsyncIterator, Optional
+
+import anyio
+from fastapi import Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from app.errors.base import AppError
+from app.errors.codes import ErrorCode
+from app.utils.etag import etag_matches
+
+CHUNK_SIZE = 64 * 1024
+CACHE_CONTROL = "private, no-cache"
+
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def parse_range(header: str, size: int) -> Optional[tuple[int, int]]:
+    """
+    Parse a single-range `Range` header into an inclusive (start, end).
+
+    Returns None for headers we don't serve partially (malformed or
+    multi-range): the caller then sends the whole file, as RFC 9110 allows.
+
+    Raises:
+        ValueError: if the range is not satisfiable for `size`
+    """
+    match = _RANGE.match(header.strip())
+    if not match:
+        return None
+
+    first, last = match.groups()
+    if not first and not last:
+        return None
+
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise ValueError("Empty suffix range")
+        return max(size - length, 0), size - 1
+
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError("Range not satisfiable")
+
+    return start, end
+
+
+async def _read_chunks(path: str, start: int, length: int) -> AsyncIterator[bytes]:
+    # Opened here, so the file is only held while the body is being sent
+    async with await anyio.open_file(path, "rb") as fh:
+        await fh.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = await fh.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def file_download_response(
+    request: Request,
+    path: str,
+    *,
+    etag: str,
+    filename: str,
+    media_type: str,
+) -> Response:
+    """
+    Stream a file with conditional and partial GET support.
+
+    - If-None-Match matching `etag` -> 304
+    - Range (single range, honoured only if If-Range is absent or matches)
+      -> 206 with that slice; unsatisfiable -> 416
+    - Otherwise 200 with the whole file
+
+    The file is read in CHUNK_SIZE pieces, so memory does not grow with
+    file size and an interrupted download can resume where it stopped.
+    A file already missing when the request arrives is a 404; the file
+    itself is only opened once the body is sent.
+
+    Raises:
+        AppError: NOT_FOUND if the file does not exist
+    """
+    base_headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+    if etag_matches(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=base_headers,
+        )
+
+    try:
+        size = os.path.getsize(path)
+    except FileNotFoundError:
+        raise AppError(
+            code=ErrorCode.NOT_FOUND,
+            message="File is no longer available",
+            status_code=404,
+        ) from None
+    headers = {
+        **base_headers,
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f'attachment; filename="{filename}"',
+    }
+
+    start, end = 0, size - 1
+    status_code = status.HTTP_200_OK
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    # A stale If-Range means the client's partial copy is outdated: send all
+    if range_header and (if_range is None or if_range.strip() == etag):
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={**headers, "Content-Range": f"bytes */{size}"},
+            )
+
+        if byte_range is not None:
+            start, end = byte_range
+            status_code = status.HTTP_206_PARTIAL_CONTENT
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    length = end - start + 1 if size else 0
+    headers["Content-Length"] = str(length)
+
+    return StreamingResponse(
+        _read_chunks(path, start, length),
+        status_code=status_code,
+        media_type=media_type,
+        headers=headers,
+    )
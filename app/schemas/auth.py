@@ -2,6 +2,8 @@ from typing import Optional
 
 from pydantic import BaseModel, EmailStr, Field
 
+from app.schemas.common import SuccessResponse
+
 
 class RegisterRequest(BaseModel):
     email: EmailStr
@@ -22,3 +24,8 @@ class ForgotPasswordRequest(BaseModel):
 class ResetPasswordRequest(BaseModel):
     token: str
     new_password: str = Field(min_length=8)
+
+
+class RegisterResponse(SuccessResponse):
+    message: str
+    user_id: str
@@ -0,0 +1,33 @@
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class SuccessResponse(BaseModel):
+    success: bool = True
+
+
+class MessageResponse(SuccessResponse):
+    message: str
+
+
+class DataResponse(SuccessResponse, Generic[T]):
+    data: T
+
+
+class PageResponse(SuccessResponse, Generic[T]):
+    page: int
+    limit: int
+    total: int
+    count: int
+    pages: int
+    data: List[T]
+
+
+class CursorPageResponse(SuccessResponse, Generic[T]):
+    limit: int
+    count: int
+    next_cursor: Optional[str] = None
+    data: List[T]
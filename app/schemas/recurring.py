@@ -1,8 +1,12 @@
-from datetime import datetime
-from typing import Literal, Optional
+from datetime import date, datetime
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
+from app.models.transaction import TransactionInDB
+from app.schemas.common import CursorPageResponse, SuccessResponse
+from app.schemas.transaction import TransactionSummary
+
 
 class RecurringTransactionCreate(BaseModel):
     amount: float = Field(gt=0)
@@ -31,3 +35,59 @@ class RecurringTransactionFilter(BaseModel):
     category: Optional[str] = None
     type: Optional[Literal["income", "expense"]] = None
     active_only: bool = True
+
+
+class RecurringGeneratedPage(CursorPageResponse[TransactionInDB]):
+    recurring_id: str
+    total: int
+
+
+class ForecastPoint(BaseModel):
+    period_start: date
+    income: float
+    expense: float
+    net: float
+    balance: float
+
+
+class ForecastHistory(BaseModel):
+    months: int
+    monthly_income: float
+    monthly_expense: float
+
+
+class RecurringForecast(BaseModel):
+    start: date
+    end: date
+    months: int
+    granularity: Literal["daily", "monthly"]
+    opening_balance: float
+    history: Optional[ForecastHistory] = None  # Non-recurring baseline, if included
+    totals: TransactionSummary
+    points: List[ForecastPoint]
+
+
+class RecurringSuggestionAccept(BaseModel):
+    """Optional overrides applied when turning a suggestion into a rule."""
+
+    amount: Optional[float] = Field(default=None, gt=0)
+    category: Optional[str] = None
+    description: Optional[str] = None
+    next_run_at: Optional[datetime] = None
+
+
+class UpcomingOccurrence(BaseModel):
+    recurring_id: str
+    date: datetime
+    amount: float
+    type: Literal["income", "expense"]
+    category: str
+    description: str
+    frequency: Literal["daily", "weekly", "monthly", "yearly"]
+
+
+class UpcomingResponse(SuccessResponse):
+    days: int
+    count: int
+    totals: TransactionSummary
+    data: List[UpcomingOccurrence]
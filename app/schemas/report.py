@@ -0,0 +1,49 @@
+from datetime import datetime
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from app.models.report import ReportJobInDB
+
+
+class ReportJobResponse(BaseModel):
+    """
+    A report job as clients see it: no lease, worker or storage internals.
+    The PDF is fetched from /reports/{id}/download once `status` is
+    "succeeded".
+    """
+
+    id: str = Field(alias="_id")
+    kind: Literal["monthly", "annual", "range"]
+    params: dict
+    status: Literal["queued", "running", "succeeded", "failed"]
+
+    attempts: int
+    max_attempts: int
+    transaction_count: Optional[int] = None
+    error: Optional[str] = None
+
+    created_at: datetime
+    updated_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        populate_by_name = True
+
+    @classmethod
+    def from_job(cls, job: ReportJobInDB) -> "ReportJobResponse":
+        return cls(
+            id=job.id,
+            kind=job.kind,
+            params=job.params,
+            status=job.status,
+            attempts=job.attempts,
+            max_attempts=job.max_attempts,
+            transaction_count=(job.result or {}).get("transaction_count"),
+            error=job.error,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+        )
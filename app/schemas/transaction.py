@@ -3,6 +3,8 @@ from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
+from app.schemas.common import SuccessResponse
+
 
 class TransactionCreate(BaseModel):
     date: datetime
@@ -35,3 +37,17 @@ class TransactionFilter(BaseModel):
 class BulkTransactionConfirm(BaseModel):
     import_id: Optional[str] = None
     transactions: List[TransactionCreate]
+    skip_duplicates: bool = True
+
+
+class TransactionSummary(BaseModel):
+    income: float = 0.0
+    expense: float = 0.0
+    net: float = 0.0
+
+
+class BulkConfirmResponse(SuccessResponse):
+    count: int
+    import_id: Optional[str] = None
+    duplicates: int = 0
+    duplicate_indexes: List[int] = []
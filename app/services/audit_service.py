@@ -31,3 +31,13 @@ class AuditService:
         except Exception:
             # NEVER break main flow because of audit
             logger.exception("Audit log failed")
+
+    async def log_many(self, entries: list[dict]):
+        """
+        Batched variant of log() for background jobs (no request context).
+        """
+        try:
+            await self.repo.create_many(entries)
+        except Exception:
+            # NEVER break main flow because of audit
+            logger.exception("Audit log failed", extra={"count": len(entries)})
@@ -0,0 +1,160 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    async_playwright,
+)
+
+from app.settings import settings
+from app.utils.logger import get_logger
+
+logger = get_logger("pennywise.browser_pool")
+
+
+class _PooledBrowser:
+    """
+    One Chromium process with a context and a page that are reused
+    across renders.
+    """
+
+    def __init__(self, browser: Browser, context: BrowserContext, page: Page):
+        self.browser = browser
+        self.context = context
+        self.page = page
+        self.renders = 0
+        self.broken = False
+
+    def is_healthy(self, max_renders: int) -> bool:
+        return (
+            not self.broken
+            and self.renders < max_renders
+            and self.browser.is_connected()
+            and not self.page.is_closed()
+        )
+
+    async def close(self) -> None:
+        try:
+            await self.browser.close()
+        except Exception:
+            # Already gone (crashed or disconnected)
+            pass
+
+
+class BrowserPool:
+    """
+    Warm pool of Chromium browsers for PDF rendering.
+
+    - Started lazily on the first render, then kept warm
+    - At most `size` renders run at once; further callers wait
+    - Each browser keeps one context/page that is reused between renders
+    - Browsers are recycled after `max_renders` renders, after a failed
+      render, or when they disconnect (crash)
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int = settings.REPORT_BROWSER_POOL_SIZE,
+        max_renders: int = settings.REPORT_BROWSER_MAX_RENDERS,
+    ):
+        self.size = max(1, size)
+        self.max_renders = max(1, max_renders)
+
+        self._playwright: Optional[Playwright] = None
+        self._start_lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(self.size)
+        self._idle: list[_PooledBrowser] = []
+        self._closed = False
+
+    # -------------------------------------------------
+    # Public API
+    # -------------------------------------------------
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """
+        Borrow a warm page for one render.
+
+            async with browser_pool.page() as page:
+                await page.set_content(html)
+                await page.pdf(path=...)
+        """
+        async with self._slots:
+            pooled = await self._checkout()
+            finished = False
+            try:
+                yield pooled.page
+                finished = True
+            finally:
+                # An error, or a cancellation (e.g. a failed sibling chunk),
+                # may leave goto()/pdf() half done: never reuse that page
+                if not finished:
+                    pooled.broken = True
+                pooled.renders += 1
+                await self._checkin(pooled)
+
+    async def shutdown(self) -> None:
+        self._closed = True
+
+        idle, self._idle = self._idle, []
+        for pooled in idle:
+            await pooled.close()
+
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+        logger.info("Browser pool stopped")
+
+    # -------------------------------------------------
+    # Internals
+    # -------------------------------------------------
+    async def _checkout(self) -> _PooledBrowser:
+        if self._closed:
+            raise RuntimeError("Browser pool is shut down")
+
+        while self._idle:
+            pooled = self._idle.pop()
+            if pooled.is_healthy(self.max_renders):
+                return pooled
+            await self._recycle(pooled)
+
+        return await self._launch()
+
+    async def _checkin(self, pooled: _PooledBrowser) -> None:
+        if self._closed or not pooled.is_healthy(self.max_renders):
+            await self._recycle(pooled)
+            return
+
+        self._idle.append(pooled)
+
+    async def _launch(self) -> _PooledBrowser:
+        async with self._start_lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+                logger.info("Browser pool started", extra={"size": self.size})
+
+        browser = await self._playwright.chromium.launch()
+        context = await browser.new_context()
+        page = await context.new_page()
+
+        logger.info("Browser launched")
+        return _PooledBrowser(browser, context, page)
+
+    async def _recycle(self, pooled: _PooledBrowser) -> None:
+        logger.info(
+            "Browser recycled",
+            extra={
+                "renders": pooled.renders,
+                "broken": pooled.broken,
+                "connected": pooled.browser.is_connected(),
+            },
+        )
+        await pooled.close()
+
+
+browser_pool = BrowserPool()
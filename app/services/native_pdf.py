@@ -0,0 +1,697 @@
+import asyncio
+import re
+import zlib
+from datetime import datetime
+from typing import AsyncIterable, BinaryIO, Iterable, Optional
+
+from app.domain.charts import month_label
+from app.domain.money import format_currency
+
+# -------------------------------------------------
+# Page geometry (points) and colours (RGB 0-1)
+# -------------------------------------------------
+PAGE_WIDTH = 595.28  # A4
+PAGE_HEIGHT = 841.89
+MARGIN = 40.0
+
+ROW_HEIGHT = 16.0
+FONT_SIZE = 9.0
+
+TEXT = (0.133, 0.133, 0.133)  # #222
+MUTED = (0.4, 0.4, 0.4)  # #666
+FAINT = (0.6, 0.6, 0.6)  # #999
+INCOME = (0.180, 0.490, 0.196)  # #2e7d32
+EXPENSE = (0.776, 0.157, 0.157)  # #c62828
+RULE_STRONG = (0.867, 0.867, 0.867)  # #ddd
+RULE_LIGHT = (0.933, 0.933, 0.933)  # #eee
+
+# (title, width, align); a None width takes the remaining width
+COLUMNS = [
+    ("Date", 70.0, "left"),
+    ("Description", None, "left"),
+    ("Category", 95.0, "left"),
+    ("Type", 55.0, "left"),
+    ("Amount", 85.0, "right"),
+]
+
+MONTH_COLUMNS = [
+    ("Month", None, "left"),
+    ("Income", 110.0, "right"),
+    ("Expense", 110.0, "right"),
+    ("Net", 110.0, "right"),
+]
+
+CATEGORY_COLUMNS = [
+    ("Category", None, "left"),
+    ("Type", 80.0, "left"),
+    ("Count", 60.0, "right"),
+    ("Total", 110.0, "right"),
+]
+
+CHART_HEIGHT = 140.0
+CHART_CATEGORIES = 8
+
+# -------------------------------------------------
+# Standard 14 font metrics (1/1000 em), printable ASCII 32..126
+# -------------------------------------------------
+_HELVETICA = [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+]  # fmt: skip
+
+_HELVETICA_BOLD = [
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+]  # fmt: skip
+
+FONTS = {
+    "F1": ("Helvetica", _HELVETICA),
+    "F2": ("Helvetica-Bold", _HELVETICA_BOLD),
+}
+
+
+def text_width(text: str, font: str, size: float) -> float:
+    widths = FONTS[font][1]
+    total = 0
+    for char in text:
+        code = ord(char)
+        total += widths[code - 32] if 32 <= code <= 126 else 556
+    return total * size / 1000
+
+
+def fit_text(text: str, font: str, size: float, width: float) -> str:
+    """Truncate `text` with an ellipsis so it fits in `width` points."""
+    if text_width(text, font, size) <= width:
+        return text
+
+    widths = FONTS[font][1]
+    budget = (width - text_width("...", font, size)) * 1000 / size
+    used = 0
+    for end, char in enumerate(text):
+        code = ord(char)
+        used += widths[code - 32] if 32 <= code <= 126 else 556
+        if used > budget:
+            return text[:end].rstrip() + "..."
+    return text
+
+
+# Text the standard fonts can show (WinAnsiEncoding = cp1252). Anything
+# else (₹, Devanagari, CJK, emoji...) would print as "?", so such
+# statements go to Chromium instead (see ReportService.resolve_engine).
+# Spelled without NUL so the pattern can also be sent to MongoDB.
+UNSUPPORTED_TEXT_PATTERN = (
+    "[^\x01-\x7f\xa0-\xff"
+    + bytes(range(0x80, 0xA0)).decode("cp1252", errors="ignore")
+    + "]"
+)
+UNSUPPORTED_TEXT = re.compile(UNSUPPORTED_TEXT_PATTERN)
+
+
+def has_unsupported_text(tx: dict) -> bool:
+    """True if the row has text the native renderer cannot show."""
+    return any(
+        UNSUPPORTED_TEXT.search(tx.get(field) or "")
+        for field in ("description", "category")
+    )
+
+
+def _escape(text: str) -> bytes:
+    raw = text.encode("cp1252", errors="replace")
+    return raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+
+# -------------------------------------------------
+# Page content builder
+# -------------------------------------------------
+class _Canvas:
+    def __init__(self):
+        self.ops: list[bytes] = []
+
+    def text(
+        self,
+        x: float,
+        y: float,
+        value: str,
+        *,
+        font: str = "F1",
+        size: float = FONT_SIZE,
+        color: tuple = TEXT,
+        align: str = "left",
+        width: Optional[float] = None,
+    ) -> None:
+        if width is not None:
+            value = fit_text(value, font, size, width)
+            if align == "right":
+                x += width - text_width(value, font, size)
+            elif align == "center":
+                x += (width - text_width(value, font, size)) / 2
+
+        self.ops.append(
+            b"BT /%s %.1f Tf %.3f %.3f %.3f rg %.2f %.2f Td (%s) Tj ET"
+            % (font.encode(), size, *color, x, y, _escape(value))
+        )
+
+    def line(
+        self,
+        x1: float,
+        y1: float,
+        x2: float,
+        y2: float,
+        *,
+        color: tuple,
+        width: float,
+    ) -> None:
+        self.ops.append(
+            b"%.3f %.3f %.3f RG %.2f w %.2f %.2f m %.2f %.2f l S"
+            % (*color, width, x1, y1, x2, y2)
+        )
+
+    def rect(
+        self,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        *,
+        color: tuple,
+    ) -> None:
+        self.ops.append(
+            b"%.3f %.3f %.3f rg %.2f %.2f %.2f %.2f re f"
+            % (*color, x, y, width, height)
+        )
+
+    def to_stream(self) -> bytes:
+        return zlib.compress(b"\n".join(self.ops), 6)
+
+
+def layout_columns(columns: list) -> list[tuple[str, float, float, str]]:
+    """(title, width, align) -> (title, x, width, align) across the page."""
+    fixed = sum(width for _, width, _ in columns if width)
+    flex = PAGE_WIDTH - 2 * MARGIN - fixed
+
+    laid_out = []
+    x = MARGIN
+    for title, width, align in columns:
+        width = width or flex
+        laid_out.append((title, x, width, align))
+        x += width
+    return laid_out
+
+
+# -------------------------------------------------
+# Statement renderer
+# -------------------------------------------------
+class NativeStatementRenderer:
+    """
+    Writes a statement PDF directly, without a browser.
+
+    Same content as the HTML statement: header, totals, optional
+    per-month/per-category breakdowns with bar charts, then the
+    transaction table with its header row repeated on every page and
+    income/expense colouring. Uses the standard Helvetica fonts, so
+    nothing is embedded and only cp1252 text can be shown (see
+    has_unsupported_text).
+
+    Rows are consumed in a single pass and every finished page is written
+    to the file straight away; only page 1 is held back, because it shows
+    the totals, and is written last.
+    """
+
+    def render(
+        self,
+        *,
+        title: str,
+        period_label: str,
+        transactions: Iterable[dict],
+        output_path: str,
+        breakdown: Optional[dict] = None,
+    ) -> dict:
+        """
+        Args:
+            breakdown: months/categories aggregates (see
+                TransactionRepository.report_breakdown)
+
+        Returns:
+            dict with pages, rows, income, expense and net
+        """
+        with open(output_path, "wb") as fh:
+            writer = _StatementWriter(fh)
+            if breakdown:
+                writer.add_breakdown(breakdown)
+            writer.add_rows(transactions)
+            return writer.finish(title=title, period_label=period_label)
+
+    async def render_async(
+        self,
+        *,
+        title: str,
+        period_label: str,
+        transactions: AsyncIterable[dict],
+        output_path: str,
+        breakdown: Optional[dict] = None,
+        batch_size: int = 500,
+    ) -> dict:
+        """
+        Same as render(), for an async stream (e.g. a Mongo cursor).
+
+        Rows are laid out in batches on a worker thread, so the event loop
+        stays responsive and at most one batch is held in memory.
+        """
+        with open(output_path, "wb") as fh:
+            writer = _StatementWriter(fh)
+            if breakdown:
+                await asyncio.to_thread(writer.add_breakdown, breakdown)
+
+            batch = []
+            async for tx in transactions:
+                batch.append(tx)
+                if len(batch) >= batch_size:
+                    await asyncio.to_thread(writer.add_rows, batch)
+                    batch = []
+
+            await asyncio.to_thread(writer.add_rows, batch)
+
+            return await asyncio.to_thread(
+                writer.finish,
+                title=title,
+                period_label=period_label,
+            )
+
+
+class _StatementWriter:
+    """
+    Incremental PDF writer: add_breakdown() once, add_rows() any number of
+    times, then finish().
+
+    Content flows down the page; a table started on one page repeats its
+    header row on every following page.
+    """
+
+    # Fixed object numbers; pages are allocated from FIRST_PAGE_OBJECT on
+    CATALOG, PAGES, FONT_REGULAR, FONT_BOLD = 1, 2, 3, 4
+    FIRST_PAGE_OBJECT = 5
+
+    # Space reserved on page 1 for the title block and the totals
+    HEADER_HEIGHT = 110.0
+
+    transaction_columns = layout_columns(COLUMNS)
+    month_columns = layout_columns(MONTH_COLUMNS)
+    category_columns = layout_columns(CATEGORY_COLUMNS)
+
+    def __init__(self, fh: BinaryIO):
+        self.fh = fh
+        self.offsets: dict[int, int] = {}
+        # Page and content objects come in pairs
+        self.next_object = self.FIRST_PAGE_OBJECT + 2
+        self.page_objects: list[int] = [self.FIRST_PAGE_OBJECT]
+
+        self.income = self.expense = 0.0
+        self.rows = 0
+
+        self.fh.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        self._write_fonts()
+
+        self.first_page = self.canvas = _Canvas()
+        self.y = PAGE_HEIGHT - MARGIN - self.HEADER_HEIGHT
+        # Columns of the table being drawn (header repeats on new pages)
+        self.table: Optional[list] = None
+        self.transactions_started = False
+
+    # -------------------------------------------------
+    # Document
+    # -------------------------------------------------
+    def add_breakdown(self, breakdown: dict) -> None:
+        months = breakdown.get("months") or []
+        if months:
+            self._heading("By month")
+            self._month_chart(months)
+            self._begin_table(self.month_columns)
+            for month in months:
+                net = month["income"] - month["expense"]
+                self._table_row(
+                    self.month_columns,
+                    [
+                        month["month"],
+                        format_currency(month["income"]),
+                        format_currency(month["expense"]),
+                        format_currency(net),
+                    ],
+                    [TEXT, INCOME, EXPENSE, INCOME if net >= 0 else EXPENSE],
+                )
+            self.table = None
+
+        categories = breakdown.get("categories") or []
+        if categories:
+            self._heading("By category")
+            self._category_chart(categories[:CHART_CATEGORIES])
+            self._begin_table(self.category_columns)
+            for row in categories:
+                self._table_row(
+                    self.category_columns,
+                    [
+                        row["category"],
+                        row["type"].title(),
+                        str(row["count"]),
+                        format_currency(row["total"]),
+                    ],
+                    [TEXT, TEXT, TEXT, INCOME if row["type"] == "income" else EXPENSE],
+                )
+            self.table = None
+
+        self._heading("Transactions")
+
+    def add_rows(self, transactions: Iterable[dict]) -> None:
+        if not self.transactions_started:
+            self._begin_table(self.transaction_columns)
+            self.transactions_started = True
+
+        for tx in transactions:
+            amount = float(tx["amount"])
+            if tx["type"] == "income":
+                self.income += amount
+            else:
+                self.expense += amount
+
+            date = tx["date"]
+            self._table_row(
+                self.transaction_columns,
+                [
+                    (
+                        date.strftime("%d %b %Y")
+                        if hasattr(date, "strftime")
+                        else str(date)
+                    ),
+                    tx.get("description") or "",
+                    tx.get("category") or "",
+                    tx["type"].title(),
+                    format_currency(tx["amount"]),
+                ],
+                [TEXT] * 4 + [INCOME if tx["type"] == "income" else EXPENSE],
+            )
+            self.rows += 1
+
+    def finish(self, *, title: str, period_label: str) -> dict:
+        if self.canvas is not self.first_page:
+            self._finish_page(self.canvas, len(self.page_objects))
+
+        # Page 1 last: the totals are known now
+        self._title_block(
+            self.first_page,
+            title=title,
+            period_label=period_label,
+            income=self.income,
+            expense=self.expense,
+        )
+        self._footer(self.first_page, 1)
+        self._write_page(self.FIRST_PAGE_OBJECT, self.first_page)
+
+        self._write_trailer(title)
+
+        return {
+            "pages": len(self.page_objects),
+            "rows": self.rows,
+            "income": self.income,
+            "expense": self.expense,
+            "net": self.income - self.expense,
+        }
+
+    # -------------------------------------------------
+    # Flow
+    # -------------------------------------------------
+    def _ensure(self, height: float) -> None:
+        """Start a new page unless `height` points fit above the margin."""
+        if self.y >= MARGIN + height:
+            return
+
+        self._finish_page(self.canvas, len(self.page_objects))
+        self.canvas = self._start_page()
+        self.y = PAGE_HEIGHT - MARGIN
+        if self.table:
+            self.y = self._table_header(self.canvas, self.y, self.table)
+
+    def _heading(self, text: str) -> None:
+        # Keep a heading together with at least a table header and a row
+        self._ensure(24 + 3 * ROW_HEIGHT)
+        self.canvas.text(MARGIN, self.y - 14, text, font="F2", size=12)
+        self.y -= 24
+
+    def _begin_table(self, columns: list) -> None:
+        self.table = None
+        self._ensure(3 * ROW_HEIGHT)
+        self.table = columns
+        self.y = self._table_header(self.canvas, self.y, columns)
+
+    def _table_row(self, columns: list, values: list, colors: list) -> None:
+        self._ensure(ROW_HEIGHT)
+
+        for (_, x, width, align), value, color in zip(columns, values, colors):
+            self.canvas.text(
+                x + 4,
+                self.y,
+                value,
+                align=align,
+                width=width - 8,
+                color=color,
+            )
+
+        self.canvas.line(
+            MARGIN,
+            self.y - 5,
+            PAGE_WIDTH - MARGIN,
+            self.y - 5,
+            color=RULE_LIGHT,
+            width=0.5,
+        )
+        self.y -= ROW_HEIGHT
+
+    # -------------------------------------------------
+    # Layout
+    # -------------------------------------------------
+    def _title_block(
+        self,
+        canvas: _Canvas,
+        *,
+        title: str,
+        period_label: str,
+        income: float,
+        expense: float,
+    ) -> None:
+        top = PAGE_HEIGHT - MARGIN
+        generated_at = datetime.utcnow().strftime("%d %b %Y %H:%M UTC")
+
+        canvas.text(MARGIN, top - 18, title, font="F2", size=18)
+        canvas.text(MARGIN, top - 36, period_label, size=11, color=MUTED)
+        canvas.text(
+            MARGIN, top - 50, f"Generated at {generated_at}", size=8, color=FAINT
+        )
+
+        x = MARGIN
+        for label, value, font in (
+            ("Income", income, "F1"),
+            ("Expense", expense, "F1"),
+            ("Net", income - expense, "F2"),
+        ):
+            prefix = f"{label}: "
+            canvas.text(x, top - 78, prefix, font=font, size=11)
+            x += text_width(prefix, font, 11)
+            amount = format_currency(value)
+            canvas.text(x, top - 78, amount, font="F2", size=11)
+            x += text_width(amount, "F2", 11) + 24
+
+    def _table_header(self, canvas: _Canvas, top: float, columns: list) -> float:
+        baseline = top - 12
+        for title, x, width, align in columns:
+            canvas.text(x + 4, baseline, title, font="F2", align=align, width=width - 8)
+
+        rule = top - ROW_HEIGHT - 2
+        canvas.line(MARGIN, rule, PAGE_WIDTH - MARGIN, rule, color=RULE_STRONG, width=2)
+        return rule - ROW_HEIGHT + 4
+
+    def _month_chart(self, months: list[dict]) -> None:
+        """Grouped income/expense bars, same design as the SVG chart."""
+        self._ensure(CHART_HEIGHT + 8)
+
+        left = MARGIN + 56
+        plot_width = PAGE_WIDTH - MARGIN - left
+        plot_height = CHART_HEIGHT - 24
+        base = self.y - plot_height
+
+        peak = max([max(m["income"], m["expense"]) for m in months] + [0.0]) or 1.0
+        slot = plot_width / len(months)
+        bar = max(min(slot * 0.35, 18), 1)
+        with_year = len({m["month"][:4] for m in months}) > 1
+
+        self.canvas.line(left, base, PAGE_WIDTH - MARGIN, base, color=FAINT, width=0.5)
+        self.canvas.text(
+            MARGIN,
+            self.y - 8,
+            format_currency(peak),
+            size=7,
+            color=FAINT,
+            align="right",
+            width=52,
+        )
+
+        for index, month in enumerate(months):
+            center = left + slot * (index + 0.5)
+            for offset, value, color in (
+                (-bar, month["income"], INCOME),
+                (0, month["expense"], EXPENSE),
+            ):
+                self.canvas.rect(
+                    center + offset,
+                    base,
+                    bar,
+                    plot_height * value / peak,
+                    color=color,
+                )
+
+            self.canvas.text(
+                center - slot / 2,
+                base - 12,
+                month_label(month["month"], with_year=with_year),
+                size=7,
+                align="center",
+                width=slot,
+            )
+
+        self.y -= CHART_HEIGHT + 8
+
+    def _category_chart(self, categories: list[dict]) -> None:
+        bar_height, gap = 10.0, 4.0
+        height = len(categories) * (bar_height + gap) + 8
+        self._ensure(height)
+
+        label_width, value_width = 130.0, 80.0
+        left = MARGIN + label_width
+        plot_width = PAGE_WIDTH - 2 * MARGIN - label_width - value_width
+        peak = max([row["total"] for row in categories] + [0.0]) or 1.0
+
+        y = self.y
+        for row in categories:
+            y -= bar_height + gap
+            color = INCOME if row["type"] == "income" else EXPENSE
+            self.canvas.text(
+                MARGIN,
+                y + 2,
+                row["category"],
+                size=8,
+                align="right",
+                width=label_width - 8,
+            )
+            self.canvas.rect(
+                left,
+                y,
+                max(plot_width * row["total"] / peak, 1),
+                bar_height,
+                color=color,
+            )
+            self.canvas.text(
+                PAGE_WIDTH - MARGIN - value_width,
+                y + 2,
+                format_currency(row["total"]),
+                size=8,
+                align="right",
+                width=value_width,
+            )
+
+        self.y -= height
+
+    def _footer(self, canvas: _Canvas, number: int) -> None:
+        canvas.text(
+            MARGIN,
+            MARGIN / 2,
+            f"Page {number}",
+            size=8,
+            color=FAINT,
+            align="right",
+            width=PAGE_WIDTH - 2 * MARGIN,
+        )
+
+    # -------------------------------------------------
+    # Objects
+    # -------------------------------------------------
+    def _finish_page(self, canvas: _Canvas, number: int) -> None:
+        """Write page `number` (2+) now; page 1 waits for the totals."""
+        if number > 1:
+            self._footer(canvas, number)
+            self._write_page(self.page_objects[number - 1], canvas)
+
+    def _start_page(self) -> _Canvas:
+        self.page_objects.append(self.next_object)
+        self.next_object += 2
+        return _Canvas()
+
+    def _write_page(self, page_object: int, canvas: _Canvas) -> None:
+        stream = canvas.to_stream()
+        content_object = page_object + 1
+
+        self._object(
+            content_object,
+            b"<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream"
+            % (len(stream), stream),
+        )
+        self._object(
+            page_object,
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %.2f %.2f] "
+            b"/Resources << /Font << /F1 %d 0 R /F2 %d 0 R >> >> "
+            b"/Contents %d 0 R >>"
+            % (
+                self.PAGES,
+                PAGE_WIDTH,
+                PAGE_HEIGHT,
+                self.FONT_REGULAR,
+                self.FONT_BOLD,
+                content_object,
+            ),
+        )
+
+    def _write_fonts(self) -> None:
+        for number, (name, _) in (
+            (self.FONT_REGULAR, FONTS["F1"]),
+            (self.FONT_BOLD, FONTS["F2"]),
+        ):
+            self._object(
+                number,
+                b"<< /Type /Font /Subtype /Type1 /BaseFont /%s "
+                b"/Encoding /WinAnsiEncoding >>" % name.encode(),
+            )
+
+    def _write_trailer(self, title: str) -> None:
+        kids = b" ".join(b"%d 0 R" % number for number in self.page_objects)
+        self._object(
+            self.PAGES,
+            b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(self.page_objects)),
+        )
+        self._object(self.CATALOG, b"<< /Type /Catalog /Pages %d 0 R >>" % self.PAGES)
+
+        info = self.next_object
+        self._object(info, b"<< /Title (%s) /Producer (PennyWise) >>" % _escape(title))
+
+        size = info + 1
+        xref = self.fh.tell()
+        lines = [b"xref", b"0 %d" % size, b"0000000000 65535 f "]
+        for number in range(1, size):
+            offset = self.offsets.get(number)
+            if offset is None:
+                lines.append(b"0000000000 65535 f ")
+            else:
+                lines.append(b"%010d 00000 n " % offset)
+
+        self.fh.write(b"\n".join(lines) + b"\n")
+        self.fh.write(
+            b"trailer\n<< /Size %d /Root %d 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+            % (size, self.CATALOG, info, xref)
+        )
+
+    def _object(self, number: int, body: bytes) -> None:
+        self.offsets[number] = self.fh.tell()
+        self.fh.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
@@ -0,0 +1,80 @@
+from pypdf import PageObject, PdfWriter
+from pypdf.generic import (
+    ContentStream,
+    DecodedStreamObject,
+    DictionaryObject,
+    NameObject,
+)
+
+from app.services.native_pdf import FAINT, text_width
+
+# Footer stamped on merged statements; matches the Chromium footer
+# (8px #999, right-aligned inside the 20px page margin)
+FOOTER_SIZE = 6.0
+FOOTER_RIGHT = 15.0
+FOOTER_BASELINE = 12.0
+
+
+def _footer_page(label: str, width: float, height: float) -> PageObject:
+    """A blank page carrying only the footer text, to overlay on a page."""
+    x = width - FOOTER_RIGHT - text_width(label, "F1", FOOTER_SIZE)
+
+    data = DecodedStreamObject()
+    data.set_data(
+        b"BT /F1 %.1f Tf %.3f %.3f %.3f rg %.2f %.2f Td (%s) Tj ET"
+        % (FOOTER_SIZE, *FAINT, x, FOOTER_BASELINE, label.encode("ascii"))
+    )
+
+    page = PageObject.create_blank_page(width=width, height=height)
+    page[NameObject("/Resources")] = DictionaryObject(
+        {
+            NameObject("/Font"): DictionaryObject(
+                {
+                    NameObject("/F1"): DictionaryObject(
+                        {
+                            NameObject("/Type"): NameObject("/Font"),
+                            NameObject("/Subtype"): NameObject("/Type1"),
+                            NameObject("/BaseFont"): NameObject("/Helvetica"),
+                            NameObject("/Encoding"): NameObject("/WinAnsiEncoding"),
+                        }
+                    )
+                }
+            )
+        }
+    )
+    page.replace_contents(ContentStream(data, None))
+    return page
+
+
+def merge_pdfs(paths: list[str], output_path: str, *, title: str) -> int:
+    """
+    Concatenate rendered PDFs into one document, numbering the pages
+    continuously ("Page N of T") across all of them.
+
+    The parts are rendered without footers; each page gets its footer
+    merged on top with PageObject.merge_page, which isolates the page's
+    graphics state and renames clashing resources.
+
+    Returns:
+        Number of pages written
+    """
+    writer = PdfWriter()
+    for path in paths:
+        writer.append(path)
+
+    total = len(writer.pages)
+    for number, page in enumerate(writer.pages, start=1):
+        page.merge_page(
+            _footer_page(
+                f"Page {number} of {total}",
+                float(page.mediabox.width),
+                float(page.mediabox.height),
+            )
+        )
+
+    writer.add_metadata({"/Title": title, "/Producer": "PennyWise"})
+
+    with open(output_path, "wb") as fh:
+        writer.write(fh)
+
+    return total
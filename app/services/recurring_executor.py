@@ -0,0 +1,195 @@
+import asyncio
+import zlib
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Literal, Optional
+
+from pydantic import BaseModel
+
+from app.settings import settings
+from app.utils.ids import worker_id
+from app.utils.logger import get_logger
+from app.utils.retry import retry_async
+
+if TYPE_CHECKING:
+    from app.services.recurring_service import RecurringService
+
+logger = get_logger("pennywise.recurring.executor")
+
+
+class RecurringRuleResult(BaseModel):
+    recurring_id: str
+    user_id: str
+    status: Literal["executed", "failed", "lease_lost"]
+    occurrences: int = 0
+    transaction_ids: List[str] = []
+    next_run_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+
+class RecurringRunStats(BaseModel):
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    duration_seconds: float = 0.0
+
+    batches: int = 0
+    processed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    lease_lost: int = 0
+    occurrences: int = 0
+
+    throughput_per_second: float = 0.0
+
+    # Lag = how late a rule ran relative to its next_run_at
+    max_lag_seconds: float = 0.0
+    avg_lag_seconds: float = 0.0
+    total_lag_seconds: float = 0.0
+
+    # Per-rule outcome (not logged)
+    results: List[RecurringRuleResult] = []
+
+    def record_lag(self, lag_seconds: float) -> None:
+        lag_seconds = max(lag_seconds, 0.0)
+        self.total_lag_seconds += lag_seconds
+        self.max_lag_seconds = max(self.max_lag_seconds, lag_seconds)
+
+    def record_results(self, results: List[RecurringRuleResult]) -> None:
+        self.results.extend(results)
+
+        for result in results:
+            self.occurrences += result.occurrences
+            if result.status == "executed":
+                self.succeeded += 1
+            elif result.status == "lease_lost":
+                self.lease_lost += 1
+            else:
+                self.failed += 1
+
+    def finish(self) -> None:
+        self.finished_at = datetime.utcnow()
+        self.duration_seconds = (self.finished_at - self.started_at).total_seconds()
+
+        if self.processed:
+            self.avg_lag_seconds = self.total_lag_seconds / self.processed
+        if self.duration_seconds > 0:
+            self.throughput_per_second = self.processed / self.duration_seconds
+
+
+class RecurringExecutor:
+    """
+    Claims due rules in batches and executes each batch with bulk writes.
+
+    Several processes can run the executor against the same database: each
+    rule is claimed by exactly one worker (see claim_due_batch).
+
+    - Each claimed batch is split across `concurrency` lanes by user: a
+      user's rules always land on the same lane, so they run in order and
+      never overlap, while different users run in parallel
+    - A lane's share of a batch costs a handful of round trips (insert_many,
+      bulk_write, audit), whatever its size
+    - Batches are retried with backoff; execution is idempotent thanks to
+      the occurrence ledger, so a retry never double-posts
+    - A batch that keeps failing is not advanced; its leases expire and a
+      later tick retries the rules
+    """
+
+    def __init__(
+        self,
+        service: "RecurringService",
+        *,
+        concurrency: int = settings.RECURRING_CONCURRENCY,
+        batch_size: int = settings.RECURRING_BATCH_SIZE,
+        max_retries: int = settings.RECURRING_MAX_RETRIES,
+        retry_base_delay: float = settings.RECURRING_RETRY_BASE_DELAY,
+    ):
+        self.service = service
+        self.concurrency = max(1, concurrency)
+        self.batch_size = max(1, batch_size)
+        self.max_retries = max(0, max_retries)
+        self.retry_base_delay = retry_base_delay
+
+    # -------------------------------------------------
+    # Public API
+    # -------------------------------------------------
+    async def run(self) -> RecurringRunStats:
+        now = datetime.utcnow()
+        stats = RecurringRunStats(started_at=now)
+
+        # Bounded: claiming pauses while the lanes are busy
+        lanes: list[asyncio.Queue] = [
+            asyncio.Queue(maxsize=2) for _ in range(self.concurrency)
+        ]
+        workers = [
+            asyncio.create_task(self._lane(queue, stats, now)) for queue in lanes
+        ]
+
+        try:
+            while True:
+                rules = await self.service.repo.claim_due_batch(
+                    worker_id=worker_id(),
+                    now=now,
+                    lease_seconds=settings.RECURRING_LEASE_SECONDS,
+                    limit=self.batch_size,
+                )
+                if not rules:
+                    break
+
+                stats.batches += 1
+                stats.processed += len(rules)
+
+                by_lane: dict[int, list] = {}
+                for rule in rules:
+                    stats.record_lag((now - rule.next_run_at).total_seconds())
+                    by_lane.setdefault(self._lane_for(rule.user_id), []).append(rule)
+
+                for lane, lane_rules in by_lane.items():
+                    await lanes[lane].put(lane_rules)
+        finally:
+            for queue in lanes:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+
+        stats.finish()
+
+        logger.info(
+            "Recurring execution completed",
+            extra=stats.model_dump(mode="json", exclude={"results"}),
+        )
+
+        return stats
+
+    # -------------------------------------------------
+    # Internals
+    # -------------------------------------------------
+    def _lane_for(self, user_id: str) -> int:
+        return zlib.crc32(user_id.encode("utf-8")) % self.concurrency
+
+    async def _lane(
+        self,
+        queue: asyncio.Queue,
+        stats: RecurringRunStats,
+        now: datetime,
+    ) -> None:
+        while True:
+            rules = await queue.get()
+            if rules is None:
+                return
+
+            try:
+                results = await retry_async(
+                    lambda: self.service.execute_rules(rules, now=now),
+                    attempts=self.max_retries + 1,
+                    base_delay=self.retry_base_delay,
+                )
+            except Exception as exc:
+                # The leases are left to expire: it doubles as a cool-down
+                # before another worker picks the rules up again.
+                logger.error(
+                    "Recurring batch failed",
+                    extra={"rules": len(rules), "error": str(exc)},
+                    exc_info=exc,
+                )
+                stats.failed += len(rules)
+                continue
+
+            stats.record_results(results)
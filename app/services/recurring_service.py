@@ -1,13 +1,26 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
+from app.domain.dates import add_months
+from app.domain.forecast import build_forecast
+from app.domain.schedule import occurrences
 from app.errors.base import AppError
 from app.errors.codes import ErrorCode
+from app.models.recurring import RecurringTransactionInDB
+from app.repositories.occurrence_repo import RecurringOccurrenceRepository
 from app.repositories.recurring_repo import RecurringRepository
+from app.repositories.suggestion_repo import RecurringSuggestionRepository
 from app.repositories.transaction_repo import TransactionRepository
 from app.schemas.recurring import RecurringTransactionFilter
 from app.services.audit_service import AuditService
+from app.services.recurring_executor import (
+    RecurringExecutor,
+    RecurringRuleResult,
+    RecurringRunStats,
+)
 from app.services.transaction_service import TransactionService
+from app.services.upcoming_index import upcoming_index
+from app.settings import settings
 from app.utils.logger import get_logger
 
 logger = get_logger("pennywise.recurring")
@@ -17,6 +30,8 @@ class RecurringService:
     def __init__(self):
         self.repo = RecurringRepository()
         self.tx_repo = TransactionRepository()
+        self.occurrences = RecurringOccurrenceRepository()
+        self.suggestions = RecurringSuggestionRepository()
         self.tx_service = TransactionService()
         self.audit = AuditService()
 
@@ -40,6 +55,7 @@ class RecurringService:
         )
 
         recurring = await self.repo.create(user_id, payload)
+        upcoming_index.invalidate(user_id)
 
         await self.audit.log(
             action="RECURRING_TRANSACTION_CREATED",
@@ -65,11 +81,13 @@ class RecurringService:
         *,
         user_id: str,
         recurring_id: str,
+        fields: Optional[List[str]] = None,
         request=None,
     ):
         recurring = await self.repo.get_by_id(
             user_id=user_id,
             recurring_id=recurring_id,
+            fields=fields,
         )
 
         if not recurring:
@@ -101,6 +119,7 @@ class RecurringService:
         request=None,
     ):
         recurring = await self.repo.update(user_id, recurring_id, payload)
+        upcoming_index.invalidate(user_id)
 
         if not recurring:
             raise AppError(
@@ -131,6 +150,7 @@ class RecurringService:
         request=None,
     ):
         deleted = await self.repo.delete(user_id, recurring_id)
+        upcoming_index.invalidate(user_id)
 
         if not deleted:
             raise AppError(
@@ -159,6 +179,7 @@ class RecurringService:
         filters: RecurringTransactionFilter,
         page: int,
         limit: int,
+        fields: Optional[List[str]] = None,
         request=None,
     ):
         results, total = await self.repo.list(
@@ -169,6 +190,7 @@ class RecurringService:
             transaction_type=filters.type,
             page=page,
             limit=limit,
+            fields=fields,
         )
 
         await self.audit.log(
@@ -192,72 +214,199 @@ class RecurringService:
     # -------------------------------------------------
     # Execute due recurring transactions (with recursive support)
     # -------------------------------------------------
-    async def execute_due(self):
+    async def execute_due(self) -> RecurringRunStats:
         """
         Executes all due recurring transactions.
-        Supports recursive recurring transactions through parent_recurring_id.
-        """
-        rules = await self.repo.get_due_rules()
-
-        logger.info("Executing recurring rules", extra={"count": len(rules)})
 
-        for rule in rules:
-            await self._execute_recurring(rule)
+        Rules are claimed and written in batches, with a bounded number
+        of batches in flight (see RecurringExecutor); returns run statistics.
+        """
+        logger.info("Executing recurring rules")
 
-        logger.info("Recurring execution completed")
+        return await RecurringExecutor(self).run()
 
     # -------------------------------------------------
-    # Internal: Execute a single recurring transaction recursively
+    # Execute a batch of rules with bulk writes
     # -------------------------------------------------
-    async def _execute_recurring(
+    async def execute_rules(
         self,
-        rule,
-        parent_id: Optional[str] = None,
-    ):
+        rules: List[RecurringTransactionInDB],
+        *,
+        now: Optional[datetime] = None,
+    ) -> List[RecurringRuleResult]:
         """
-        Execute a single recurring transaction.
-        If it has a parent_recurring_id, it's part of a recursive chain.
+        Post every due occurrence of each rule, then advance the rules.
+
+        After downtime all missed occurrences are posted, each dated on its
+        own schedule date. A rule that is not yet due (manual execution)
+        posts its next occurrence.
+
+        The whole batch is written with one insert_many into the occurrence
+        ledger, one for transactions, one bulk_write advancing the rules and
+        one batch of audit records (one per executed rule and one
+        TRANSACTION_CREATED per posted transaction). A rule whose
+        transactions failed is not advanced; its lease expires and a later
+        tick picks it up again.
+
+        Safe to retry or re-run after a crash at any point: the ledger hands
+        out the same transaction id for an occurrence every time, so each
+        occurrence is posted exactly once.
         """
-        try:
-            payload = {
-                "date": datetime.utcnow(),
-                "amount": rule.amount,
-                "type": rule.type,
-                "category": rule.category,
-                "description": rule.description,
-                "source": "recurring",
-                "is_recurring": True,
-            }
+        now = now or datetime.utcnow()
+
+        plans: list[tuple[RecurringTransactionInDB, list[datetime], datetime]] = []
+        payloads: list[dict] = []
+        owners: list[int] = []
+
+        for index, rule in enumerate(rules):
+            dates, next_run_at = occurrences(
+                rule.next_run_at,
+                rule.frequency,
+                until=max(now, rule.next_run_at),
+                anchor_day=rule.schedule_anchor,
+                limit=settings.RECURRING_MAX_CATCH_UP,
+            )
+            plans.append((rule, dates, next_run_at))
+
+            for occurrence in dates:
+                payloads.append(
+                    {
+                        "user_id": rule.user_id,
+                        "date": min(occurrence, now),
+                        "amount": rule.amount,
+                        "type": rule.type,
+                        "category": rule.category,
+                        "description": rule.description,
+                        "source": "recurring",
+                        "is_recurring": True,
+                        "recurring_id": rule.id,
+                        "occurrence_date": occurrence,
+                    }
+                )
+                owners.append(index)
+
+        # ---------- Ledger (one insert_many) ----------
+        # Every occurrence gets its transaction id from the ledger, so a
+        # re-run after a crash re-inserts the same ids instead of new ones.
+        reserved = await self.occurrences.reserve(payloads)
+        for payload in payloads:
+            payload["_id"] = reserved[
+                (payload["recurring_id"], payload["occurrence_date"])
+            ]
+
+        # ---------- Transactions (one insert_many) ----------
+        created, failed = await self.tx_repo.bulk_insert(
+            transactions=payloads,
+            ignore_duplicates=True,
+        )
 
-            tx = await self.tx_service.create(
-                user_id=rule.user_id,
-                payload=payload,
+        failed_rules = {owners[index] for index in failed}
+        created_by_rule: dict[str, int] = {}
+        for tx in created:
+            created_by_rule[tx.recurring_id] = (
+                created_by_rule.get(tx.recurring_id, 0) + 1
             )
 
-            await self.repo.mark_executed(rule.id)
-
-            await self.audit.log(
-                action="RECURRING_TRANSACTION_EXECUTED",
-                user_id=rule.user_id,
-                entity="recurring",
-                entity_id=rule.id,
-                metadata={
-                    "transaction_id": tx.id,
-                    "amount": rule.amount,
-                    "frequency": rule.frequency,
-                    "parent_recurring_id": parent_id,
-                },
+        ids_by_rule: dict[str, list[str]] = {}
+        for payload in payloads:
+            ids_by_rule.setdefault(payload["recurring_id"], []).append(
+                str(payload["_id"])
             )
 
-            logger.info(
-                "Executed recurring transaction",
-                extra={
-                    "recurring_id": rule.id,
-                    "user_id": rule.user_id,
-                    "transaction_id": tx.id,
-                },
+        # ---------- Rules (one bulk_write) ----------
+        advanced = await self.repo.advance_many(
+            [
+                (rule, next_run_at)
+                for index, (rule, _, next_run_at) in enumerate(plans)
+                if index not in failed_rules
+            ],
+            executed_at=now,
+        )
+
+        # ---------- Results + audit (one insert_many) ----------
+        results: List[RecurringRuleResult] = []
+        audit_entries: list[dict] = []
+
+        for index, (rule, dates, next_run_at) in enumerate(plans):
+            transaction_ids = ids_by_rule.get(rule.id, [])
+            created_count = created_by_rule.get(rule.id, 0)
+
+            if index in failed_rules:
+                transaction_ids = []
+                status, error = "failed", "Transaction insert failed"
+            elif rule.id not in advanced:
+                status, error = "lease_lost", "Lease lost before the rule was advanced"
+            else:
+                status, error = "executed", None
+
+            results.append(
+                RecurringRuleResult(
+                    recurring_id=rule.id,
+                    user_id=rule.user_id,
+                    status=status,
+                    occurrences=len(transaction_ids),
+                    transaction_ids=transaction_ids,
+                    next_run_at=next_run_at if status == "executed" else None,
+                    error=error,
+                )
+            )
+
+            if status == "executed":
+                audit_entries.append(
+                    {
+                        "action": "RECURRING_TRANSACTION_EXECUTED",
+                        "user_id": rule.user_id,
+                        "entity": "recurring",
+                        "entity_id": rule.id,
+                        "metadata": {
+                            "transaction_ids": transaction_ids,
+                            "occurrences": len(transaction_ids),
+                            "created": created_count,
+                            "amount": rule.amount,
+                            "frequency": rule.frequency,
+                            "status": status,
+                            "next_run_at": next_run_at.isoformat(),
+                            "parent_recurring_id": rule.parent_recurring_id,
+                        },
+                    }
+                )
+
+        # Same per-transaction record as TransactionService.create; only
+        # transactions inserted now, so a retried batch is not audited twice
+        for tx in created:
+            audit_entries.append(
+                {
+                    "action": "TRANSACTION_CREATED",
+                    "user_id": tx.user_id,
+                    "entity": "transaction",
+                    "entity_id": tx.id,
+                    "metadata": {
+                        "amount": tx.amount,
+                        "type": tx.type,
+                        "category": tx.category,
+                        "date": tx.date.isoformat(),
+                        "source": tx.source,
+                    },
+                }
             )
 
+        await self.audit.log_many(audit_entries)
+
+        return results
+
+    # -------------------------------------------------
+    # Internal: Execute a single recurring transaction recursively
+    # -------------------------------------------------
+    async def _execute_recurring(
+        self,
+        rule: RecurringTransactionInDB,
+    ) -> Optional[RecurringRuleResult]:
+        """
+        Execute a single recurring transaction.
+        If it has a parent_recurring_id, it's part of a recursive chain.
+        """
+        try:
+            [result] = await self.execute_rules([rule])
         except Exception as exc:
             logger.error(
                 "Failed to execute recurring transaction",
@@ -267,6 +416,14 @@ class RecurringService:
                 },
                 exc_info=exc,
             )
+            return None
+
+        logger.info(
+            "Executed recurring transaction",
+            extra=result.model_dump(mode="json"),
+        )
+
+        return result
 
     # -------------------------------------------------
     # Execute a specific recurring transaction manually
@@ -324,12 +481,13 @@ class RecurringService:
         *,
         user_id: str,
         recurring_id: str,
-        page: int = 1,
         limit: int = 20,
+        cursor: Optional[str] = None,
         request=None,
     ):
         """
-        Fetch all transactions generated from a specific recurring rule.
+        Fetch transactions generated from a specific recurring rule, newest
+        first. Pass the returned `next_cursor` to get the following page.
         """
         recurring = await self.repo.get_by_id(
             user_id=user_id,
@@ -343,20 +501,11 @@ class RecurringService:
                 status_code=404,
             )
 
-        # Find all transactions with matching source and characteristics
-        query = {
-            "date": {},
-            "category": recurring.category,
-            "amount": recurring.amount,
-            "type": recurring.type,
-            "source": "recurring",
-        }
-
-        results, total = await self.tx_repo.list(
+        results, total, next_cursor = await self.tx_repo.list_by_recurring(
             user_id=user_id,
-            query=query,
-            page=page,
+            recurring_id=recurring_id,
             limit=limit,
+            cursor=cursor,
         )
 
         await self.audit.log(
@@ -365,7 +514,7 @@ class RecurringService:
             entity="recurring",
             entity_id=recurring_id,
             metadata={
-                "page": page,
+                "cursor": cursor,
                 "limit": limit,
                 "count": len(results),
             },
@@ -375,4 +524,255 @@ class RecurringService:
         return {
             "items": results,
             "total": total,
+            "next_cursor": next_cursor,
         }
+
+    # -------------------------------------------------
+    # Cash-flow forecast from active rules
+    # -------------------------------------------------
+    async def forecast(
+        self,
+        *,
+        user_id: str,
+        months: int,
+        granularity: str = "monthly",
+        include_history: bool = True,
+        history_months: int = 3,
+        request=None,
+    ) -> dict:
+        """
+        Project income, expense and balance for the next `months` months.
+
+        The balance starts from all transactions to date. With
+        `include_history`, the average of non-recurring transactions over
+        the last `history_months` months is added as a daily baseline.
+        """
+        today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        end = add_months(today, months)
+        history_start = add_months(today, -history_months)
+
+        rules = await self.repo.get_all_by_user(user_id, active_only=True)
+        baseline = await self.tx_repo.forecast_baseline(
+            user_id=user_id,
+            as_of=today,
+            history_start=history_start,
+        )
+
+        history = None
+        daily_income = daily_expense = 0.0
+        if include_history:
+            history_days = (today - history_start).days
+            daily_income = baseline["history_income"] / history_days
+            daily_expense = baseline["history_expense"] / history_days
+            history = {
+                "months": history_months,
+                "monthly_income": round(baseline["history_income"] / history_months, 2),
+                "monthly_expense": round(
+                    baseline["history_expense"] / history_months, 2
+                ),
+            }
+
+        projection = build_forecast(
+            rules,
+            start=today.date(),
+            end=end.date(),
+            granularity=granularity,
+            opening_balance=baseline["balance"],
+            daily_income=daily_income,
+            daily_expense=daily_expense,
+        )
+
+        income = projection["income"].round(2).tolist()
+        expense = projection["expense"].round(2).tolist()
+        net = projection["net"].round(2).tolist()
+        balance = projection["balance"].round(2).tolist()
+
+        await self.audit.log(
+            action="RECURRING_FORECAST_VIEWED",
+            user_id=user_id,
+            entity="recurring",
+            metadata={
+                "months": months,
+                "granularity": granularity,
+                "include_history": include_history,
+                "rules": len(rules),
+            },
+            request=request,
+        )
+
+        return {
+            "start": today.date(),
+            "end": end.date(),
+            "months": months,
+            "granularity": granularity,
+            "opening_balance": round(baseline["balance"], 2),
+            "history": history,
+            "totals": {
+                "income": round(float(projection["income"].sum()), 2),
+                "expense": round(float(projection["expense"].sum()), 2),
+                "net": round(float(projection["net"].sum()), 2),
+            },
+            "points": [
+                {
+                    "period_start": period_start,
+                    "income": income[i],
+                    "expense": expense[i],
+                    "net": net[i],
+                    "balance": balance[i],
+                }
+                for i, period_start in enumerate(projection["period_starts"])
+            ],
+        }
+
+    # -------------------------------------------------
+    # Suggestions detected from history
+    # -------------------------------------------------
+    async def list_suggestions(
+        self,
+        *,
+        user_id: str,
+        limit: int = 50,
+        request=None,
+    ):
+        suggestions = await self.suggestions.list_for_user(
+            user_id=user_id,
+            limit=limit,
+        )
+
+        await self.audit.log(
+            action="RECURRING_SUGGESTIONS_VIEWED",
+            user_id=user_id,
+            entity="recurring_suggestion",
+            metadata={"count": len(suggestions)},
+            request=request,
+        )
+
+        return suggestions
+
+    async def accept_suggestion(
+        self,
+        *,
+        user_id: str,
+        suggestion_id: str,
+        overrides: Optional[dict] = None,
+        request=None,
+    ):
+        """
+        Create a recurring rule from a pending suggestion in one call.
+        """
+        suggestion = await self._get_pending_suggestion(
+            user_id=user_id,
+            suggestion_id=suggestion_id,
+        )
+
+        payload = {
+            "amount": suggestion.amount,
+            "type": suggestion.type,
+            "category": suggestion.category,
+            "description": suggestion.description,
+            "frequency": suggestion.frequency,
+            "next_run_at": suggestion.next_run_at,
+            "parent_recurring_id": None,
+            **(overrides or {}),
+        }
+
+        recurring = await self.create(
+            user_id=user_id,
+            payload=payload,
+            request=request,
+        )
+
+        resolved = await self.suggestions.resolve(
+            user_id=user_id,
+            suggestion_id=suggestion_id,
+            status="accepted",
+            recurring_id=recurring.id,
+        )
+
+        if not resolved:
+            # Accepted concurrently: keep only the first rule
+            await self.repo.delete(user_id, recurring.id)
+            raise AppError(
+                code=ErrorCode.VALIDATION_ERROR,
+                message="Suggestion was already resolved",
+                status_code=400,
+            )
+
+        return recurring
+
+    async def dismiss_suggestion(
+        self,
+        *,
+        user_id: str,
+        suggestion_id: str,
+        request=None,
+    ):
+        await self._get_pending_suggestion(
+            user_id=user_id,
+            suggestion_id=suggestion_id,
+        )
+
+        await self.suggestions.resolve(
+            user_id=user_id,
+            suggestion_id=suggestion_id,
+            status="dismissed",
+        )
+
+        await self.audit.log(
+            action="RECURRING_SUGGESTION_DISMISSED",
+            user_id=user_id,
+            entity="recurring_suggestion",
+            entity_id=suggestion_id,
+            request=request,
+        )
+
+        return True
+
+    async def _get_pending_suggestion(
+        self,
+        *,
+        user_id: str,
+        suggestion_id: str,
+    ):
+        suggestion = await self.suggestions.get_by_id(
+            user_id=user_id,
+            suggestion_id=suggestion_id,
+        )
+
+        if not suggestion:
+            raise AppError(
+                code=ErrorCode.NOT_FOUND,
+                message="Suggestion not found",
+                status_code=404,
+            )
+
+        if suggestion.status != "pending":
+            raise AppError(
+                code=ErrorCode.VALIDATION_ERROR,
+                message="Suggestion was already resolved",
+                status_code=400,
+            )
+
+        return suggestion
+
+    # -------------------------------------------------
+    # Upcoming occurrences (in-memory index)
+    # -------------------------------------------------
+    async def upcoming(
+        self,
+        *,
+        user_id: str,
+        days: int,
+        request=None,
+    ) -> List[dict]:
+        items = await upcoming_index.upcoming(user_id, days=days)
+
+        await self.audit.log(
+            action="RECURRING_UPCOMING_VIEWED",
+            user_id=user_id,
+            entity="recurring",
+            metadata={"days": days, "count": len(items)},
+            request=request,
+        )
+
+        return items
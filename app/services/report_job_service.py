@@ -0,0 +1,142 @@
+from pathlib import Path
+from typing import List, Optional
+
+from app.domain.reports import report_period
+from app.errors.base import AppError
+from app.errors.codes import ErrorCode
+from app.models.report import ReportJobInDB
+from app.repositories.report_job_repo import ReportJobRepository
+from app.services.audit_service import AuditService
+from app.settings import settings
+from app.utils.logger import get_logger
+
+logger = get_logger("pennywise.report.jobs")
+
+
+class ReportJobService:
+    """
+    API side of the report queue: enqueue jobs and read their outcome.
+    Rendering happens in the report worker (app.tasks.report_worker).
+    """
+
+    def __init__(self):
+        self.repo = ReportJobRepository()
+        self.audit = AuditService()
+
+    # -------------------------------------------------
+    # Enqueue statement
+    # -------------------------------------------------
+    async def enqueue(
+        self,
+        *,
+        user_id: str,
+        kind: str,
+        params: dict,
+        engine: Optional[str] = None,
+        request=None,
+    ) -> ReportJobInDB:
+        """
+        Queue a monthly, annual or custom-range statement.
+
+        Params are validated here, so a malformed request fails fast
+        instead of as a worker retry.
+        """
+        try:
+            report_period(kind, params, max_days=settings.REPORT_MAX_RANGE_DAYS)
+        except ValueError as exc:
+            raise AppError(
+                code=ErrorCode.VALIDATION_ERROR,
+                message=str(exc),
+                status_code=400,
+            )
+
+        job = await self.repo.enqueue(
+            user_id=user_id,
+            kind=kind,
+            params={**params, "engine": engine},
+            max_attempts=settings.REPORT_JOB_MAX_ATTEMPTS,
+        )
+
+        await self.audit.log(
+            action="REPORT_QUEUED",
+            user_id=user_id,
+            entity="report_job",
+            entity_id=job.id,
+            metadata={"kind": kind, **params},
+            request=request,
+        )
+
+        logger.info(
+            "Report job queued",
+            extra={"user_id": user_id, "job_id": job.id, "kind": kind, **params},
+        )
+
+        return job
+
+    async def enqueue_monthly(
+        self,
+        *,
+        user_id: str,
+        month: str,
+        engine: Optional[str] = None,
+        request=None,
+    ) -> ReportJobInDB:
+        return await self.enqueue(
+            user_id=user_id,
+            kind="monthly",
+            params={"month": month},
+            engine=engine,
+            request=request,
+        )
+
+    # -------------------------------------------------
+    # Status / result
+    # -------------------------------------------------
+    async def get_job(self, *, user_id: str, job_id: str) -> ReportJobInDB:
+        job = await self.repo.get_by_id(user_id=user_id, job_id=job_id)
+
+        if not job:
+            raise AppError(
+                code=ErrorCode.NOT_FOUND,
+                message="Report job not found",
+                status_code=404,
+            )
+
+        return job
+
+    async def list_jobs(
+        self,
+        *,
+        user_id: str,
+        limit: int = 20,
+    ) -> List[ReportJobInDB]:
+        return await self.repo.list_for_user(user_id=user_id, limit=limit)
+
+    async def get_result(
+        self,
+        *,
+        user_id: str,
+        job_id: str,
+    ) -> tuple[ReportJobInDB, str]:
+        """
+        Returns:
+            (job, path of the rendered PDF)
+        """
+        job = await self.get_job(user_id=user_id, job_id=job_id)
+
+        if job.status != "succeeded":
+            raise AppError(
+                code=ErrorCode.VALIDATION_ERROR,
+                message=f"Report is not ready (status: {job.status})",
+                status_code=409,
+            )
+
+        path = job.result["path"]
+        if not Path(path).is_file():
+            raise AppError(
+                code=ErrorCode.NOT_FOUND,
+                message="Report file is no longer available",
+                status_code=404,
+            )
+
+        return job, path
@@ -1,22 +1,41 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Iterable
-
-from playwright.async_api import async_playwright
-
-from app.domain.money import format_currency
+import asyncio
+import os
+import tempfile
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Iterable, Optional
+
+from app.services.browser_pool import browser_pool
+from app.services.native_pdf import NativeStatementRenderer, has_unsupported_text
+from app.services.pdf_merge import merge_pdfs
+from app.services.statement_html import StatementHtmlWriter
+from app.settings import settings
 from app.utils.logger import get_logger
 
 logger = get_logger("pennywise.report")
 
+REPORT_ENGINES = ("auto", "chromium", "native")
+
+# Bump whenever the statement layout changes: invalidates cached reports
+TEMPLATE_VERSION = 5
+
+# Chromium page footer; merged (chunked) statements get the same footer
+# stamped on afterwards (see merge_pdfs)
+FOOTER_TEMPLATE = (
+    '<div style="width: 100%; font-size: 8px; color: #999; '
+    'text-align: right; padding: 0 20px;">'
+    'Page <span class="pageNumber"></span> of <span class="totalPages"></span>'
+    "</div>"
+)
+
 
 class ReportService:
     """
     Responsible ONLY for:
-    - transforming transaction data into HTML
-    - rendering PDF from HTML
-    - styling, totals, formatting
+    - rendering transaction data to PDF, via HTML + Chromium or natively
+      without a browser
+    - picking the engine for a report
 
     ❌ No DB access
     ❌ No auth
@@ -27,221 +46,321 @@ class ReportService:
         self,
         *,
         user_id: str,
-        transactions: Iterable[dict],
+        transactions: Iterable[dict] | AsyncIterable[dict],
         title: str,
         period_label: str,
         output_path: str,
-    ) -> str:
+        engine: Optional[str] = None,
+        breakdown: Optional[dict] = None,
+        unsupported_text: bool = False,
+    ) -> dict:
         """
-        Generate a PDF report for given transactions using Playwright.
+        Generate a PDF report for given transactions.
+
+        Transactions are consumed as a stream (e.g. straight from a Mongo
+        cursor); neither engine holds the full list in memory.
+
+        Engines:
+        - "chromium": HTML rendered by a pooled, already-running Chromium
+          (see BrowserPool); statements longer than REPORT_CHUNK_ROWS
+          are split into chunks rendered in parallel across the pool,
+          then merged
+        - "native": PDF written directly (see NativeStatementRenderer);
+          far faster and lighter for long statements
+        - "auto": native from REPORT_NATIVE_MIN_ROWS transactions on,
+          Chromium below; only that many rows are buffered to decide.
+          Chromium whenever the text is not all cp1252, which the native
+          fonts cannot show
 
         Args:
             user_id: owner of the report
-            transactions: iterable of transaction dicts
+            transactions: iterable or async iterable of transaction dicts
             title: report title (e.g. "Monthly Statement")
             period_label: "Jan 2026", "01–31 Jan 2026"
             output_path: where PDF will be written
+            engine: auto | chromium | native (default: REPORT_ENGINE)
+            breakdown: per-month / per-category aggregates to chart and
+                tabulate above the transactions (multi-month reports)
+            unsupported_text: the caller found text the native renderer
+                cannot show (e.g. "₹") anywhere in the statement; rows
+                buffered for "auto" are checked here as well
 
         Returns:
-            output_path
+            dict with path, engine, rows, income, expense and net
         """
-
-        tx_list = list(transactions)
+        stream = _as_async_iter(transactions)
+        engine = engine or settings.REPORT_ENGINE
+
+        if engine == "auto":
+            threshold = settings.REPORT_NATIVE_MIN_ROWS
+            head = []
+            async for tx in stream:
+                head.append(tx)
+                if len(head) >= threshold:
+                    break
+
+            engine = self.resolve_engine(
+                engine,
+                count=len(head),
+                unsupported_text=(
+                    unsupported_text or any(has_unsupported_text(tx) for tx in head)
+                ),
+            )
+            stream = _chain(head, stream)
+        else:
+            engine = self.resolve_engine(engine, count=0)
 
         logger.info(
             "PDF report generation started",
             extra={
                 "user_id": user_id,
-                "count": len(tx_list),
+                "engine": engine,
                 "output": output_path,
             },
         )
 
-        html = self._build_html(
+        kwargs = dict(
             title=title,
             period_label=period_label,
-            transactions=tx_list,
+            transactions=stream,
+            output_path=output_path,
+            breakdown=breakdown,
         )
-
-        # -------------------------
-        # Playwright PDF rendering (async)
-        # -------------------------
-        async with async_playwright() as p:
-            browser = await p.chromium.launch()
-            page = await browser.new_page()
-            await page.set_content(html)
-            await page.pdf(
-                path=output_path,
-                format="A4",
-                margin={
-                    "top": "20px",
-                    "bottom": "20px",
-                    "left": "20px",
-                    "right": "20px",
-                },
+        if engine == "native":
+            stats = await asyncio.wait_for(
+                self._render_native(**kwargs),
+                timeout=settings.REPORT_RENDER_TIMEOUT_SECONDS,
             )
-            await browser.close()
+        else:
+            # Each Chromium render is timed on its own (see _render_file),
+            # so a chunked statement gets the timeout per chunk
+            stats = await self._render_chromium(**kwargs)
 
         logger.info(
             "PDF report generated successfully",
             extra={
                 "user_id": user_id,
+                "engine": engine,
+                "count": stats["rows"],
                 "path": output_path,
             },
         )
 
-        return output_path
+        return {"path": output_path, "engine": engine, **stats}
+
+    def resolve_engine(
+        self,
+        engine: Optional[str],
+        *,
+        count: int,
+        unsupported_text: bool = False,
+    ) -> str:
+        engine = engine or settings.REPORT_ENGINE
+        if engine not in REPORT_ENGINES:
+            raise ValueError(f"Unknown report engine: {engine}")
+
+        if engine == "auto":
+            if unsupported_text:
+                return "chromium"
+            return "native" if count >= settings.REPORT_NATIVE_MIN_ROWS else "chromium"
+        return engine
 
     # -------------------------------------------------
-    # HTML builders
+    # Engines
     # -------------------------------------------------
-    def _build_html(
+    async def _render_native(
         self,
         *,
         title: str,
         period_label: str,
-        transactions: list[dict],
-    ) -> str:
-        income_total = sum(t["amount"] for t in transactions if t["type"] == "income")
-        expense_total = sum(t["amount"] for t in transactions if t["type"] == "expense")
-        net = income_total - expense_total
-
-        rows_html = "".join(self._render_row(t) for t in transactions)
-
-        generated_at = datetime.utcnow().strftime("%d %b %Y %H:%M UTC")
-
-        return f"""
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <title>{title}</title>
-            <style>
-                {self._base_css()}
-            </style>
-        </head>
-        <body>
-
-            <header>
-                <h1>{title}</h1>
-                <p class="period">{period_label}</p>
-                <p class="generated">Generated at {generated_at}</p>
-            </header>
-
-            <section class="summary">
-                <div>Income: <strong>{format_currency(income_total)}</strong></div>
-                <div>Expense: <strong>{format_currency(expense_total)}</strong></div>
-                <div class="net">
-                    Net: <strong>{format_currency(net)}</strong>
-                </div>
-            </section>
-
-            <table>
-                <thead>
-                    <tr>
-                        <th>Date</th>
-                        <th>Description</th>
-                        <th>Category</th>
-                        <th>Type</th>
-                        <th class="amount">Amount</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {rows_html}
-                </tbody>
-            </table>
-
-        </body>
-        </html>
+        transactions: AsyncIterable[dict],
+        output_path: str,
+        breakdown: Optional[dict] = None,
+    ) -> dict:
+        return await NativeStatementRenderer().render_async(
+            title=title,
+            period_label=period_label,
+            transactions=transactions,
+            output_path=output_path,
+            breakdown=breakdown,
+        )
+
+    async def _render_chromium(
+        self,
+        *,
+        title: str,
+        period_label: str,
+        transactions: AsyncIterable[dict],
+        output_path: str,
+        breakdown: Optional[dict] = None,
+    ) -> dict:
+        chunk_rows = settings.REPORT_CHUNK_ROWS
+        head = []
+        async for tx in transactions:
+            head.append(tx)
+            if len(head) > chunk_rows:
+                break
+
+        if len(head) > chunk_rows:
+            return await self._render_chromium_chunked(
+                title=title,
+                period_label=period_label,
+                transactions=_chain(head, transactions),
+                output_path=output_path,
+                breakdown=breakdown,
+            )
+
+        fd, html_path = tempfile.mkstemp(suffix=".html")
+        os.close(fd)
+
+        try:
+            stats = await StatementHtmlWriter().write(
+                html_path,
+                title=title,
+                period_label=period_label,
+                transactions=_chain(head, transactions),
+                breakdown=breakdown,
+            )
+
+            # -------------------------
+            # Playwright PDF rendering (warm pool)
+            # -------------------------
+            await self._render_file(html_path, output_path)
+        finally:
+            os.unlink(html_path)
+
+        return stats
+
+    async def _render_chromium_chunked(
+        self,
+        *,
+        title: str,
+        period_label: str,
+        transactions: AsyncIterable[dict],
+        output_path: str,
+        breakdown: Optional[dict] = None,
+    ) -> dict:
         """
+        Summary document plus page-aligned chunks of about
+        REPORT_CHUNK_ROWS rows of the table, rendered concurrently (one per
+        pooled browser), merged in order with continuous page numbers.
 
-    def _render_row(self, t: dict) -> str:
-        date = (
-            t["date"].strftime("%d %b %Y")
-            if hasattr(t["date"], "strftime")
-            else str(t["date"])
+        One long page.pdf() call is single-threaded in Chromium; chunks
+        make the wall time shrink with the pool size. Every chunk starts
+        on a new page, with the table header repeated.
+        """
+        writer = StatementHtmlWriter()
+
+        with tempfile.TemporaryDirectory(prefix="statement-") as workdir:
+            stats = await writer.write_chunks(
+                workdir,
+                title=title,
+                transactions=transactions,
+                chunk_rows=settings.REPORT_CHUNK_ROWS,
+                heading=bool(breakdown),
+            )
+            # Written last: the totals come from the same pass as the rows
+            summary_path = os.path.join(workdir, "summary.html")
+            writer.write_summary(
+                summary_path,
+                title=title,
+                period_label=period_label,
+                income=stats["income"],
+                expense=stats["expense"],
+                breakdown=breakdown,
+            )
+
+            html_paths = [summary_path, *stats.pop("chunks")]
+            pdf_paths = [path[: -len(".html")] + ".pdf" for path in html_paths]
+
+            renders = [
+                asyncio.create_task(self._render_file(html, pdf, footer=False))
+                for html, pdf in zip(html_paths, pdf_paths)
+            ]
+            try:
+                await asyncio.gather(*renders)
+            except BaseException:
+                # Don't leave chunks rendering into a deleted directory
+                for render in renders:
+                    render.cancel()
+                await asyncio.gather(*renders, return_exceptions=True)
+                raise
+
+            stats["pages"] = await asyncio.to_thread(
+                merge_pdfs, pdf_paths, output_path, title=title
+            )
+
+        logger.info(
+            "Chunked PDF merged",
+            extra={"chunks": len(pdf_paths), "pages": stats["pages"]},
         )
 
-        amount_class = "income" if t["type"] == "income" else "expense"
-
-        return f"""
-        <tr>
-            <td>{date}</td>
-            <td>{t.get("description", "")}</td>
-            <td>{t.get("category", "")}</td>
-            <td>{t["type"].title()}</td>
-            <td class="amount {amount_class}">
-                {format_currency(t["amount"])}
-            </td>
-        </tr>
-        """
+        return stats
 
-    # -------------------------------------------------
-    # CSS
-    # -------------------------------------------------
-    def _base_css(self) -> str:
-        return """
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Arial;
-            font-size: 12px;
-            color: #222;
-            margin: 24px;
-        }
-
-        header {
-            margin-bottom: 24px;
-        }
-
-        h1 {
-            margin: 0;
-            font-size: 20px;
-        }
-
-        .period {
-            color: #666;
-            margin: 4px 0;
-        }
-
-        .generated {
-            font-size: 10px;
-            color: #999;
-        }
-
-        .summary {
-            display: flex;
-            gap: 24px;
-            margin-bottom: 20px;
-        }
-
-        .summary .net {
-            font-weight: bold;
-        }
-
-        table {
-            width: 100%;
-            border-collapse: collapse;
-        }
-
-        thead th {
-            border-bottom: 2px solid #ddd;
-            padding: 8px;
-            text-align: left;
-        }
-
-        tbody td {
-            border-bottom: 1px solid #eee;
-            padding: 8px;
-        }
-
-        .amount {
-            text-align: right;
-            white-space: nowrap;
-        }
-
-        .income {
-            color: #2e7d32;
-        }
-
-        .expense {
-            color: #c62828;
-        }
+    async def _render_file(
+        self,
+        html_path: str,
+        output_path: str,
+        *,
+        footer: bool = True,
+    ) -> None:
+        """
+        Render one HTML file. REPORT_RENDER_TIMEOUT_SECONDS applies to the
+        render itself, not to the wait for a pooled browser.
         """
+        async with browser_pool.page() as page:
+            await asyncio.wait_for(
+                self._render_pdf(
+                    page,
+                    html_url=Path(html_path).as_uri(),
+                    output_path=output_path,
+                    footer=footer,
+                ),
+                timeout=settings.REPORT_RENDER_TIMEOUT_SECONDS,
+            )
+
+    async def _render_pdf(
+        self,
+        page,
+        *,
+        html_url: str,
+        output_path: str,
+        footer: bool = True,
+    ) -> None:
+        # Loaded from disk: the HTML never has to exist as one Python string
+        await page.goto(html_url)
+        await page.pdf(
+            path=output_path,
+            format="A4",
+            display_header_footer=footer,
+            header_template="<div></div>",
+            footer_template=FOOTER_TEMPLATE,
+            margin={
+                "top": "20px",
+                # Room for the page number, drawn by Chromium or stamped later
+                "bottom": "40px",
+                "left": "20px",
+                "right": "20px",
+            },
+        )
+
+
+# -------------------------------------------------
+# Stream helpers
+# -------------------------------------------------
+async def _as_async_iter(
+    transactions: Iterable[dict] | AsyncIterable[dict],
+) -> AsyncIterator[dict]:
+    if hasattr(transactions, "__aiter__"):
+        async for tx in transactions:
+            yield tx
+    else:
+        for tx in transactions:
+            yield tx
+
+
+async def _chain(head: list[dict], rest: AsyncIterator[dict]) -> AsyncIterator[dict]:
+    for tx in head:
+        yield tx
+    async for tx in rest:
+        yield tx
@@ -0,0 +1,231 @@
+import asyncio
+import hashlib
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Collection, List, Optional
+from uuid import uuid4
+
+from app.repositories.report_cache_repo import ReportCacheRepository
+from app.settings import settings
+from app.utils.logger import get_logger
+
+logger = get_logger("pennywise.report.store")
+
+CHUNK_SIZE = 1024 * 1024
+
+REPORT_STORE_NOT_SHARED = (
+    "REPORT_STORE_DIR is not the storage the other processes use: mount the "
+    "same shared volume at the same path on every API and report worker host"
+)
+
+
+def report_cache_key(
+    *,
+    user_id: str,
+    period: str,
+    template_version: int,
+    engine: Optional[str],
+    data_version: str,
+) -> str:
+    """
+    Identity of a rendered statement: same inputs, same PDF. Any write to
+    the transactions of a month in the period bumps `data_version` and so
+    changes the key.
+
+    Args:
+        period: canonical report period, e.g. "monthly:2026-01"
+    """
+    raw = f"{user_id}|{period}|{template_version}|{engine or 'auto'}|{data_version}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ReportStore:
+    """
+    Content-addressed storage for rendered reports.
+
+    - Blobs live at <root>/<aa>/<sha256>.pdf, named by their content hash,
+      and are written via a temp file + atomic rename
+    - The report_cache collection maps cache keys to blobs
+    - Entries unused for `max_age_days` are evicted, then the least
+      recently used ones until the total is under `max_bytes`
+
+    With several worker hosts, `root` must be shared storage.
+    """
+
+    def __init__(
+        self,
+        *,
+        root: str = settings.REPORT_STORE_DIR,
+        max_bytes: int = settings.REPORT_STORE_MAX_BYTES,
+        max_age_days: int = settings.REPORT_STORE_MAX_AGE_DAYS,
+    ):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        self.repo = ReportCacheRepository()
+
+    # -------------------------------------------------
+    # Public API
+    # -------------------------------------------------
+    def temp_path(self) -> str:
+        """Render target on the store's filesystem, so save() can rename it."""
+        tmp = self.root / "tmp"
+        tmp.mkdir(parents=True, exist_ok=True)
+        return str(tmp / f"{uuid4().hex}.pdf")
+
+    def path_for(self, digest: str) -> str:
+        return str(self.root / digest[:2] / f"{digest}.pdf")
+
+    async def check_shared(self) -> bool:
+        """
+        Check that `root` is the storage every other process uses.
+
+        Workers write reports there and the API serves them from there, so
+        on several hosts it must be shared (e.g. a network volume). The
+        process that finds `root` without a marker (new, or wiped) drops a
+        fresh random token into it and registers that token in the
+        database. A process whose marker holds another token is looking at
+        a different directory than the last one initialised: its reports
+        would be missing elsewhere.
+
+        Returns:
+            False if `root` is not the registered store
+        """
+        marker = self.root / ".store-id"
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        token = uuid4().hex
+        staged = self.root / f".store-id.{token}"
+        staged.write_text(token)
+        try:
+            # Atomic create-if-absent: a concurrent starter reads either no
+            # marker or a complete one
+            os.link(staged, marker)
+            created = True
+        except FileExistsError:
+            created = False
+        finally:
+            staged.unlink()
+
+        local = marker.read_text().strip()
+        registered = await self.repo.get_store_token()
+        if created or registered is None:
+            await self.repo.set_store_token(local)
+            return True
+
+        return registered == local
+
+    async def lookup(self, key: str) -> Optional[dict]:
+        """
+        Returns:
+            The cache entry (digest, size, metadata) with its blob path,
+            or None
+        """
+        entry = await self.repo.get(key)
+        if not entry:
+            return None
+
+        path = self.path_for(entry["digest"])
+        if not os.path.isfile(path):
+            # Blob removed behind our back: treat as a miss
+            await self.repo.delete_many([key])
+            return None
+
+        return {**entry, "path": path}
+
+    async def save(self, key: str, temp_path: str, *, metadata: dict) -> dict:
+        """
+        Move a rendered file into the store and index it under `key`.
+
+        Returns:
+            dict with digest, size and path
+        """
+        digest, size = await asyncio.to_thread(self._commit, temp_path)
+
+        replaced = await self.repo.put(
+            key,
+            digest=digest,
+            size=size,
+            metadata=metadata,
+        )
+        if replaced:
+            await self._remove_unreferenced([replaced])
+
+        try:
+            await self.evict()
+        except Exception as exc:
+            # Eviction is best effort; the report itself is stored
+            logger.error("Report store eviction failed", exc_info=exc)
+
+        return {"digest": digest, "size": size, "path": self.path_for(digest)}
+
+    async def evict(self) -> int:
+        """
+        Returns:
+            Number of cache entries evicted
+        """
+        evicted = 0
+
+        cutoff = datetime.utcnow() - timedelta(days=self.max_age_days)
+        while entries := await self.repo.least_recently_used(used_before=cutoff):
+            evicted += await self._drop(entries)
+
+        total = await self.repo.total_size()
+        while total > self.max_bytes:
+            entries = await self.repo.least_recently_used()
+            if not entries:
+                break
+
+            victims = []
+            for entry in entries:
+                if total <= self.max_bytes:
+                    break
+                victims.append(entry)
+                total -= entry["size"]
+
+            evicted += await self._drop(victims)
+
+        if evicted:
+            logger.info("Report store evicted", extra={"entries": evicted})
+
+        return evicted
+
+    # -------------------------------------------------
+    # Internals
+    # -------------------------------------------------
+    def _commit(self, temp_path: str) -> tuple[str, int]:
+        sha = hashlib.sha256()
+        size = 0
+        with open(temp_path, "rb") as fh:
+            while chunk := fh.read(CHUNK_SIZE):
+                sha.update(chunk)
+                size += len(chunk)
+
+        digest = sha.hexdigest()
+        final = Path(self.path_for(digest))
+
+        if final.exists():
+            # Same content already stored
+            os.unlink(temp_path)
+        else:
+            final.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(temp_path, final)
+
+        return digest, size
+
+    async def _drop(self, entries: List[dict]) -> int:
+        if not entries:
+            return 0
+
+        await self.repo.delete_many(entry["_id"] for entry in entries)
+        await self._remove_unreferenced({entry["digest"] for entry in entries})
+        return len(entries)
+
+    async def _remove_unreferenced(self, digests: Collection[str]) -> None:
+        in_use = await self.repo.referenced_digests(digests)
+        for digest in set(digests) - in_use:
+            try:
+                os.unlink(self.path_for(digest))
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,450 @@
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from html import escape
+from string import Template
+from typing import AsyncIterable, Optional
+
+from app.domain.charts import category_chart_svg, monthly_chart_svg
+from app.domain.money import format_currency
+
+# -------------------------------------------------
+# Templates (compiled once, at import)
+# -------------------------------------------------
+_CSS = """
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Arial;
+    font-size: 12px;
+    color: #222;
+    margin: 24px;
+}
+
+header {
+    margin-bottom: 24px;
+}
+
+h1 {
+    margin: 0;
+    font-size: 20px;
+}
+
+.period {
+    color: #666;
+    margin: 4px 0;
+}
+
+.generated {
+    font-size: 10px;
+    color: #999;
+}
+
+.summary {
+    display: flex;
+    gap: 24px;
+    margin-bottom: 20px;
+}
+
+.summary .net {
+    font-weight: bold;
+}
+
+table {
+    width: 100%;
+    border-collapse: collapse;
+}
+
+thead th {
+    border-bottom: 2px solid #ddd;
+    padding: 8px;
+    text-align: left;
+}
+
+tbody td {
+    border-bottom: 1px solid #eee;
+    padding: 8px;
+}
+
+.amount {
+    text-align: right;
+    white-space: nowrap;
+}
+
+.income {
+    color: #2e7d32;
+}
+
+.expense {
+    color: #c62828;
+}
+
+h2 {
+    font-size: 14px;
+    margin: 20px 0 8px;
+}
+
+.chart {
+    display: block;
+    margin-bottom: 12px;
+    page-break-inside: avoid;
+}
+
+.breakdown table {
+    margin-bottom: 16px;
+}
+"""
+
+_HEAD = Template("""<html>
+<head>
+<meta charset="utf-8">
+<title>$title</title>
+<style>$css</style>
+</head>
+<body>
+<header>
+<h1>$title</h1>
+<p class="period">$period_label</p>
+<p class="generated">Generated at $generated_at</p>
+</header>
+<section class="summary">
+<div>Income: <strong>$income</strong></div>
+<div>Expense: <strong>$expense</strong></div>
+<div class="net">Net: <strong>$net</strong></div>
+</section>
+""")
+
+# Documents of a chunked statement (see write_chunks): the summary, then
+# the transaction rows split across several documents
+_CHUNK_HEAD = Template("""<html>
+<head>
+<meta charset="utf-8">
+<title>$title</title>
+<style>$css</style>
+</head>
+<body>
+""")
+
+# Chunk tables use fixed-height, single-line rows (long text is cut with
+# an ellipsis, as in the native renderer), so a page holds a known number
+# of rows and chunks can end exactly at a page break
+_CHUNK_ROW_PX = 33  # 16 line + 2 * 8 padding + 1 border
+_CHUNK_HEADER_PX = 34  # Repeated on every page
+_CHUNK_HEADING_ROWS = 2  # Room the "Transactions" heading takes, in rows
+# A4 at 96 px/in, less the 20px / 40px print margins (ReportService)
+_PRINTABLE_PX = 1122 - 20 - 40
+# One row of slack absorbs rounding in Chromium's layout
+ROWS_PER_PAGE = (_PRINTABLE_PX - _CHUNK_HEADER_PX) // _CHUNK_ROW_PX - 1
+
+_CHUNK_CSS = _CSS + """
+body {
+    margin: 0 24px;
+}
+
+table {
+    table-layout: fixed;
+}
+
+thead th,
+tbody td {
+    height: 16px;
+    line-height: 16px;
+    white-space: nowrap;
+    overflow: hidden;
+    text-overflow: ellipsis;
+}
+
+th:nth-child(1) {
+    width: 80px;
+}
+
+th:nth-child(3) {
+    width: 120px;
+}
+
+th:nth-child(4) {
+    width: 70px;
+}
+
+th:nth-child(5) {
+    width: 100px;
+}
+"""
+
+_SUMMARY_TAIL = """</body>
+</html>
+"""
+
+_TRANSACTIONS_HEADING = "<h2>Transactions</h2>\n"
+
+_TABLE_HEAD = """<table>
+<thead>
+<tr>
+<th>Date</th>
+<th>Description</th>
+<th>Category</th>
+<th>Type</th>
+<th class="amount">Amount</th>
+</tr>
+</thead>
+<tbody>
+"""
+
+_ROW = (
+    "<tr><td>{date}</td><td>{description}</td><td>{category}</td>"
+    '<td>{type}</td><td class="amount {type_class}">{amount}</td></tr>\n'
+).format
+
+_MONTH_ROW = (
+    '<tr><td>{month}</td><td class="amount income">{income}</td>'
+    '<td class="amount expense">{expense}</td>'
+    '<td class="amount {net_class}">{net}</td></tr>\n'
+).format
+
+_CATEGORY_ROW = (
+    "<tr><td>{category}</td><td>{type}</td>"
+    '<td class="amount">{count}</td>'
+    '<td class="amount {type_class}">{total}</td></tr>\n'
+).format
+
+_TAIL = """</tbody>
+</table>
+</body>
+</html>
+"""
+
+
+def _breakdown_html(breakdown: dict) -> str:
+    """Charts and breakdown tables; all aggregates, so small."""
+    parts = ['<section class="breakdown">']
+
+    months = breakdown.get("months") or []
+    if months:
+        parts.append("<h2>By month</h2>")
+        parts.append(f'<div class="chart">{monthly_chart_svg(months)}</div>')
+        parts.append(
+            '<table><thead><tr><th>Month</th><th class="amount">Income</th>'
+            '<th class="amount">Expense</th><th class="amount">Net</th>'
+            "</tr></thead><tbody>\n"
+        )
+        for month in months:
+            net = month["income"] - month["expense"]
+            parts.append(
+                _MONTH_ROW(
+                    month=escape(month["month"]),
+                    income=format_currency(month["income"]),
+                    expense=format_currency(month["expense"]),
+                    net_class="income" if net >= 0 else "expense",
+                    net=format_currency(net),
+                )
+            )
+        parts.append("</tbody></table>\n")
+
+    categories = breakdown.get("categories") or []
+    if categories:
+        parts.append("<h2>By category</h2>")
+        parts.append(f'<div class="chart">{category_chart_svg(categories)}</div>')
+        parts.append(
+            "<table><thead><tr><th>Category</th><th>Type</th>"
+            '<th class="amount">Count</th><th class="amount">Total</th>'
+            "</tr></thead><tbody>\n"
+        )
+        for row in categories:
+            parts.append(
+                _CATEGORY_ROW(
+                    category=escape(row["category"]),
+                    type=escape(row["type"].title()),
+                    count=row["count"],
+                    type_class="income" if row["type"] == "income" else "expense",
+                    total=format_currency(row["total"]),
+                )
+            )
+        parts.append("</tbody></table>\n")
+
+    parts.append("</section>\n")
+    return "".join(parts)
+
+
+def _head(title: str, period_label: str, *, income: float, expense: float) -> str:
+    return _HEAD.substitute(
+        title=escape(title),
+        css=_CSS,
+        period_label=escape(period_label),
+        generated_at=datetime.utcnow().strftime("%d %b %Y %H:%M UTC"),
+        income=format_currency(income),
+        expense=format_currency(expense),
+        net=format_currency(income - expense),
+    )
+
+
+def _row(tx: dict) -> str:
+    date = tx["date"]
+    return _ROW(
+        date=(
+            date.strftime("%d %b %Y")
+            if hasattr(date, "strftime")
+            else escape(str(date))
+        ),
+        description=escape(tx.get("description") or ""),
+        category=escape(tx.get("category") or ""),
+        type=escape(tx["type"].title()),
+        type_class="income" if tx["type"] == "income" else "expense",
+        amount=format_currency(tx["amount"]),
+    )
+
+
+class StatementHtmlWriter:
+    """
+    Writes the statement HTML to a file while consuming a transaction stream.
+
+    Rows go to a scratch file as they arrive and the totals are summed in
+    the same pass; the header (which shows the totals) is then written
+    followed by a streamed copy of the rows. Memory stays flat whatever
+    the statement size. All user data is HTML-escaped.
+    """
+
+    async def write(
+        self,
+        path: str,
+        *,
+        title: str,
+        period_label: str,
+        transactions: AsyncIterable[dict],
+        breakdown: Optional[dict] = None,
+    ) -> dict:
+        """
+        Args:
+            breakdown: months/categories aggregates (see
+                TransactionRepository.report_breakdown), rendered as charts
+                and tables above the transactions
+
+        Returns:
+            dict with rows, income, expense and net
+        """
+        income = expense = 0.0
+        rows = 0
+
+        with tempfile.TemporaryFile("w+", encoding="utf-8") as body:
+            async for tx in transactions:
+                if tx["type"] == "income":
+                    income += tx["amount"]
+                else:
+                    expense += tx["amount"]
+                rows += 1
+
+                body.write(_row(tx))
+
+            body.seek(0)
+            with open(path, "w", encoding="utf-8") as out:
+                out.write(_head(title, period_label, income=income, expense=expense))
+                if breakdown:
+                    out.write(_breakdown_html(breakdown))
+                    out.write(_TRANSACTIONS_HEADING)
+                out.write(_TABLE_HEAD)
+                shutil.copyfileobj(body, out)
+                out.write(_TAIL)
+
+        return {
+            "rows": rows,
+            "income": income,
+            "expense": expense,
+            "net": income - expense,
+        }
+
+    # -------------------------------------------------
+    # Chunked statement (rendered in parallel, then merged)
+    # -------------------------------------------------
+    async def write_chunks(
+        self,
+        directory: str,
+        *,
+        title: str,
+        transactions: AsyncIterable[dict],
+        chunk_rows: int,
+        heading: bool = False,
+    ) -> dict:
+        """
+        Write the transaction table as standalone documents
+        (chunk-0000.html, chunk-0001.html, ...), each with its own table
+        header. The summary goes in a separate document (write_summary),
+        written once the totals are known.
+
+        Every chunk starts on a new page once merged, so chunks hold whole
+        pages of rows: `chunk_rows` is rounded down to a multiple of
+        ROWS_PER_PAGE (at least one page), and the first chunk gives up
+        the room of the heading.
+
+        Args:
+            chunk_rows: target rows per chunk
+            heading: open the first chunk with the "Transactions" heading
+                (when a breakdown precedes the table)
+
+        Returns:
+            dict with rows, income, expense, net and chunks (paths, in order)
+        """
+        chunk_rows = max(1, chunk_rows // ROWS_PER_PAGE) * ROWS_PER_PAGE
+        income = expense = 0.0
+        rows = 0
+        chunks: list[str] = []
+        out = None
+        # Rows left before the current chunk is full
+        room = 0
+
+        try:
+            async for tx in transactions:
+                if room == 0:
+                    if out is not None:
+                        out.write(_TAIL)
+                        out.close()
+
+                    chunks.append(
+                        os.path.join(directory, f"chunk-{len(chunks):04d}.html")
+                    )
+                    out = open(chunks[-1], "w", encoding="utf-8")
+                    out.write(
+                        _CHUNK_HEAD.substitute(title=escape(title), css=_CHUNK_CSS)
+                    )
+                    room = chunk_rows
+                    if heading and len(chunks) == 1:
+                        out.write(_TRANSACTIONS_HEADING)
+                        room -= _CHUNK_HEADING_ROWS
+                    out.write(_TABLE_HEAD)
+
+                if tx["type"] == "income":
+                    income += tx["amount"]
+                else:
+                    expense += tx["amount"]
+                rows += 1
+                room -= 1
+
+                out.write(_row(tx))
+
+            if out is not None:
+                out.write(_TAIL)
+        finally:
+            if out is not None:
+                out.close()
+
+        return {
+            "rows": rows,
+            "income": income,
+            "expense": expense,
+            "net": income - expense,
+            "chunks": chunks,
+        }
+
+    def write_summary(
+        self,
+        path: str,
+        *,
+        title: str,
+        period_label: str,
+        income: float,
+        expense: float,
+        breakdown: Optional[dict] = None,
+    ) -> None:
+        """First document of a chunked statement: header, totals, breakdown."""
+        with open(path, "w", encoding="utf-8") as out:
+            out.write(_head(title, period_label, income=income, expense=expense))
+            if breakdown:
+                out.write(_breakdown_html(breakdown))
+            out.write(_SUMMARY_TAIL)
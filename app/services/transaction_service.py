@@ -1,9 +1,11 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from uuid import uuid4
 
+from app.domain.fingerprint import fingerprint_for
 from app.errors.base import AppError
 from app.errors.codes import ErrorCode
+from app.models.transaction import TransactionInDB
 from app.repositories.transaction_repo import TransactionRepository
 from app.schemas.transaction import TransactionFilter
 from app.services.audit_service import AuditService
@@ -125,6 +127,7 @@ class TransactionService:
         filters: TransactionFilter,
         page: int,
         limit: int,
+        fields: Optional[List[str]] = None,
         request=None,
     ):
         query: dict = {}
@@ -154,6 +157,7 @@ class TransactionService:
             query=query,
             page=page,
             limit=limit,
+            fields=fields,
         )
 
         await self.audit.log(
@@ -182,11 +186,13 @@ class TransactionService:
         *,
         user_id: str,
         transaction_id: str,
+        fields: Optional[List[str]] = None,
         request=None,
     ):
         tx = await self.repo.get_by_id(
             user_id=user_id,
             transaction_id=transaction_id,
+            fields=fields,
         )
 
         if not tx:
@@ -216,13 +222,40 @@ class TransactionService:
         transactions: List[dict],
         import_id: Optional[str],
         source: str,
+        skip_duplicates: bool = True,
         request=None,
     ):
+        """
+        Insert a confirmed batch.
+
+        Every row is fingerprinted and the whole batch is checked against the
+        user's history in one query. Rows already present are reported by
+        index and, when `skip_duplicates` is set, not inserted again.
+
+        Returns:
+            (created transactions, indexes of duplicate rows in the batch)
+        """
         if not import_id:
             import_id = str(uuid4())
 
         for tx in transactions:
             tx["source"] = source
+            tx["fingerprint"] = fingerprint_for(tx)
+
+        # A statement can repeat a row (e.g. two identical purchases): look
+        # each fingerprint up once
+        existing = await self.repo.find_existing_fingerprints(
+            user_id=user_id,
+            fingerprints=list(dict.fromkeys(tx["fingerprint"] for tx in transactions)),
+        )
+
+        duplicates = [
+            i for i, tx in enumerate(transactions) if tx["fingerprint"] in existing
+        ]
+
+        if skip_duplicates and duplicates:
+            skipped = set(duplicates)
+            transactions = [tx for i, tx in enumerate(transactions) if i not in skipped]
 
         created = await self.repo.bulk_create(
             user_id=user_id,
@@ -236,13 +269,15 @@ class TransactionService:
             entity="transaction",
             metadata={
                 "count": len(created),
+                "duplicates": len(duplicates),
+                "skip_duplicates": skip_duplicates,
                 "source": source,
                 "import_id": import_id,
             },
             request=request,
         )
 
-        return created
+        return created, duplicates
 
     # -------------------------------------------------
     # List transactions for a given month (YYYY-MM)
@@ -283,6 +318,47 @@ class TransactionService:
 
         return transactions
 
+    # -------------------------------------------------
+    # Stream transactions for an arbitrary range [start, end)
+    # -------------------------------------------------
+    async def iter_range(
+        self,
+        *,
+        user_id: str,
+        start: datetime,
+        end: datetime,
+        batch_size: int = 500,
+        request=None,
+    ) -> AsyncIterator[TransactionInDB]:
+        """
+        Validate the range, audit the read, and return an async iterator over
+        the matching transactions (oldest first).
+        """
+        if start >= end:
+            raise AppError(
+                code=ErrorCode.VALIDATION_ERROR,
+                message="Range start must be before range end",
+                status_code=400,
+            )
+
+        await self.audit.log(
+            action="TRANSACTION_RANGE_LISTED",
+            user_id=user_id,
+            entity="transaction",
+            metadata={
+                "from": start.isoformat(),
+                "to": end.isoformat(),
+            },
+            request=request,
+        )
+
+        return self.repo.iter_range(
+            user_id=user_id,
+            start=start,
+            end=end,
+            batch_size=batch_size,
+        )
+
     # -------------------------------------------------
     # Aggregation summary
     # -------------------------------------------------
@@ -0,0 +1,125 @@
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+
+from app.domain.schedule import occurrences
+from app.repositories.recurring_repo import VERSION_SCOPE, RecurringRepository
+from app.repositories.version_repo import DataVersionRepository
+from app.settings import settings
+
+
+@dataclass
+class _UserSchedule:
+    version: str
+    day: date
+    dates: List[datetime]  # Sorted, parallel to items
+    items: List[dict]
+
+
+class UpcomingIndex:
+    """
+    Per-user index of upcoming recurring occurrences, kept in memory.
+
+    An entry holds every occurrence of the user's active rules over the
+    next `horizon_days`, sorted by date, so a lookup is two bisects. It is
+    rebuilt when the user's recurring data version changes (any rule write,
+    in any process), when the day changes, or after invalidate(). The least
+    recently used users are evicted beyond `max_users`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_users: int = settings.RECURRING_UPCOMING_CACHE_SIZE,
+        horizon_days: int = settings.RECURRING_UPCOMING_MAX_DAYS,
+    ):
+        self.max_users = max_users
+        self.horizon_days = horizon_days
+        self.repo = RecurringRepository()
+        self.versions = DataVersionRepository()
+        self._entries: OrderedDict[str, _UserSchedule] = OrderedDict()
+
+    # -------------------------------------------------
+    # Public API
+    # -------------------------------------------------
+    async def upcoming(
+        self,
+        user_id: str,
+        *,
+        days: int,
+        now: Optional[datetime] = None,
+    ) -> List[dict]:
+        """
+        Occurrences from the start of today through now + `days`.
+        """
+        now = now or datetime.utcnow()
+        today = datetime.combine(now.date(), datetime.min.time())
+
+        version = await self.versions.get(user_id, VERSION_SCOPE)
+        entry = self._entries.get(user_id)
+
+        if entry is None or entry.version != version or entry.day != today.date():
+            entry = await self._build(user_id, version=version, today=today)
+        else:
+            self._entries.move_to_end(user_id)
+
+        start = bisect_left(entry.dates, today)
+        end = bisect_right(entry.dates, now + timedelta(days=days))
+        return entry.items[start:end]
+
+    def invalidate(self, user_id: str) -> None:
+        self._entries.pop(user_id, None)
+
+    # -------------------------------------------------
+    # Internals
+    # -------------------------------------------------
+    async def _build(
+        self,
+        user_id: str,
+        *,
+        version: str,
+        today: datetime,
+    ) -> _UserSchedule:
+        rules = await self.repo.get_all_by_user(user_id, active_only=True)
+        horizon = today + timedelta(days=self.horizon_days + 1)
+
+        items = []
+        for rule in rules:
+            dates, _ = occurrences(
+                rule.next_run_at,
+                rule.frequency,
+                until=horizon,
+                anchor_day=rule.schedule_anchor,
+            )
+            for occurrence in dates:
+                items.append(
+                    {
+                        "recurring_id": rule.id,
+                        "date": occurrence,
+                        "amount": rule.amount,
+                        "type": rule.type,
+                        "category": rule.category,
+                        "description": rule.description,
+                        "frequency": rule.frequency,
+                    }
+                )
+
+        items.sort(key=lambda item: item["date"])
+        entry = _UserSchedule(
+            version=version,
+            day=today.date(),
+            dates=[item["date"] for item in items],
+            items=items,
+        )
+
+        self._entries[user_id] = entry
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_users:
+            self._entries.popitem(last=False)
+
+        return entry
+
+
+upcoming_index = UpcomingIndex()
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -37,6 +37,83 @@ class Settings(BaseSettings):
     # --------------------
     CORS_ORIGINS: List[str] = ["http://localhost:3000"]
 
+    # --------------------
+    # Recurring execution
+    # --------------------
+    RECURRING_CONCURRENCY: int = 4  # Lanes per run; a user's rules stay on one
+    RECURRING_BATCH_SIZE: int = 1000
+    RECURRING_MAX_RETRIES: int = 3
+    RECURRING_RETRY_BASE_DELAY: float = 0.5
+    RECURRING_LEASE_SECONDS: int = 300
+    RECURRING_MAX_CATCH_UP: int = 366  # Occurrences posted per rule per run
+    RECURRING_UPCOMING_MAX_DAYS: int = 90
+    RECURRING_UPCOMING_CACHE_SIZE: int = 10000  # Users kept in the upcoming index
+
+    # --------------------
+    # Workers / scheduler
+    # --------------------
+    WORKER_ID: Optional[str] = None
+    # The scheduler runs in the API process by default (single-instance
+    # setups). With several API replicas, set it to false on all of them and
+    # run one app.worker instead; every job is lease-guarded regardless.
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_RECURRING_INTERVAL_SECONDS: int = 60
+    SCHEDULER_JITTER_SECONDS: int = 5
+    PATTERN_DETECTION_HOUR: int = 3  # UTC hour of the daily suggestion refresh
+    PATTERN_DETECTION_LEASE_SECONDS: int = 300  # Renewed after each user chunk
+
+    # --------------------
+    # Reports (PDF rendering)
+    # --------------------
+    REPORT_BROWSER_POOL_SIZE: int = 2  # Concurrent renders / warm Chromium processes
+    REPORT_BROWSER_MAX_RENDERS: int = 100  # Recycle a browser after this many renders
+    REPORT_RENDER_TIMEOUT_SECONDS: int = 60  # Per native render / Chromium chunk
+    REPORT_ENGINE: str = "auto"  # auto | chromium | native
+    REPORT_NATIVE_MIN_ROWS: int = 500  # "auto" renders natively from this size
+    # Longer Chromium statements render in parallel chunks (rounded down to
+    # whole pages); kept below REPORT_NATIVE_MIN_ROWS so "auto" chunks
+    # before it switches to native
+    REPORT_CHUNK_ROWS: int = 200
+    # Content-addressed report cache. Workers write it and the API serves
+    # from it, so with more than one host it must be shared storage
+    # (checked at startup, which fails otherwise; see ReportStore.check_shared)
+    REPORT_STORE_DIR: str = "/tmp/reports"
+    REPORT_STORE_MAX_BYTES: int = 1024 * 1024 * 1024
+    REPORT_STORE_MAX_AGE_DAYS: int = 30
+    REPORT_MAX_RANGE_DAYS: int = 1096  # Longest custom-range statement (~3 years)
+
+    # --------------------
+    # Report jobs (python -m app.report_worker)
+    # --------------------
+    REPORT_WORKER_EMBEDDED: bool = False  # Run the worker inside the API (dev)
+    REPORT_WORKER_CONCURRENCY: int = 2  # Jobs per worker process
+    REPORT_MAX_RUNNING: int = 8  # Jobs running at once across all workers
+    REPORT_MAX_RUNNING_PER_USER: int = 1
+    REPORT_JOB_LEASE_SECONDS: int = 300  # Renewed every third while rendering
+    REPORT_JOB_MAX_ATTEMPTS: int = 3
+    REPORT_RETRY_BASE_DELAY: float = 30.0  # Seconds, doubled per attempt
+    REPORT_POLL_INTERVAL_SECONDS: float = 2.0
+
+    # --------------------
+    # Report campaigns (month-end statements for every user)
+    # --------------------
+    REPORT_CAMPAIGN_ENABLED: bool = False  # Scheduler queues last month's statements
+    REPORT_CAMPAIGN_HOUR: int = 1  # UTC hour on the 1st when the campaign starts
+    REPORT_CAMPAIGN_CHECK_SECONDS: int = 600  # Scheduler tick (start / resume)
+    REPORT_CAMPAIGN_CHUNK_SIZE: int = 1000  # Users per keyset page
+    REPORT_CAMPAIGN_ENQUEUE_RATE: float = 200.0  # Jobs queued per second, at most
+    REPORT_CAMPAIGN_MAX_QUEUED: int = 2000  # Pause while the queue is this deep
+    REPORT_CAMPAIGN_LEASE_SECONDS: int = 300
+
+    # --------------------
+    # Response compression
+    # --------------------
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
     # Loading values form environment variables or .env file
     class Config:
         env_file = ".env"
@@ -0,0 +1,85 @@
+from datetime import datetime
+
+from pymongo import UpdateOne
+
+from app.database import get_database
+from app.domain.fingerprint import fingerprint_for
+from app.repositories.job_lock_repo import JobLockRepository
+from app.utils.ids import worker_id
+from app.utils.logger import get_logger
+
+logger = get_logger("pennywise.tasks.fingerprints")
+
+LOCK_NAME = "fingerprint_backfill"
+LEASE_SECONDS = 300
+
+
+async def backfill_fingerprints(batch_size: int = 1000) -> int:
+    """
+    Stamp fingerprints on transactions created before duplicate detection
+    existed, so imports overlapping older data are caught too.
+
+    Walks the collection in _id order, one batch per query. Runs once
+    across all processes (a job_locks lease, renewed per batch) and is
+    safe to re-run: only documents without a fingerprint are touched.
+    """
+    db = get_database()
+    locks = JobLockRepository()
+    me = worker_id()
+
+    if not await locks.acquire(
+        LOCK_NAME,
+        run_key="done",
+        worker_id=me,
+        now=datetime.utcnow(),
+        lease_seconds=LEASE_SECONDS,
+    ):
+        return 0
+
+    last_id = None
+    updated = 0
+
+    try:
+        while True:
+            query: dict = {"fingerprint": {"$exists": False}}
+            if last_id:
+                query["_id"] = {"$gt": last_id}
+
+            docs = (
+                await db.transactions.find(
+                    query,
+                    {"date": 1, "amount": 1, "type": 1, "description": 1},
+                )
+                .sort("_id", 1)
+                .limit(batch_size)
+                .to_list(batch_size)
+            )
+            if not docs:
+                break
+
+            last_id = docs[-1]["_id"]
+            await db.transactions.bulk_write(
+                [
+                    UpdateOne(
+                        {"_id": doc["_id"], "fingerprint": {"$exists": False}},
+                        {"$set": {"fingerprint": fingerprint_for(doc)}},
+                    )
+                    for doc in docs
+                ],
+                ordered=False,
+            )
+            updated += len(docs)
+
+            if not await locks.renew(
+                LOCK_NAME, worker_id=me, lease_seconds=LEASE_SECONDS
+            ):
+                logger.warning("Fingerprint backfill lease lost")
+                return updated
+    except Exception:
+        await locks.release(LOCK_NAME, worker_id=me)
+        raise
+
+    await locks.release(LOCK_NAME, worker_id=me, run_key="done")
+
+    logger.info("Fingerprint backfill completed", extra={"updated": updated})
+    return updated
@@ -0,0 +1,147 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app.database import get_database
+from app.domain.patterns import detect_patterns, pattern_description
+from app.repositories.job_lock_repo import JobLockRepository
+from app.repositories.suggestion_repo import RecurringSuggestionRepository
+from app.settings import settings
+from app.utils.ids import worker_id
+from app.utils.logger import get_logger
+
+logger = get_logger("pennywise.patterns")
+
+LOCK_NAME = "recurring_patterns"
+
+TX_FIELDS = {
+    "user_id": 1,
+    "date": 1,
+    "amount": 1,
+    "type": 1,
+    "description": 1,
+    "category": 1,
+}
+
+
+async def detect_recurring_patterns(
+    *,
+    chunk_size: int = 200,
+    lookback_days: int = 400,
+) -> Optional[dict]:
+    """
+    Refresh recurring suggestions for every user, once a day across all
+    processes.
+
+    Every process with the scheduler fires this cron; the first to take
+    the day's lease runs it and the others return None. The lease is
+    renewed after each chunk, and a run that loses it stops.
+
+    Users are processed in chunks of `chunk_size`: one keyset page of user
+    ids, one transactions query and one recurring query per chunk, and one
+    bulk write of the chunk's suggestions. The transactions are streamed
+    in (user, date) order, so only one user's history is held at a time.
+    Series already covered by an active rule, and generated (recurring)
+    transactions, are ignored.
+    """
+    db = get_database()
+    suggestions = RecurringSuggestionRepository()
+    locks = JobLockRepository()
+    me = worker_id()
+
+    now = datetime.utcnow()
+    since = now - timedelta(days=lookback_days)
+    run_key = now.strftime("%Y-%m-%d")
+    lease_seconds = settings.PATTERN_DETECTION_LEASE_SECONDS
+
+    if not await locks.acquire(
+        LOCK_NAME,
+        run_key=run_key,
+        worker_id=me,
+        now=now,
+        lease_seconds=lease_seconds,
+    ):
+        logger.info("Recurring pattern detection held elsewhere or already run")
+        return None
+
+    stats = {"users": 0, "suggestions": 0}
+    last_id = None
+
+    try:
+        while True:
+            query = {"_id": {"$gt": last_id}} if last_id else {}
+            users = (
+                await db.users.find(query, {"_id": 1})
+                .sort("_id", 1)
+                .limit(chunk_size)
+                .to_list(chunk_size)
+            )
+            if not users:
+                break
+
+            last_id = users[-1]["_id"]
+            user_ids = [str(user["_id"]) for user in users]
+
+            covered: set[tuple[str, str, str]] = set()
+            async for rule in db.recurring.find(
+                {"user_id": {"$in": user_ids}, "active": True},
+                {"user_id": 1, "type": 1, "description": 1},
+            ):
+                covered.add(
+                    (
+                        rule["user_id"],
+                        rule["type"],
+                        pattern_description(rule["description"]),
+                    )
+                )
+
+            found: dict[str, list[dict]] = {user_id: [] for user_id in user_ids}
+
+            def detect(user_id: str, transactions: list[dict]) -> None:
+                found[user_id] = [
+                    suggestion
+                    for suggestion in detect_patterns(transactions, now=now)
+                    if (
+                        user_id,
+                        suggestion["type"],
+                        pattern_description(suggestion["description"]),
+                    )
+                    not in covered
+                ]
+
+            # Sorted like idx_tx_user_date: each user's rows arrive together
+            current, history = None, []
+            async for tx in db.transactions.find(
+                {
+                    "user_id": {"$in": user_ids},
+                    "is_deleted": False,
+                    "is_recurring": {"$ne": True},
+                    "date": {"$gte": since},
+                },
+                TX_FIELDS,
+            ).sort([("user_id", 1), ("date", -1)]):
+                if tx["user_id"] != current:
+                    if current is not None:
+                        detect(current, history)
+                    current, history = tx["user_id"], []
+                history.append(tx)
+            if current is not None:
+                detect(current, history)
+
+            stats["users"] += len(user_ids)
+            stats["suggestions"] += await suggestions.replace_pending(found)
+
+            if not await locks.renew(
+                LOCK_NAME, worker_id=me, lease_seconds=lease_seconds
+            ):
+                logger.warning("Recurring pattern detection lease lost", extra=stats)
+                return stats
+    except Exception:
+        # Leave the day open, so another tick or replica can retry
+        await locks.release(LOCK_NAME, worker_id=me)
+        raise
+
+    await locks.release(LOCK_NAME, worker_id=me, run_key=run_key)
+
+    logger.info("Recurring pattern detection completed", extra=stats)
+
+    return stats
@@ -0,0 +1,109 @@
+from datetime import datetime
+
+from pymongo import UpdateOne
+
+from app.database import get_database
+from app.repositories.job_lock_repo import JobLockRepository
+from app.utils.ids import worker_id
+from app.utils.logger import get_logger
+
+logger = get_logger("pennywise.tasks.recurring_backfill")
+
+LOCK_NAME = "recurring_links_backfill"
+LEASE_SECONDS = 300
+
+
+async def backfill_recurring_links(batch_size: int = 1000) -> int:
+    """
+    Stamp recurring_id on transactions generated before rules were linked
+    to their postings, so GET /recurring/{id}/transactions lists them.
+
+    A legacy posting is linked to the user's rule with the same category,
+    amount and type (the match the endpoint used to run on every request);
+    postings matching several rules, or none, are left alone. Walks the
+    collection in _id order, one batch per query. Runs once across all
+    processes and is safe to re-run: only generated transactions without
+    a recurring_id are touched.
+    """
+    db = get_database()
+    locks = JobLockRepository()
+    me = worker_id()
+
+    if not await locks.acquire(
+        LOCK_NAME,
+        run_key="done",
+        worker_id=me,
+        now=datetime.utcnow(),
+        lease_seconds=LEASE_SECONDS,
+    ):
+        return 0
+
+    last_id = None
+    updated = skipped = 0
+
+    try:
+        while True:
+            # Keyset on _id: no sort beyond the _id index
+            query: dict = {"source": "recurring", "recurring_id": {"$exists": False}}
+            if last_id:
+                query["_id"] = {"$gt": last_id}
+
+            docs = (
+                await db.transactions.find(
+                    query,
+                    {"user_id": 1, "category": 1, "amount": 1, "type": 1},
+                )
+                .sort("_id", 1)
+                .limit(batch_size)
+                .to_list(batch_size)
+            )
+            if not docs:
+                break
+
+            last_id = docs[-1]["_id"]
+
+            # The rules of every user in the batch, in one query
+            rules: dict[tuple, list[str]] = {}
+            async for rule in db.recurring.find(
+                {"user_id": {"$in": list({doc["user_id"] for doc in docs})}},
+                {"user_id": 1, "category": 1, "amount": 1, "type": 1},
+            ):
+                key = (rule["user_id"], rule["category"], rule["amount"], rule["type"])
+                rules.setdefault(key, []).append(str(rule["_id"]))
+
+            ops: list[UpdateOne] = []
+            for doc in docs:
+                matches = rules.get(
+                    (doc["user_id"], doc["category"], doc["amount"], doc["type"]), []
+                )
+                if len(matches) != 1:
+                    skipped += 1
+                    continue
+
+                ops.append(
+                    UpdateOne(
+                        {"_id": doc["_id"], "recurring_id": {"$exists": False}},
+                        {"$set": {"recurring_id": matches[0]}},
+                    )
+                )
+
+            if ops:
+                await db.transactions.bulk_write(ops, ordered=False)
+                updated += len(ops)
+
+            if not await locks.renew(
+                LOCK_NAME, worker_id=me, lease_seconds=LEASE_SECONDS
+            ):
+                logger.warning("Recurring link backfill lease lost")
+                return updated
+    except Exception:
+        await locks.release(LOCK_NAME, worker_id=me)
+        raise
+
+    await locks.release(LOCK_NAME, worker_id=me, run_key="done")
+
+    logger.info(
+        "Recurring link backfill completed",
+        extra={"updated": updated, "skipped": skipped},
+    )
+    return updated
@@ -0,0 +1,248 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Optional
+
+from bson import ObjectId
+
+from app.database import get_database
+from app.domain.dates import add_months, month_bounds
+from app.models.report import ReportCampaignInDB
+from app.repositories.report_campaign_repo import ReportCampaignRepository
+from app.repositories.report_job_repo import ReportJobRepository
+from app.repositories.transaction_repo import TransactionRepository
+from app.settings import settings
+from app.utils.ids import worker_id
+from app.utils.logger import get_logger
+
+logger = get_logger("pennywise.report.campaign")
+
+
+def previous_month(now: datetime) -> str:
+    return add_months(now.replace(day=1), -1).strftime("%Y-%m")
+
+
+class ReportCampaignRunner:
+    """
+    Queues one monthly statement job per active user; the report workers
+    render them.
+
+    - Users are read in keyset chunks; one aggregation per chunk drops
+      those without transactions in the month, and the rest are queued
+      with one insert
+    - Enqueueing is paced to `enqueue_rate` jobs per second and pauses
+      while `max_queued` jobs are waiting, so the queue stays shallow and
+      interactive report requests are not stuck behind the whole campaign
+    - Progress (cursor and counters) is saved after every chunk under a
+      lease: a crashed run is resumed where it stopped, and never queues
+      a user twice
+    """
+
+    def __init__(
+        self,
+        *,
+        chunk_size: Optional[int] = None,
+        enqueue_rate: Optional[float] = None,
+        max_queued: Optional[int] = None,
+        lease_seconds: Optional[int] = None,
+    ):
+        self.chunk_size = chunk_size or settings.REPORT_CAMPAIGN_CHUNK_SIZE
+        self.enqueue_rate = enqueue_rate or settings.REPORT_CAMPAIGN_ENQUEUE_RATE
+        self.max_queued = max_queued or settings.REPORT_CAMPAIGN_MAX_QUEUED
+        self.lease_seconds = lease_seconds or settings.REPORT_CAMPAIGN_LEASE_SECONDS
+        self.poll_interval = settings.REPORT_POLL_INTERVAL_SECONDS
+
+        self.db = get_database()
+        self.campaigns = ReportCampaignRepository()
+        self.jobs = ReportJobRepository()
+        self.transactions = TransactionRepository()
+
+    # -------------------------------------------------
+    # Public API
+    # -------------------------------------------------
+    async def run_monthly(self, month: str) -> ReportCampaignInDB:
+        """
+        Start, or resume, the campaign for `month` ("YYYY-MM").
+
+        Returns without enqueueing when another process holds the lease.
+        """
+        campaign = await self.campaigns.get_or_create(
+            key=f"monthly:{month}",
+            kind="monthly",
+            params={"month": month},
+        )
+
+        if campaign.status == "enqueueing":
+            await self._enqueue(campaign)
+
+        return await self.campaigns.get_by_key(campaign.key)
+
+    async def progress(self, campaign: ReportCampaignInDB) -> dict:
+        """
+        Job counts by status, throughput and ETA. Marks the campaign
+        completed once every job has finished.
+        """
+        counts = await self.jobs.campaign_status_counts(campaign.id)
+        finished = counts.get("succeeded", 0) + counts.get("failed", 0)
+        pending = counts.get("queued", 0) + counts.get("running", 0)
+
+        elapsed = (datetime.utcnow() - campaign.created_at).total_seconds()
+        per_minute = finished / elapsed * 60 if elapsed > 0 else 0.0
+
+        if campaign.status == "enqueued" and not pending:
+            if await self.campaigns.mark_completed(campaign.id):
+                logger.info("Report campaign completed", extra={"key": campaign.key})
+
+        return {
+            "key": campaign.key,
+            "status": campaign.status,
+            "users_scanned": campaign.users_scanned,
+            "users_skipped": campaign.users_skipped,
+            "jobs_enqueued": campaign.jobs_enqueued,
+            "jobs": counts,
+            "elapsed_seconds": round(elapsed),
+            "jobs_per_minute": round(per_minute, 1),
+            "eta_seconds": round(pending / per_minute * 60) if per_minute else None,
+        }
+
+    # -------------------------------------------------
+    # Enqueueing
+    # -------------------------------------------------
+    async def _enqueue(self, campaign: ReportCampaignInDB) -> None:
+        me = worker_id()
+        claimed = await self.campaigns.claim(
+            campaign.id,
+            worker_id=me,
+            now=datetime.utcnow(),
+            lease_seconds=self.lease_seconds,
+        )
+        if not claimed:
+            logger.info("Report campaign held elsewhere", extra={"key": campaign.key})
+            return
+
+        start, end = month_bounds(claimed.params["month"])
+        last_id = ObjectId(claimed.cursor) if claimed.cursor else None
+        params = {**claimed.params, "engine": None}
+
+        logger.info(
+            "Report campaign enqueueing",
+            extra={"key": claimed.key, "resume_after": claimed.cursor},
+        )
+
+        started = time.monotonic()
+        enqueued_here = 0
+
+        while True:
+            query = {"is_active": True}
+            if last_id:
+                query["_id"] = {"$gt": last_id}
+
+            users = (
+                await self.db.users.find(query, {"_id": 1})
+                .sort("_id", 1)
+                .limit(self.chunk_size)
+                .to_list(self.chunk_size)
+            )
+            if not users:
+                break
+
+            last_id = users[-1]["_id"]
+            user_ids = [str(user["_id"]) for user in users]
+
+            active = await self.transactions.users_with_activity(
+                user_ids=user_ids,
+                start=start,
+                end=end,
+            )
+
+            if not await self._wait_for_capacity(claimed, me):
+                return
+
+            inserted = 0
+            if active:
+                inserted = await self.jobs.enqueue_many(
+                    user_ids=[user_id for user_id in user_ids if user_id in active],
+                    kind=claimed.kind,
+                    params=params,
+                    max_attempts=settings.REPORT_JOB_MAX_ATTEMPTS,
+                    campaign_id=claimed.id,
+                )
+
+            if not await self.campaigns.advance(
+                claimed.id,
+                worker_id=me,
+                cursor=str(last_id),
+                scanned=len(user_ids),
+                skipped=len(user_ids) - len(active),
+                # Jobs of a chunk replayed after a crash count once, here
+                enqueued=len(active),
+                lease_seconds=self.lease_seconds,
+            ):
+                logger.warning("Report campaign lease lost", extra={"key": claimed.key})
+                return
+
+            # Pace to enqueue_rate: sleep off whatever we are ahead of it
+            enqueued_here += inserted
+            ahead = enqueued_here / self.enqueue_rate - (time.monotonic() - started)
+            if ahead > 0:
+                await asyncio.sleep(ahead)
+
+        await self.campaigns.mark_enqueued(claimed.id, worker_id=me)
+
+        logger.info(
+            "Report campaign enqueued",
+            extra={
+                "key": claimed.key,
+                "jobs": enqueued_here,
+                "seconds": round(time.monotonic() - started, 1),
+            },
+        )
+
+    async def _wait_for_capacity(self, campaign: ReportCampaignInDB, me: str) -> bool:
+        """
+        Block while the queue is at `max_queued`, keeping the lease alive.
+
+        Returns:
+            False if the lease was lost meanwhile
+        """
+        while True:
+            queued = (await self.jobs.status_counts()).get("queued", 0)
+            if queued < self.max_queued:
+                return True
+
+            claimed = await self.campaigns.claim(
+                campaign.id,
+                worker_id=me,
+                now=datetime.utcnow(),
+                lease_seconds=self.lease_seconds,
+            )
+            if not claimed:
+                return False
+
+            await asyncio.sleep(self.poll_interval)
+
+
+# -------------------------------------------------
+# Scheduler job (REPORT_CAMPAIGN_ENABLED)
+# -------------------------------------------------
+async def report_campaign_tick() -> None:
+    """
+    From REPORT_CAMPAIGN_HOUR on the 1st, start (or resume) last month's
+    campaign, and log its progress on later ticks until it completes.
+    """
+    now = datetime.utcnow()
+    if now.day == 1 and now.hour < settings.REPORT_CAMPAIGN_HOUR:
+        return
+
+    runner = ReportCampaignRunner()
+    month = previous_month(now)
+
+    try:
+        campaign = await runner.campaigns.get_by_key(f"monthly:{month}")
+        if campaign is not None and campaign.status == "completed":
+            return
+
+        campaign = await runner.run_monthly(month)
+        logger.info("Report campaign progress", extra=await runner.progress(campaign))
+    except Exception as exc:
+        logger.error("Report campaign tick failed", exc_info=exc)
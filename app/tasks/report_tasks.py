@@ -1,8 +1,16 @@
-from pathlib import Path
+import os
+from typing import Optional
 
+from app.domain.dates import months_between
+from app.domain.reports import BREAKDOWN_KINDS, REPORT_TITLES, report_period
+from app.repositories.transaction_repo import TransactionRepository, month_scope
+from app.repositories.version_repo import DataVersionRepository
 from app.services.audit_service import AuditService
-from app.services.report_service import ReportService
+from app.services.native_pdf import UNSUPPORTED_TEXT_PATTERN
+from app.services.report_service import TEMPLATE_VERSION, ReportService
+from app.services.report_store import ReportStore, report_cache_key
 from app.services.transaction_service import TransactionService
+from app.settings import settings
 from app.utils.logger import get_logger
 
 logger = get_logger("pennywise.tasks.reports")
@@ -11,7 +19,10 @@ logger = get_logger("pennywise.tasks.reports")
 class ReportTasks:
     def __init__(self):
         self.tx_service = TransactionService()
+        self.tx_repo = TransactionRepository()
         self.report_service = ReportService()
+        self.versions = DataVersionRepository()
+        self.store = ReportStore()
         self.audit = AuditService()
 
     async def generate_monthly_report(
@@ -19,53 +30,168 @@ class ReportTasks:
         *,
         user_id: str,
         month: str,
-        output_dir: str,
+        engine: Optional[str] = None,
         request=None,
-    ):
+    ) -> dict:
+        return await self.generate_report(
+            user_id=user_id,
+            kind="monthly",
+            params={"month": month},
+            engine=engine,
+            request=request,
+        )
+
+    async def generate_report(
+        self,
+        *,
+        user_id: str,
+        kind: str,
+        params: dict,
+        engine: Optional[str] = None,
+        request=None,
+    ) -> dict:
+        """
+        Render one statement (monthly, annual or custom range), or reuse
+        the stored one.
+
+        The cache key covers the data version of every month in the
+        period, so the stored PDF is served as long as none of those
+        transactions changed, without fetching them. Annual and range
+        statements add per-month and per-category breakdowns, computed by
+        one aggregation in the database.
+
+        Returns:
+            dict with path, digest, transaction_count and cached
+
+        Raises:
+            Whatever failed; the failure is audited first, so the caller
+            (the report worker) can decide whether to retry.
+        """
         logger.info(
             "REPORT_TASK_STARTED",
-            extra={"user_id": user_id, "month": month},
+            extra={"user_id": user_id, "kind": kind, "params": params},
         )
 
         try:
-            transactions = await self.tx_service.list_for_month(
+            start, end, period_label = report_period(
+                kind, params, max_days=settings.REPORT_MAX_RANGE_DAYS
+            )
+            months = months_between(start, end)
+
+            # Read before the transactions: a write racing the render bumps
+            # the version past this key, so the next request re-renders
+            data_versions = await self.versions.get_many(
+                user_id, [month_scope(month) for month in months]
+            )
+            key = report_cache_key(
                 user_id=user_id,
-                month=month,
+                period=f"{kind}:{start:%Y-%m-%d}:{end:%Y-%m-%d}",
+                template_version=TEMPLATE_VERSION,
+                engine=engine,
+                data_version=",".join(data_versions),
             )
 
-            Path(output_dir).mkdir(parents=True, exist_ok=True)
-            output_path = Path(output_dir) / f"pennywise-{user_id}-{month}.pdf"
+            cached = await self.store.lookup(key)
+            if cached:
+                logger.info(
+                    "REPORT_CACHE_HIT",
+                    extra={"user_id": user_id, "kind": kind},
+                )
+                return {
+                    "path": cached["path"],
+                    "digest": cached["digest"],
+                    "transaction_count": cached["metadata"]["transaction_count"],
+                    "cached": True,
+                }
 
-            # ✅ FIXED - Now using async method
-            await self.report_service.generate_transaction_report(
+            breakdown = None
+            if kind in BREAKDOWN_KINDS:
+                breakdown = await self.tx_repo.report_breakdown(
+                    user_id=user_id,
+                    start=start,
+                    end=end,
+                )
+                # Months without transactions still get a (zero) bar
+                by_month = {row["month"]: row for row in breakdown["months"]}
+                breakdown["months"] = [
+                    by_month.get(month, {"month": month, "income": 0.0, "expense": 0.0})
+                    for month in months
+                ]
+
+            # The native fonts only cover cp1252: check the whole period up
+            # front, so "auto" never picks native for text it would lose
+            unsupported_text = False
+            if (engine or settings.REPORT_ENGINE) == "auto":
+                unsupported_text = await self.tx_repo.has_text_matching(
+                    user_id=user_id,
+                    start=start,
+                    end=end,
+                    pattern=UNSUPPORTED_TEXT_PATTERN,
+                )
+
+            stream = await self.tx_service.iter_range(
                 user_id=user_id,
-                transactions=[t.dict() for t in transactions],
-                title="Monthly Statement",
-                period_label=month,
-                output_path=str(output_path),
+                start=start,
+                end=end,
             )
 
+            temp_path = self.store.temp_path()
+            try:
+                # Streamed straight from the cursor, never held as a list
+                report = await self.report_service.generate_transaction_report(
+                    user_id=user_id,
+                    transactions=(tx.model_dump() async for tx in stream),
+                    title=REPORT_TITLES[kind],
+                    period_label=period_label,
+                    output_path=temp_path,
+                    engine=engine,
+                    breakdown=breakdown,
+                    unsupported_text=unsupported_text,
+                )
+                stored = await self.store.save(
+                    key,
+                    temp_path,
+                    metadata={
+                        "user_id": user_id,
+                        "kind": kind,
+                        "params": params,
+                        "transaction_count": report["rows"],
+                    },
+                )
+            finally:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+
             await self.audit.log(
                 action="REPORT_GENERATED",
                 user_id=user_id,
                 entity="report",
-                entity_id=str(output_path),
+                entity_id=stored["digest"],
                 metadata={
-                    "month": month,
-                    "transaction_count": len(transactions),
+                    "kind": kind,
+                    **params,
+                    "transaction_count": report["rows"],
+                    "engine": report["engine"],
                 },
                 request=request,
             )
 
             logger.info(
                 "REPORT_TASK_COMPLETED",
-                extra={"user_id": user_id, "path": str(output_path)},
+                extra={"user_id": user_id, "path": stored["path"]},
             )
 
+            return {
+                "path": stored["path"],
+                "digest": stored["digest"],
+                "transaction_count": report["rows"],
+                "cached": False,
+            }
+
         except Exception as exc:
             logger.exception(
                 "REPORT_TASK_FAILED",
-                extra={"user_id": user_id, "month": month},
+                extra={"user_id": user_id, "kind": kind, "params": params},
             )
 
             await self.audit.log(
@@ -73,8 +199,10 @@ class ReportTasks:
                 user_id=user_id,
                 entity="report",
                 metadata={
-                    "month": month,
+                    "kind": kind,
+                    **params,
                     "error": str(exc),
                 },
                 request=request,
             )
+            raise
@@ -0,0 +1,209 @@
+import asyncio
+import random
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app.models.report import ReportJobInDB
+from app.repositories.report_job_repo import ReportJobRepository
+from app.settings import settings
+from app.tasks.report_tasks import ReportTasks
+from app.utils.ids import worker_id
+from app.utils.logger import get_logger
+
+logger = get_logger("pennywise.report.worker")
+
+
+class ReportWorker:
+    """
+    Renders queued report jobs (see ReportJobRepository).
+
+    - `concurrency` jobs at a time in this process; REPORT_MAX_RUNNING and
+      REPORT_MAX_RUNNING_PER_USER cap them across all worker processes
+    - Jobs are leased, and the lease is renewed while the report renders;
+      a crashed worker's jobs are picked up again once the lease expires,
+      and a worker that loses a lease abandons the render
+    - Failed jobs are retried with exponential backoff until
+      `max_attempts`, then marked failed
+    """
+
+    def __init__(
+        self,
+        *,
+        concurrency: int = settings.REPORT_WORKER_CONCURRENCY,
+        poll_interval: float = settings.REPORT_POLL_INTERVAL_SECONDS,
+    ):
+        self.concurrency = max(1, concurrency)
+        self.poll_interval = poll_interval
+        self.repo = ReportJobRepository()
+        self.tasks = ReportTasks()
+
+    # -------------------------------------------------
+    # Public API
+    # -------------------------------------------------
+    async def run(self, stop: asyncio.Event) -> None:
+        logger.info("Report worker started", extra={"concurrency": self.concurrency})
+
+        await asyncio.gather(*(self._slot(stop) for _ in range(self.concurrency)))
+
+        logger.info("Report worker stopped")
+
+    async def run_once(self) -> bool:
+        """
+        Claim and run one job. Returns False when nothing was claimable.
+        """
+        now = datetime.utcnow()
+        job = await self.repo.claim_next(
+            worker_id=worker_id(),
+            now=now,
+            lease_seconds=settings.REPORT_JOB_LEASE_SECONDS,
+            max_running=settings.REPORT_MAX_RUNNING,
+            max_running_per_user=settings.REPORT_MAX_RUNNING_PER_USER,
+        )
+        if job is None:
+            return False
+
+        logger.info(
+            "Report job claimed",
+            extra={
+                "job_id": job.id,
+                "user_id": job.user_id,
+                "attempt": job.attempts,
+                "wait_seconds": (now - job.run_after).total_seconds(),
+            },
+        )
+
+        await self._execute(job)
+        return True
+
+    # -------------------------------------------------
+    # Internals
+    # -------------------------------------------------
+    async def _slot(self, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            try:
+                if await self.run_once():
+                    continue
+                await self._housekeeping()
+            except Exception as exc:
+                # Database hiccup: back off like an empty queue
+                logger.error("Report worker poll failed", exc_info=exc)
+
+            try:
+                # Jitter keeps idle slots from polling in lockstep
+                await asyncio.wait_for(
+                    stop.wait(),
+                    timeout=self.poll_interval * random.uniform(0.5, 1.5),
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    async def _execute(self, job: ReportJobInDB) -> None:
+        params = {k: v for k, v in job.params.items() if k != "engine"}
+        render = asyncio.create_task(
+            self.tasks.generate_report(
+                user_id=job.user_id,
+                kind=job.kind,
+                params=params,
+                engine=job.params.get("engine"),
+            )
+        )
+        heartbeat = asyncio.create_task(self._heartbeat(job.id, render))
+        try:
+            result = await render
+        except asyncio.CancelledError:
+            # The heartbeat cancels the render when the lease is lost;
+            # any other cancellation (shutdown) propagates
+            if heartbeat.done() and not heartbeat.cancelled() and heartbeat.result():
+                logger.warning(
+                    "Report job lease lost, render abandoned",
+                    extra={"job_id": job.id},
+                )
+                return
+            raise
+        except Exception as exc:
+            retry_at = None
+            if job.attempts < job.max_attempts:
+                delay = settings.REPORT_RETRY_BASE_DELAY * 2 ** (job.attempts - 1)
+                retry_at = datetime.utcnow() + timedelta(seconds=delay)
+
+            await self.repo.fail(
+                job.id,
+                worker_id=worker_id(),
+                error=str(exc) or exc.__class__.__name__,
+                retry_at=retry_at,
+            )
+
+            logger.warning(
+                "Report job failed",
+                extra={
+                    "job_id": job.id,
+                    "attempt": job.attempts,
+                    "retry_at": retry_at.isoformat() if retry_at else None,
+                },
+            )
+            return
+        finally:
+            heartbeat.cancel()
+
+        if not await self.repo.complete(job.id, worker_id=worker_id(), result=result):
+            logger.warning("Report job lease lost", extra={"job_id": job.id})
+            return
+
+        logger.info("Report job succeeded", extra={"job_id": job.id, **result})
+
+    async def _heartbeat(self, job_id: str, render: asyncio.Task) -> bool:
+        """
+        Renew the job's lease every third of REPORT_JOB_LEASE_SECONDS while
+        it renders.
+
+        Returns:
+            True if the lease was lost and the render cancelled
+        """
+        lease_seconds = settings.REPORT_JOB_LEASE_SECONDS
+        while True:
+            await asyncio.sleep(lease_seconds / 3)
+            try:
+                renewed = await self.repo.renew(
+                    job_id, worker_id=worker_id(), lease_seconds=lease_seconds
+                )
+            except Exception as exc:
+                # Database hiccup: the lease still has two thirds to run
+                logger.error("Report job lease renewal failed", exc_info=exc)
+                continue
+
+            if not renewed:
+                render.cancel()
+                return True
+
+    async def _housekeeping(self) -> None:
+        abandoned = await self.repo.fail_abandoned(now=datetime.utcnow())
+        if abandoned:
+            logger.warning("Report jobs abandoned", extra={"count": abandoned})
+
+
+# -------------------------------------------------
+# Embedded worker (REPORT_WORKER_EMBEDDED, development)
+# -------------------------------------------------
+_stop: Optional[asyncio.Event] = None
+_task: Optional[asyncio.Task] = None
+
+
+def start_report_worker() -> None:
+    global _stop, _task
+
+    if _task is not None:
+        return
+
+    _stop = asyncio.Event()
+    _task = asyncio.create_task(ReportWorker().run(_stop))
+
+
+async def stop_report_worker() -> None:
+    global _stop, _task
+
+    if _task is None:
+        return
+
+    _stop.set()
+    await _task
+    _stop = _task = None
@@ -0,0 +1,115 @@
+from datetime import datetime
+from typing import Optional
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+
+from app.repositories.recurring_repo import RecurringRepository
+from app.settings import settings
+from app.tasks.pattern_detection import detect_recurring_patterns
+from app.tasks.recurring_runner import run_recurring_transactions
+from app.tasks.report_campaign import report_campaign_tick
+from app.utils.logger import get_logger
+
+logger = get_logger("pennywise.scheduler")
+
+_scheduler: Optional[AsyncIOScheduler] = None
+
+
+# -------------------------------------------------
+# Jobs
+# -------------------------------------------------
+async def recurring_tick() -> None:
+    """
+    One polling round of the recurring rules.
+
+    Overlap: max_instances=1 keeps ticks of this process from stacking up,
+    and rule leases keep other processes from posting the same rules.
+    """
+    now = datetime.utcnow()
+    due, oldest = await RecurringRepository().due_queue_stats(now=now)
+
+    logger.info(
+        "Recurring due queue",
+        extra={
+            "due": due,
+            "oldest_lag_seconds": (
+                (now - oldest).total_seconds() if oldest is not None else 0.0
+            ),
+        },
+    )
+
+    if not due:
+        return
+
+    try:
+        await run_recurring_transactions()
+    except Exception as exc:
+        logger.error("Recurring tick failed", exc_info=exc)
+
+
+# -------------------------------------------------
+# Lifecycle
+# -------------------------------------------------
+def start_scheduler() -> AsyncIOScheduler:
+    global _scheduler
+
+    if _scheduler is not None:
+        return _scheduler
+
+    _scheduler = AsyncIOScheduler(timezone="UTC")
+    _scheduler.add_job(
+        recurring_tick,
+        IntervalTrigger(
+            seconds=settings.SCHEDULER_RECURRING_INTERVAL_SECONDS,
+            # Spread instances started together so they don't poll in lockstep
+            jitter=settings.SCHEDULER_JITTER_SECONDS,
+        ),
+        id="recurring",
+        max_instances=1,
+        coalesce=True,
+        next_run_time=datetime.utcnow(),
+    )
+    _scheduler.add_job(
+        detect_recurring_patterns,
+        CronTrigger(
+            hour=settings.PATTERN_DETECTION_HOUR,
+            jitter=settings.SCHEDULER_JITTER_SECONDS,
+        ),
+        id="recurring_patterns",
+        max_instances=1,
+        coalesce=True,
+    )
+    if settings.REPORT_CAMPAIGN_ENABLED:
+        _scheduler.add_job(
+            report_campaign_tick,
+            IntervalTrigger(
+                seconds=settings.REPORT_CAMPAIGN_CHECK_SECONDS,
+                jitter=settings.SCHEDULER_JITTER_SECONDS,
+            ),
+            id="report_campaign",
+            # A tick may enqueue for hours; later ticks just wait
+            max_instances=1,
+            coalesce=True,
+        )
+    _scheduler.start()
+
+    logger.info(
+        "Scheduler started",
+        extra={"interval_seconds": settings.SCHEDULER_RECURRING_INTERVAL_SECONDS},
+    )
+
+    return _scheduler
+
+
+def shutdown_scheduler() -> None:
+    global _scheduler
+
+    if _scheduler is None:
+        return
+
+    _scheduler.shutdown(wait=False)
+    _scheduler = None
+
+    logger.info("Scheduler stopped")
@@ -0,0 +1,30 @@
+import base64
+from datetime import datetime
+
+from bson import ObjectId
+from bson.errors import InvalidId
+
+from app.errors.base import AppError
+from app.errors.codes import ErrorCode
+
+
+def encode_cursor(date: datetime, doc_id: str) -> str:
+    """
+    Opaque keyset cursor for (date, _id) ordered listings.
+    """
+    raw = f"{date.isoformat()}|{doc_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, ObjectId]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        date_part, id_part = raw.split("|", 1)
+        return datetime.fromisoformat(date_part), ObjectId(id_part)
+    except (ValueError, InvalidId) as e:
+        raise AppError(
+            code=ErrorCode.VALIDATION_ERROR,
+            message="Invalid cursor",
+            status_code=400,
+        ) from e
@@ -0,0 +1,42 @@
+import hashlib
+
+from fastapi import Request
+
+
+def build_etag(*parts: object) -> str:
+    """
+    Build a weak ETag from arbitrary parts (user, scope, version, query...).
+    """
+    raw = "|".join(str(p) for p in parts)
+    digest = hashlib.sha1(raw.encode("utf-8")).hexdigest()
+    return f'W/"{digest}"'
+
+
+def query_signature(request: Request) -> str:
+    """
+    Stable representation of the query string (order independent).
+    """
+    items = sorted(request.query_params.multi_items())
+    return "&".join(f"{k}={v}" for k, v in items)
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    return tag
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Weak comparison of If-None-Match against the current ETag.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    if header.strip() == "*":
+        return True
+
+    current = _opaque(etag)
+    return any(_opaque(candidate) == current for candidate in header.split(","))
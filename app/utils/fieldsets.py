@@ -0,0 +1,45 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from app.errors.base import AppError
+from app.errors.codes import ErrorCode
+
+
+def parse_fields(raw: Optional[str], model: type[BaseModel]) -> Optional[list[str]]:
+    """
+    Parse a `fields=date,amount,category` query value against a model.
+
+    Returns None when no fieldset was requested (full documents).
+    """
+    if not raw:
+        return None
+
+    requested = list(dict.fromkeys(f.strip() for f in raw.split(",") if f.strip()))
+    if not requested:
+        return None
+
+    unknown = [f for f in requested if f not in model.model_fields]
+    if unknown:
+        raise AppError(
+            code=ErrorCode.VALIDATION_ERROR,
+            message=f"Unknown fields: {', '.join(unknown)}",
+            status_code=400,
+        )
+
+    return requested
+
+
+def to_projection(fields: list[str]) -> dict:
+    """
+    Mongo projection for a fieldset. `_id` is always returned.
+    """
+    return {("_id" if f == "id" else f): 1 for f in fields}
+
+
+def project_doc(doc: dict) -> dict:
+    """
+    Trimmed serializer: a projected document with a string id, no model build.
+    """
+    doc["_id"] = str(doc["_id"])
+    return doc
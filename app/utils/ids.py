@@ -0,0 +1,15 @@
+import os
+import socket
+from functools import lru_cache
+
+from app.settings import settings
+
+
+@lru_cache(maxsize=1)
+def worker_id() -> str:
+    """
+    Identity of this process when claiming shared work (leases).
+
+    Uses WORKER_ID when configured, otherwise "<hostname>:<pid>".
+    """
+    return settings.WORKER_ID or f"{socket.gethostname()}:{os.getpid()}"
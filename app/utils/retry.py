@@ -0,0 +1,30 @@
+import asyncio
+import random
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+async def retry_async(
+    operation: Callable[[], Awaitable[T]],
+    *,
+    attempts: int,
+    base_delay: float,
+) -> T:
+    """
+    Await `operation()` until it succeeds, at most `attempts` times.
+
+    Waits base_delay * 2**n plus up to 50% jitter between attempts and
+    re-raises the last error. Only use it for idempotent operations.
+    """
+    attempt = 0
+    while True:
+        try:
+            return await operation()
+        except Exception:
+            attempt += 1
+            if attempt >= attempts:
+                raise
+
+            delay = base_delay * (2 ** (attempt - 1))
+            await asyncio.sleep(delay + random.uniform(0, delay / 2))
@@ -0,0 +1,46 @@
+"""
+Standalone background worker.
+
+Runs the scheduler, and the one-off data backfills (app.backfill), without
+serving HTTP, so API instances can be started with SCHEDULER_ENABLED=false:
+
+    python -m app.worker
+"""
+
+import asyncio
+import signal
+
+from app.backfill import run_backfills
+from app.database import close_database_connection, connect_to_database
+from app.services.browser_pool import browser_pool
+from app.tasks.scheduler import shutdown_scheduler, start_scheduler
+from app.utils.logger import get_logger
+
+logger = get_logger("pennywise.worker")
+
+
+async def main() -> None:
+    stop = asyncio.Event()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await connect_to_database()
+    start_scheduler()
+    # One-off backfills run beside the scheduler (see app.backfill)
+    backfills = asyncio.create_task(run_backfills())
+    logger.info("Worker started")
+
+    try:
+        await stop.wait()
+    finally:
+        backfills.cancel()
+        shutdown_scheduler()
+        await browser_pool.shutdown()
+        await close_database_connection()
+        logger.info("Worker stopped")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())